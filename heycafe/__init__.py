@@ -5,41 +5,88 @@ A Python client for the Hey.Café social media platform REST API.
 Documentation: https://endpoint.hey.cafe
 """
 
-from heycafe.client import HeyCafeClient, encode_content
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from heycafe.exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
     HeyCafeError,
     RateLimitError,
     ValidationError,
 )
-from heycafe.hey_cafe import HeyCafe
-from heycafe.resources import (
-    AccountResource,
-    BotResource,
-    CafeResource,
-    ChatResource,
-    CommentResource,
-    ConversationResource,
-    ExploreResource,
-    FeedResource,
-    SearchResource,
-    StatsResource,
-    SystemResource,
-    TempResource,
-)
+
+if TYPE_CHECKING:
+    from heycafe.async_client import AsyncHeyCafeClient
+    from heycafe.cache import ResponseCache
+    from heycafe.client import HeyCafeClient, encode_content
+    from heycafe.hey_cafe import AsyncHeyCafe, HeyCafe
+    from heycafe.metrics import Metrics
+    from heycafe.models import Account, Cafe, Chat, ChatMessage, Comment, Conversation, Model
+    from heycafe.ratelimit import RateLimiter
+    from heycafe.resources import (
+        AccountResource,
+        BotResource,
+        CafeResource,
+        ChatResource,
+        CommentResource,
+        ConversationResource,
+        ExploreResource,
+        FeedResource,
+        SearchResource,
+        StatsResource,
+        SystemResource,
+        TempResource,
+    )
+    from heycafe.retry import CircuitBreaker, RetryPolicy
+    from heycafe.sqlite_cache import SQLiteCache
+    from heycafe.transport import (
+        HttpxTransport,
+        MockTransport,
+        RequestsTransport,
+        Transport,
+        Urllib3Transport,
+    )
+    from heycafe.writes import AsyncWritePipeline, Write, WritePipeline
 
 __version__ = "0.1.0"
 
 __all__ = [
     "HeyCafe",
     "HeyCafeClient",
+    "AsyncHeyCafe",
+    "AsyncHeyCafeClient",
     "encode_content",
+    "ResponseCache",
+    "SQLiteCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "Metrics",
+    "Transport",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "HttpxTransport",
+    "MockTransport",
+    "Write",
+    "WritePipeline",
+    "AsyncWritePipeline",
+    "Model",
+    "Account",
+    "Cafe",
+    "Conversation",
+    "Comment",
+    "Chat",
+    "ChatMessage",
     "HeyCafeError",
     "APIError",
     "AuthenticationError",
     "ValidationError",
     "RateLimitError",
+    "CircuitOpenError",
     "SystemResource",
     "AccountResource",
     "CafeResource",
@@ -53,3 +100,45 @@ __all__ = [
     "BotResource",
     "TempResource",
 ]
+
+# Everything except the exceptions is imported on first attribute access (PEP 562),
+# so `import heycafe` stays cheap for short-lived processes.
+_LAZY = {
+    "HeyCafe": "heycafe.hey_cafe",
+    "AsyncHeyCafe": "heycafe.hey_cafe",
+    "HeyCafeClient": "heycafe.client",
+    "encode_content": "heycafe.client",
+    "AsyncHeyCafeClient": "heycafe.async_client",
+    "ResponseCache": "heycafe.cache",
+    "SQLiteCache": "heycafe.sqlite_cache",
+    "RateLimiter": "heycafe.ratelimit",
+    "Metrics": "heycafe.metrics",
+    "RetryPolicy": "heycafe.retry",
+    "CircuitBreaker": "heycafe.retry",
+    "Transport": "heycafe.transport",
+    "RequestsTransport": "heycafe.transport",
+    "Urllib3Transport": "heycafe.transport",
+    "HttpxTransport": "heycafe.transport",
+    "MockTransport": "heycafe.transport",
+    "Write": "heycafe.writes",
+    "WritePipeline": "heycafe.writes",
+    "AsyncWritePipeline": "heycafe.writes",
+    **{
+        name: "heycafe.models"
+        for name in ("Model", "Account", "Cafe", "Conversation", "Comment", "Chat", "ChatMessage")
+    },
+    **{name: "heycafe.resources" for name in __all__ if name.endswith("Resource")},
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,523 @@
+"""Asyncio HTTP client for the Hey.Café API (requires the optional ``httpx`` dependency)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from heycafe.cache import CacheBackend, CacheKey
+from heycafe.client import DEFAULT_BASE_URL, BaseClient, BatchCall, _batch_kwargs
+from heycafe.jsonstream import DEFAULT_CHUNK_SIZE
+from heycafe.metrics import Metrics
+from heycafe.pool import PoolStats, httpx_pool_stats
+from heycafe.ratelimit import RateLimiter
+from heycafe.retry import CircuitBreaker, RetryPolicy
+from heycafe.singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+
+    from heycafe.models import Model
+    from heycafe.multipart import Progress, UploadFiles
+
+_T = TypeVar("_T")
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx
+    except ImportError as e:  # pragma: no cover - exercised only without the extra
+        raise ImportError(
+            "The async client requires httpx. Install it with: pip install 'heycafe[async]'"
+        ) from e
+    return httpx
+
+
+class AsyncHeyCafeClient(BaseClient):
+    """
+    Asyncio counterpart of :class:`~heycafe.client.HeyCafeClient`.
+
+    All requests go through a single ``httpx.AsyncClient``, so every task on the
+    event loop shares one connection pool. ``request``, ``get`` and ``post`` are
+    coroutines; errors are raised exactly as in the sync client.
+
+    Example:
+        async with AsyncHeyCafeClient() as client:
+            await client.get("get_system_hello")
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        api_key: str | None = None,
+        session_token: str | None = None,
+        error_boolean: bool = True,
+        error_no_http: bool = False,
+        timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        cache: CacheBackend | None = None,
+        coalesce: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_backend: str | None = None,
+        return_models: bool = False,
+        metrics: Metrics | None = None,
+    ):
+        """
+        Initialize the client.
+
+        :param base_url: API base URL (default: https://endpoint.hey.cafe)
+        :param api_key: Account API key for endpoints that require authentication
+        :param session_token: Optional session token for session-only endpoints
+        :param error_boolean: If True, request error_boolean=true so errors are booleans
+        :param error_no_http: If True, API keeps HTTP 200 on errors
+        :param timeout: Request timeout in seconds
+        :param http_client: Optional httpx.AsyncClient to use instead of creating one
+        :param max_connections: Pool size shared by all tasks (None for unlimited)
+        :param max_keepalive_connections: Idle connections kept open for reuse
+        :param keepalive_expiry: Seconds an idle connection is kept before closing it
+        :param http2: If True, multiplex concurrent requests over one HTTP/2 connection
+            per host (requires ``heycafe[http2]``)
+        :param cache: Optional response cache (ResponseCache, or SQLiteCache which is
+            called from a worker thread)
+        :param coalesce: If True, identical concurrent GETs share one in-flight request
+        :param rate_limiter: Optional RateLimiter pacing every request sent by this client
+        :param retry_policy: Optional RetryPolicy for transient failures of idempotent calls
+        :param circuit_breaker: Optional CircuitBreaker that fails fast while the API is down
+        :param json_backend: "orjson", "msgspec" or "json" (default: fastest installed)
+        :param return_models: If True, resource ``info`` calls and ``iter_*`` paginators
+            return heycafe.models instances instead of dicts
+        :param metrics: Optional Metrics collecting per-endpoint counts, errors,
+            latencies and bytes
+        """
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            session_token=session_token,
+            error_boolean=error_boolean,
+            error_no_http=error_no_http,
+            timeout=timeout,
+            cache=cache,
+            coalesce=coalesce,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            json_backend=json_backend,
+            return_models=return_models,
+            metrics=metrics,
+        )
+        self.singleflight = AsyncSingleFlight()
+        httpx_mod = _import_httpx()
+        self._transport_errors = (httpx_mod.TransportError,)
+        self.http2 = http2
+        self._max_connections = max_connections
+        if http_client is None:
+            try:
+                http_client = httpx_mod.AsyncClient(
+                    http2=http2,
+                    limits=httpx_mod.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                )
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 requires h2. Install it with: pip install 'heycafe[http2]'"
+                ) from e
+        self._http = http_client
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        use_api_key: bool = False,
+        use_session: bool = False,
+        use_cache: bool = True,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Perform an API request and return the parsed response.
+
+        Same arguments, return value and exceptions as ``HeyCafeClient.request``.
+        """
+        url, req_params, req_data = self._prepare(
+            endpoint, method, params, data, use_api_key, use_session
+        )
+        cache_key = self._cache_key(endpoint, method, params, use_session, use_cache)
+        conditional: dict[str, str] = {}
+        if cache_key is not None:
+            hit, value, conditional = await self._in_cache(self._cache_lookup, cache_key)
+            if hit:
+                return cast(dict[str, Any], value)
+        if headers:
+            conditional = {**headers, **conditional}
+
+        flight_key = self._flight_key(endpoint, method, req_params)
+        if flight_key is None:
+            return await self._fetch(
+                endpoint, method, url, req_params, req_data, cache_key, conditional
+            )
+        return await self.singleflight.do(
+            flight_key,
+            lambda: self._fetch(
+                endpoint, method, url, req_params, req_data, cache_key, conditional
+            ),
+        )
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        req_params: dict[str, str],
+        req_data: dict[str, str],
+        cache_key: CacheKey | None,
+        conditional: dict[str, str],
+    ) -> dict[str, Any]:
+        """Run attempts under the circuit breaker and retry policy."""
+        if self.retry_policy is None and self.circuit_breaker is None:
+            return await self._attempt(
+                endpoint, method, url, req_params, req_data, cache_key, conditional
+            )
+        if self.retry_policy is not None:
+            self.retry_policy.on_request()
+        attempt = 0
+        while True:
+            self._before_attempt()
+            attempt += 1
+            try:
+                result = await self._attempt(
+                    endpoint, method, url, req_params, req_data, cache_key, conditional
+                )
+            except Exception as e:
+                self._after_attempt(e)
+                delay = self._retry_delay(e, method, endpoint, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._abandon_attempt()
+                raise
+            self._after_attempt(None)
+            return result
+
+    async def _attempt(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        req_params: dict[str, str],
+        req_data: dict[str, str],
+        cache_key: CacheKey | None,
+        conditional: dict[str, str],
+    ) -> dict[str, Any]:
+        """Send the request, parse it and keep the cache up to date."""
+        try:
+            resp = await self._send(endpoint, method, url, req_params, req_data, conditional)
+            if cache_key is None:
+                return self._parse_response(resp, endpoint)
+            if resp.status_code == 304 and conditional:
+                cache = cast(CacheBackend, self.cache)
+                hit, value = await self._in_cache(cache.refresh, cache_key)
+                if hit:
+                    return cast(dict[str, Any], value)
+                resp = await self._send(endpoint, method, url, req_params, req_data)
+            result = self._parse_response(resp, endpoint)
+            await self._in_cache(self._cache_store, cache_key, resp, result)
+            return result
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+
+    async def _in_cache(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Call into the cache, in a worker thread if the backend blocks (e.g. SQLiteCache)."""
+        if cast(CacheBackend, self.cache).blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        extra_headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        headers = self._headers()
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        if method.upper() == "GET":
+            resp = await self._http.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        else:
+            resp = await self._http.post(
+                url,
+                params=params,
+                data=data if data else None,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        if self.metrics is not None:
+            self._record(endpoint, resp, started, len(resp.content))
+        self._observe(endpoint, resp)
+        return resp
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        use_api_key: bool = False,
+        use_session: bool = False,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """GET request to the given endpoint."""
+        return await self.request(
+            endpoint,
+            method="GET",
+            params=params,
+            use_api_key=use_api_key,
+            use_session=use_session,
+            use_cache=use_cache,
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        use_api_key: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """POST request to the given endpoint."""
+        return await self.request(
+            endpoint,
+            method="POST",
+            params=params,
+            data=data,
+            use_api_key=use_api_key,
+            headers=headers,
+        )
+
+    async def batch(self, calls: Iterable[BatchCall], max_concurrency: int = 64) -> list[Any]:
+        """
+        Run many requests concurrently, at most ``max_concurrency`` at a time.
+
+        Same call format and result semantics as ``HeyCafeClient.batch``: results
+        are in input order, with the exception in place of a failed call.
+        """
+        call_list = list(calls)
+        results: list[Any] = [None] * len(call_list)
+        async for index, result in self.batch_as_completed(call_list, max_concurrency):
+            results[index] = result
+        return results
+
+    async def batch_as_completed(
+        self, calls: Iterable[BatchCall], max_concurrency: int = 64
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Like batch(), but yield (index, response or exception) as each call finishes."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(index: int, kwargs: dict[str, Any]) -> tuple[int, Any]:
+            async with semaphore:
+                try:
+                    return index, await self.request(**kwargs)
+                except Exception as e:
+                    return index, e
+
+        tasks: list[asyncio.Future[tuple[int, Any]]] = []
+        try:
+            # Created inside the try, so a call list that fails to build partway
+            # does not leave the tasks scheduled so far running.
+            for index, call in enumerate(calls):
+                tasks.append(asyncio.ensure_future(run(index, _batch_kwargs(call))))
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Also reached when the caller stops iterating early.
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def map(
+        self,
+        endpoint: str,
+        param_list: Iterable[dict[str, Any] | None],
+        method: str = "GET",
+        max_concurrency: int = 64,
+        use_api_key: bool = False,
+        use_session: bool = False,
+    ) -> list[Any]:
+        """Call one endpoint with many parameter sets; see batch()."""
+        data_key = "params" if method.upper() == "GET" else "data"
+        return await self.batch(
+            (
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    data_key: params,
+                    "use_api_key": use_api_key,
+                    "use_session": use_session,
+                }
+                for params in param_list
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    async def stream(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        items_key: str | None = None,
+        use_api_key: bool = False,
+        use_session: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model: type[Model] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Async iterator over the items of a large list response as it downloads.
+
+        Same arguments and behaviour as ``HeyCafeClient.stream``.
+        """
+        url, req_params, _ = self._prepare(endpoint, "GET", params, None, use_api_key, use_session)
+        model = model if self.return_models else None
+        request = self._http.build_request(
+            "GET", url, params=req_params, headers=self._headers(), timeout=self.timeout
+        )
+        self._before_attempt()
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            started = time.perf_counter()
+            resp = await self._http.send(request, stream=True)
+        except Exception as e:
+            self._after_attempt(e)
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        except BaseException:
+            self._abandon_attempt()
+            raise
+        self._after_attempt(None)
+        self._observe(endpoint, resp)
+        size = 0
+        try:
+            status = resp.status_code
+            parser = self._item_parser(status, items_key)
+            if parser is None:
+                body = await resp.aread()
+                size = len(body)
+                for item in self._buffered_items(
+                    endpoint, status, resp.headers, body, items_key, model
+                ):
+                    yield item
+                return
+            async for chunk in resp.aiter_bytes(chunk_size):
+                size += len(chunk)
+                for item in self._parse_chunk(parser, chunk, endpoint, status, model):
+                    yield item
+            for item in self._parse_chunk(parser, None, endpoint, status, model):
+                yield item
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        finally:
+            await resp.aclose()
+            if self.metrics is not None:
+                self._record(endpoint, resp, started, size)
+
+    async def upload(
+        self,
+        endpoint: str,
+        files: UploadFiles,
+        data: dict[str, Any] | None = None,
+        use_api_key: bool = True,
+        progress: Progress | None = None,
+        chunk_size: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        POST files as a multipart body that is read while it is sent.
+
+        Same arguments and behaviour as ``HeyCafeClient.upload``.
+        """
+        from heycafe.multipart import DEFAULT_UPLOAD_CHUNK_SIZE, MultipartBody
+
+        url, req_params, req_data = self._prepare(endpoint, "POST", None, data, use_api_key, False)
+        body = MultipartBody(
+            req_data, files, chunk_size=chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE, progress=progress
+        )
+        headers = {
+            **self._headers(),
+            "Content-Type": body.content_type,
+            "Content-Length": str(len(body)),
+        }
+        self._before_attempt()
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            started = time.perf_counter()
+            # An async iterator, so httpx streams it on the event loop.
+            resp = await self._http.post(
+                url,
+                params=req_params,
+                content=body.__aiter__(),
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            self._after_attempt(e)
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        except BaseException:
+            self._abandon_attempt()
+            raise
+        self._after_attempt(None)
+        if self.metrics is not None:
+            self._record(endpoint, resp, started, len(resp.content))
+        self._observe(endpoint, resp)
+        return self._parse_upload(resp, endpoint)
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection-pool utilisation per host."""
+        return httpx_pool_stats(self._http, self._max_connections, self.http2)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncHeyCafeClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
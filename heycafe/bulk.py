@@ -0,0 +1,155 @@
+"""
+Bulk social-graph actions: one action (follow, join, ...) applied to many targets.
+
+Targets already in the wanted state are skipped. That state, e.g. the
+accounts being followed, is loaded with one list crawl, which the client's
+response cache serves if it has a TTL for that endpoint. Then the remaining
+actions run concurrently through the client's batch(), so the rate limiter,
+retries and circuit breaker apply to each one. Endpoints whose lists the
+actions change are dropped from the response cache afterwards.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from heycafe.pagination import extract_items
+
+#: Loads the items (or a list response holding them) whose ids and aliases are
+#: the targets currently in the wanted state; awaitable with the async client.
+StateLoader = Callable[[], Any]
+
+
+@dataclass
+class BulkResult:
+    """Per-target outcome of a bulk action."""
+
+    #: Endpoint of the action, e.g. post_account_follow
+    action: str
+    #: Target -> response, for targets the action was sent for and succeeded
+    done: dict[str, Any] = field(default_factory=dict)
+    #: Targets already in the wanted state; nothing was sent for them
+    skipped: list[str] = field(default_factory=list)
+    #: Target -> exception, for targets whose request failed
+    failed: dict[str, BaseException] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if no request failed."""
+        return not self.failed
+
+    def summary(self) -> dict[str, int]:
+        """Number of targets done, skipped and failed."""
+        return {"done": len(self.done), "skipped": len(self.skipped), "failed": len(self.failed)}
+
+
+def member_keys(items: Iterable[Any]) -> set[str]:
+    """Lower-cased ids and aliases of the accounts or cafés in ``items``."""
+    keys: set[str] = set()
+    for item in items:
+        if not hasattr(item, "get"):
+            continue
+        for name in ("id", "alias"):
+            value = item.get(name)
+            if value:
+                keys.add(str(value).lower())
+    return keys
+
+
+def bulk_action(
+    client: Any,
+    endpoint: str,
+    targets: Iterable[str],
+    wanted: bool,
+    current: Iterable[str] | None = None,
+    load_current: StateLoader | None = None,
+    invalidate: Iterable[str] = (),
+    max_workers: int = 8,
+) -> Any:
+    """
+    POST ``endpoint`` with ``{"query": target}`` for every target not already in the wanted state.
+
+    :param client: Sync or async low-level client; with the async client this
+        returns an awaitable
+    :param targets: Ids or aliases; duplicates are sent once
+    :param wanted: True if the action puts targets into ``current`` (follow,
+        join), False if it takes them out (unfollow)
+    :param current: Ids and aliases currently in the state, if known
+    :param load_current: Loads the state when ``current`` is not given
+        (default: no state check, every target is sent)
+    :param invalidate: Endpoints to drop from the response cache after any success
+    :param max_workers: Maximum concurrent requests
+    :return: BulkResult
+    """
+    unique = list(dict.fromkeys(targets))
+    if getattr(client, "is_async", False):
+        return _bulk_async(
+            client, endpoint, unique, wanted, current, load_current, invalidate, max_workers
+        )
+    if current is None and load_current is not None:
+        current = member_keys(extract_items(load_current()))
+    result, todo = _plan(endpoint, unique, wanted, current)
+    responses = client.batch(_calls(endpoint, todo), max_workers=max_workers)
+    return _collect(client, result, todo, responses, invalidate)
+
+
+async def _bulk_async(
+    client: Any,
+    endpoint: str,
+    targets: list[str],
+    wanted: bool,
+    current: Iterable[str] | None,
+    load_current: StateLoader | None,
+    invalidate: Iterable[str],
+    max_workers: int,
+) -> BulkResult:
+    if current is None and load_current is not None:
+        loaded: Awaitable[Any] = load_current()
+        current = member_keys(extract_items(await loaded))
+    result, todo = _plan(endpoint, targets, wanted, current)
+    responses = await client.batch(_calls(endpoint, todo), max_concurrency=max_workers)
+    return _collect(client, result, todo, responses, invalidate)
+
+
+def _plan(
+    endpoint: str, targets: list[str], wanted: bool, current: Iterable[str] | None
+) -> tuple[BulkResult, list[str]]:
+    """Split targets into the skipped ones (recorded in the result) and those to send."""
+    result = BulkResult(endpoint)
+    if current is None:
+        return result, targets
+    state = {str(key).lower() for key in current}
+    todo = []
+    for target in targets:
+        if (target.lower() in state) == wanted:
+            result.skipped.append(target)
+        else:
+            todo.append(target)
+    return result, todo
+
+
+def _calls(endpoint: str, targets: list[str]) -> list[dict[str, Any]]:
+    return [
+        {"endpoint": endpoint, "method": "POST", "data": {"query": t}, "use_api_key": True}
+        for t in targets
+    ]
+
+
+def _collect(
+    client: Any,
+    result: BulkResult,
+    targets: list[str],
+    responses: list[Any],
+    invalidate: Iterable[str],
+) -> BulkResult:
+    for target, response in zip(targets, responses):
+        if isinstance(response, BaseException):
+            result.failed[target] = response
+        else:
+            result.done[target] = response
+    if result.done:
+        for name in invalidate:
+            client.invalidate_cache(name)
+    return result
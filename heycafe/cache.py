@@ -0,0 +1,238 @@
+"""Response caches for idempotent GET endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+#: Seconds to cache each endpoint for by default. Endpoints not listed are never cached
+#: unless the cache is given a ``default_ttl``.
+DEFAULT_TTLS: dict[str, float] = {
+    "get_account_info": 60.0,
+    "get_cafe_info": 60.0,
+    "get_conversation_info": 30.0,
+    "get_comment_info": 30.0,
+    "get_system_reactions": 3600.0,
+    "get_system_emoji_category": 3600.0,
+    "get_system_emoji_search": 3600.0,
+    "get_system_emoji_lookup": 3600.0,
+}
+
+#: Cache key: (endpoint, sorted serialized params, auth identity).
+CacheKey = tuple[str, tuple[tuple[str, str], ...], str]
+
+
+def auth_identity(api_key: str | None, session_token: str | None) -> str:
+    """Stable, non-reversible identity for the credentials a response was fetched with."""
+    if not api_key and not session_token:
+        return "anonymous"
+    raw = f"{api_key or ''}\0{session_token or ''}".encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def make_key(endpoint: str, params: dict[str, str] | None, identity: str) -> CacheKey:
+    return (endpoint, tuple(sorted((params or {}).items())), identity)
+
+
+@dataclass
+class CacheStats:
+    """Counters for a ResponseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by response caches.
+
+    ``get``/``set`` store parsed responses. Backends that keep expired entries
+    can return conditional request headers from ``validators`` and extend an
+    entry with ``refresh`` when the server answers 304 Not Modified.
+    """
+
+    ttls: dict[str, float]
+    default_ttl: float | None
+    #: Whether calls do blocking I/O; AsyncHeyCafeClient then runs them in a worker thread
+    blocking: bool = False
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        """TTL for an endpoint, or None if it is not cacheable."""
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        return ttl if ttl else None
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (hit, value) for a fresh entry."""
+
+    @abstractmethod
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        ttl: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a value; ``ttl`` defaults to the endpoint's TTL."""
+
+    def validators(self, key: CacheKey) -> dict[str, str]:
+        """Conditional request headers (If-None-Match / If-Modified-Since) for a stale entry."""
+        return {}
+
+    def refresh(self, key: CacheKey, ttl: float | None = None) -> tuple[bool, Any]:
+        """Mark a stale entry fresh again after a 304; return (hit, value)."""
+        return False, None
+
+    @abstractmethod
+    def invalidate(
+        self,
+        endpoint: str | None = None,
+        params: dict[str, Any] | None = None,
+        identity: str | None = None,
+    ) -> int:
+        """Drop matching entries; return the number removed."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters and the current size."""
+
+
+class ResponseCache(CacheBackend):
+    """
+    Thread-safe in-memory TTL + LRU cache of parsed responses.
+
+    Pass it to a client (``HeyCafeClient(cache=ResponseCache())``) to cache the
+    endpoints in ``ttls``. Only GET requests without a session are cached.
+    Cached values are shared between callers, so treat them as read-only.
+
+    Example:
+        cache = ResponseCache(maxsize=5000, ttls={"get_cafe_info": 300})
+        client = HeyCafe(cache=cache)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float | None = None,
+    ):
+        """
+        :param maxsize: Maximum number of entries; least recently used are evicted
+        :param ttls: Per-endpoint TTLs in seconds, merged over DEFAULT_TTLS
+            (a TTL of 0 disables caching for that endpoint)
+        :param default_ttl: TTL for GET endpoints not in ``ttls`` (None: don't cache them)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (hit, value); expired entries count as misses and are dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._entries[key]
+            self._misses += 1
+            return False, None
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        ttl: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a value; ``ttl`` defaults to the endpoint's TTL. Validators are ignored."""
+        ttl = self.ttl_for(key[0]) if ttl is None else ttl
+        if not ttl:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(
+        self,
+        endpoint: str | None = None,
+        params: dict[str, Any] | None = None,
+        identity: str | None = None,
+    ) -> int:
+        """
+        Drop matching entries; with no arguments the whole cache is cleared.
+
+        :param endpoint: Only entries for this endpoint
+        :param params: Only entries requested with exactly these params
+        :param identity: Only entries fetched with this auth identity
+        :return: Number of entries removed
+        """
+        wanted = None if params is None else params_key(params)
+        with self._lock:
+            doomed = [
+                key
+                for key in self._entries
+                if (endpoint is None or key[0] == endpoint)
+                and (wanted is None or key[1] == wanted)
+                and (identity is None or key[2] == identity)
+            ]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def params_key(params: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    """The params component of a CacheKey for unserialized params."""
+    return make_key("", _stringify(params), "")[1]
+
+
+def _stringify(params: dict[str, Any]) -> dict[str, str]:
+    # Local import: heycafe.client imports this module.
+    from heycafe.client import _serialize_params
+
+    return _serialize_params(params)
@@ -3,16 +3,426 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, cast
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Union, cast
+from urllib.parse import urlsplit
 
-import requests
+from heycafe.endpoints import Endpoint, EndpointRegistry
+from heycafe.exceptions import APIError, AuthenticationError, RateLimitError
+from heycafe.jsonlib import resolve as resolve_json
+from heycafe.jsonstream import DEFAULT_CHUNK_SIZE, ItemParser
+from heycafe.pool import DEFAULT_POOL_MAXSIZE
 
-from heycafe.exceptions import APIError, AuthenticationError
+# The HTTP libraries, transports, caches and multipart bodies are imported where
+# they are first needed (building a client, or using the feature), so importing
+# the package does not pay for requests and urllib3.
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import requests
+
+    from heycafe.cache import CacheBackend, CacheKey
+    from heycafe.metrics import Metrics
+    from heycafe.models import Model
+    from heycafe.multipart import Progress, UploadFiles
+    from heycafe.pool import PoolStats
+    from heycafe.ratelimit import RateLimiter
+    from heycafe.retry import CircuitBreaker, RetryPolicy
+    from heycafe.transport import Transport
 
 DEFAULT_BASE_URL = "https://endpoint.hey.cafe"
 
+#: One call in a batch: (endpoint,), (endpoint, method) or (endpoint, method, params),
+#: or a mapping of keyword arguments for request().
+BatchCall = Union[tuple, Mapping[str, Any]]
+
+
+class BaseClient:
+    """
+    Configuration and request/response handling shared by the sync and async clients.
+
+    Subclasses only implement the transport; URL building, auth checks and
+    error parsing live here so both clients behave identically.
+    """
+
+    #: True when request/get/post are coroutines.
+    is_async = False
+    #: Connection-level exceptions of the HTTP library, treated as transient.
+    _transport_errors: tuple[type[BaseException], ...] = ()
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        api_key: str | None = None,
+        session_token: str | None = None,
+        error_boolean: bool = True,
+        error_no_http: bool = False,
+        timeout: float = 30.0,
+        cache: CacheBackend | None = None,
+        coalesce: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_backend: str | None = None,
+        return_models: bool = False,
+        metrics: Metrics | None = None,
+    ):
+        self._base_url = base_url.rstrip("/")
+        self._api_key = api_key
+        self._session_token = session_token
+        self._error_boolean = error_boolean
+        self._error_no_http = error_no_http
+        self.endpoints = EndpointRegistry(self._build_endpoint)
+        self._refresh_prepared()
+        self.timeout = timeout
+        self.cache = cache
+        self.coalesce = coalesce
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.json_backend, self._loads = resolve_json(json_backend)
+        self.return_models = return_models
+        self.metrics = metrics
+
+    # Settings that request preparation depends on. Changing one rebuilds the
+    # prepared headers/params and drops the compiled endpoint descriptors.
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value.rstrip("/")
+        self._refresh_prepared()
+
+    @property
+    def api_key(self) -> str | None:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str | None) -> None:
+        self._api_key = value
+        self._refresh_prepared()
+
+    @property
+    def session_token(self) -> str | None:
+        return self._session_token
+
+    @session_token.setter
+    def session_token(self, value: str | None) -> None:
+        self._session_token = value
+        self._refresh_prepared()
+
+    @property
+    def error_boolean(self) -> bool:
+        return self._error_boolean
+
+    @error_boolean.setter
+    def error_boolean(self, value: bool) -> None:
+        self._error_boolean = value
+        self._refresh_prepared()
+
+    @property
+    def error_no_http(self) -> bool:
+        return self._error_no_http
+
+    @error_no_http.setter
+    def error_no_http(self, value: bool) -> None:
+        self._error_no_http = value
+        self._refresh_prepared()
+
+    def _refresh_prepared(self) -> None:
+        """Recompute everything derived from the settings above."""
+        self._host = urlsplit(self._base_url).netloc
+        from heycafe.cache import auth_identity
+
+        self._identity = auth_identity(self._api_key, self._session_token)
+        self._prepared_params = self._default_params()
+        self._prepared_headers = self._build_headers()
+        self.endpoints.clear()
+
+    def _build_endpoint(
+        self, name: str, method: str, use_api_key: bool, use_session: bool
+    ) -> Endpoint:
+        params = self._prepared_params
+        if use_session and self._session_token:
+            params = {**params, "query": self._session_token}
+        return Endpoint(
+            name=name,
+            method=method.upper(),
+            url=f"{self._base_url}/{name}",
+            use_api_key=use_api_key,
+            use_session=use_session,
+            authorized=not use_api_key
+            or bool(self._api_key)
+            or bool(use_session and self._session_token),
+            params=params,
+        )
+
+    def _default_params(self) -> dict[str, str]:
+        params: dict[str, str] = {}
+        if self.error_boolean:
+            params["error_boolean"] = "true"
+        if self.error_no_http:
+            params["error_no_http"] = "true"
+        return params
+
+    def _headers(self) -> dict[str, str]:
+        """Headers sent with every request. Shared: copy before modifying."""
+        return self._prepared_headers
+
+    def _build_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {"Accept": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _cache_key(
+        self,
+        endpoint: str,
+        method: str,
+        params: dict[str, Any] | None,
+        use_session: bool,
+        use_cache: bool,
+    ) -> CacheKey | None:
+        """Cache key for a request, or None if it must not be cached."""
+        if self.cache is None or not use_cache or use_session or method.upper() != "GET":
+            return None
+        if self.cache.ttl_for(endpoint) is None:
+            return None
+        from heycafe.cache import make_key
+
+        return make_key(endpoint, _serialize_params(params or {}), self._identity)
+
+    def _cache_lookup(self, key: CacheKey) -> tuple[bool, Any, dict[str, str]]:
+        """Return (hit, value, conditional headers to revalidate a stale entry)."""
+        cache = cast("CacheBackend", self.cache)
+        hit, value = cache.get(key)
+        if self.metrics is not None:
+            self.metrics.record_cache(key[0], hit)
+        if hit:
+            return True, value, {}
+        return False, None, cache.validators(key)
+
+    def _cache_store(self, key: CacheKey, response: Any, result: Any) -> None:
+        cast("CacheBackend", self.cache).set(
+            key,
+            result,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _observe(self, endpoint: str, response: Any) -> None:
+        """Report a response to the rate limiter."""
+        if self.rate_limiter is not None:
+            retry_after = None
+            if response.status_code == 429:
+                from heycafe.ratelimit import parse_retry_after
+
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.observe(endpoint, response.status_code, retry_after)
+
+    def _record(self, endpoint: str, response: Any, started: float, size: int) -> None:
+        """Report a response received ``started`` (perf_counter) ago to the metrics."""
+        seconds = time.perf_counter() - started
+        cast("Metrics", self.metrics).record_response(endpoint, response.status_code, seconds, size)
+
+    def _parse_upload(self, response: Any, endpoint: str) -> dict[str, Any]:
+        """_parse_response for requests outside _attempt, counting errors in the metrics."""
+        try:
+            return self._parse_response(response, endpoint)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+
+    def _before_attempt(self) -> None:
+        """Fail fast if the circuit breaker for our host is open."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(self._host)
+
+    def _after_attempt(self, exc: BaseException | None) -> None:
+        """Report an attempt's outcome to the circuit breaker."""
+        if self.circuit_breaker is None:
+            return
+        from heycafe.retry import is_transient
+
+        if exc is not None and is_transient(exc, self._transport_errors):
+            self.circuit_breaker.record_failure(self._host)
+        else:
+            self.circuit_breaker.record_success(self._host)
+
+    def _abandon_attempt(self) -> None:
+        """Tell the circuit breaker an attempt stopped without an outcome (cancelled)."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(self._host)
+
+    def _retry_delay(
+        self, exc: BaseException, method: str, endpoint: str, attempt: int
+    ) -> float | None:
+        """Seconds to wait before retrying after ``attempt`` failures, or None to raise."""
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.next_delay(
+            exc, method, endpoint, attempt, self._transport_errors
+        )
+        if delay is not None and self.metrics is not None:
+            self.metrics.record_retry(endpoint)
+        return delay
+
+    def _flight_key(
+        self, endpoint: str, method: str, req_params: dict[str, str]
+    ) -> tuple[str, tuple[tuple[str, str], ...], str] | None:
+        """Coalescing key for an idempotent request, or None if it must run on its own."""
+        if not self.coalesce or method.upper() != "GET":
+            return None
+        return (endpoint, tuple(sorted(req_params.items())), self._identity)
+
+    def invalidate_cache(
+        self, endpoint: str | None = None, params: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Drop cached responses fetched with this client's credentials.
+
+        :param endpoint: Only this endpoint (default: all endpoints)
+        :param params: Only the entry requested with exactly these params
+        :return: Number of entries removed
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(
+            endpoint, params, identity=self._identity
+        )
+
+    def _prepare(
+        self,
+        endpoint: str,
+        method: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        use_api_key: bool,
+        use_session: bool,
+    ) -> tuple[str, dict[str, str], dict[str, str]]:
+        """Validate auth and build (url, query params, form data) for a request."""
+        ep = self.endpoints.get(endpoint, method, use_api_key, use_session)
+        if not ep.authorized:
+            raise AuthenticationError(
+                "This endpoint requires an API key or session token. Set api_key or "
+                "session_token when creating the client."
+            )
+        # An explicit "query" param overrides the session token in ep.params;
+        # None values are dropped by _serialize_params, so the token then stays.
+        req_params = {**ep.params, **_serialize_params(params)} if params else {**ep.params}
+        # POST: some endpoints expect form data
+        req_data = _serialize_params(data) if data and ep.method != "GET" else {}
+        return ep.url, req_params, req_data
+
+    def _parse_response(self, response: Any, endpoint: str) -> dict[str, Any]:
+        """
+        Parse a response object exposing ``status_code``, ``headers`` and ``content``.
+
+        Works with ``requests.Response``, ``httpx.Response`` and transport Responses.
+        The raw body bytes go straight to the JSON backend, skipping text decoding.
+        """
+        if response.status_code == 429:
+            from heycafe.ratelimit import parse_retry_after
+
+            try:
+                body = self._loads(response.content)
+            except ValueError:
+                body = {}
+            if not isinstance(body, dict):
+                body = {}
+            raise RateLimitError(
+                body.get("system_api_error_message") or "Rate limited (HTTP 429)",
+                status_code=429,
+                response_data=body,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        try:
+            body = self._loads(response.content)
+        except ValueError:
+            raise APIError(
+                f"Invalid JSON response from {endpoint}",
+                status_code=response.status_code,
+            )
+
+        error = self._system_error(body, response.status_code)
+        if error is not None:
+            raise error
+
+        if response.status_code >= 400 and not self.error_no_http:
+            raise APIError(
+                body.get("system_api_error_message") or f"HTTP {response.status_code}",
+                status_code=response.status_code,
+                response_data=body,
+            )
+
+        if "response_data" in body:
+            return cast(dict[str, Any], body["response_data"])
+        return cast(dict[str, Any], body)
+
+    @staticmethod
+    def _system_error(body: dict[str, Any], status_code: int) -> APIError | None:
+        """The APIError for a body flagging ``system_api_error``, else None."""
+        error = body.get("system_api_error")
+        if error is True or (isinstance(error, str) and error.lower() in ("true", "1", "yes")):
+            msg = body.get("system_api_error_message") or str(error) or "API returned an error"
+            return APIError(msg, status_code=status_code, response_data=body)
+        return None
+
+    # Streaming: helpers shared by both clients' stream().
+
+    def _item_parser(self, status_code: int, items_key: str | None) -> ItemParser | None:
+        """Incremental parser for a streamed body, or None if it must be read whole."""
+        if status_code >= 400:
+            # Error bodies are small, and _parse_response knows how to map them.
+            return None
+
+        def check(envelope: dict[str, Any]) -> None:
+            error = self._system_error(envelope, status_code)
+            if error is not None:
+                raise error
 
-class HeyCafeClient:
+        return ItemParser(items_key, check)
+
+    def _parse_chunk(
+        self,
+        parser: ItemParser,
+        chunk: bytes | None,
+        endpoint: str,
+        status_code: int,
+        model: type[Model] | None,
+    ) -> list[Any]:
+        """Feed one chunk (None at the end of the body) and return the finished items."""
+        try:
+            items = parser.close() if chunk is None else parser.feed(chunk)
+        except ValueError as e:
+            raise APIError(f"Invalid JSON response from {endpoint}", status_code=status_code) from e
+        return items if model is None else cast(list[Any], model.from_data(items, self.json_backend))
+
+    def _buffered_items(
+        self,
+        endpoint: str,
+        status_code: int,
+        headers: Any,
+        content: bytes,
+        items_key: str | None,
+        model: type[Model] | None,
+    ) -> list[Any]:
+        """Items of a body read in full; raises the usual errors for error statuses."""
+        from heycafe.pagination import extract_items
+        from heycafe.transport import Response
+
+        result = self._parse_response(Response(status_code, content, headers), endpoint)
+        items = extract_items(result, items_key)
+        return items if model is None else cast(list[Any], model.from_data(items, self.json_backend))
+
+
+class HeyCafeClient(BaseClient):
     """
     Low-level client for the Hey.Café REST API.
 
@@ -29,6 +439,20 @@ class HeyCafeClient:
         error_no_http: bool = False,
         timeout: float = 30.0,
         session: requests.Session | None = None,
+        cache: CacheBackend | None = None,
+        coalesce: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_backend: str | None = None,
+        return_models: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        http2: bool = False,
+        keepalive_expiry: float | None = 5.0,
+        transport: Transport | None = None,
+        metrics: Metrics | None = None,
     ):
         """
         Initialize the client.
@@ -40,29 +464,67 @@ class HeyCafeClient:
         :param error_boolean: If True, request error_boolean=true so errors are booleans
         :param error_no_http: If True, API keeps HTTP 200 on errors
         :param timeout: Request timeout in seconds
-        :param session: Optional requests.Session for connection pooling
+        :param session: Optional requests.Session for the default transport; its adapters
+            are used as-is and the pool_* options are ignored
+        :param cache: Optional response cache (ResponseCache or SQLiteCache)
+        :param coalesce: If True, identical concurrent GETs share one in-flight request
+        :param rate_limiter: Optional RateLimiter pacing every request sent by this client
+        :param retry_policy: Optional RetryPolicy for transient failures of idempotent calls
+        :param circuit_breaker: Optional CircuitBreaker that fails fast while the API is down
+        :param json_backend: "orjson", "msgspec" or "json" (default: fastest installed)
+        :param return_models: If True, resource ``info`` calls and ``iter_*`` paginators
+            return heycafe.models instances instead of dicts
+        :param pool_connections: Number of hosts whose pools are kept
+        :param pool_maxsize: Connections kept alive per host; size it to your thread count
+        :param pool_block: If True, threads wait for a free connection when the pool is
+            exhausted instead of opening a connection that is discarded afterwards.
+            Not combinable with http2, whose httpx pool always waits.
+        :param http2: If True, send requests through httpx over one multiplexed HTTP/2
+            connection per host (requires ``heycafe[http2]``)
+        :param keepalive_expiry: Seconds an idle connection is kept before closing it.
+            Only applies with http2: the requests pool has no idle timeout, and keeps
+            a connection until the server closes it.
+        :param transport: Optional Transport (e.g. Urllib3Transport, MockTransport) that
+            replaces the requests-based default; session, pool_*, http2 and
+            keepalive_expiry are then ignored
+        :param metrics: Optional Metrics collecting per-endpoint counts, errors,
+            latencies and bytes
         """
-        self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.session_token = session_token
-        self.error_boolean = error_boolean
-        self.error_no_http = error_no_http
-        self.timeout = timeout
-        self._session = session or requests.Session()
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            session_token=session_token,
+            error_boolean=error_boolean,
+            error_no_http=error_no_http,
+            timeout=timeout,
+            cache=cache,
+            coalesce=coalesce,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            json_backend=json_backend,
+            return_models=return_models,
+            metrics=metrics,
+        )
+        if transport is None:
+            from heycafe.transport import HttpxTransport, RequestsTransport
 
-    def _default_params(self) -> dict[str, str]:
-        params: dict[str, str] = {}
-        if self.error_boolean:
-            params["error_boolean"] = "true"
-        if self.error_no_http:
-            params["error_no_http"] = "true"
-        return params
+            if http2 and pool_block:
+                raise ValueError(
+                    "pool_block cannot be combined with http2: the httpx pool always waits "
+                    "for a free connection"
+                )
+            if http2:
+                transport = HttpxTransport(
+                    http2=True, maxsize=pool_maxsize, keepalive_expiry=keepalive_expiry
+                )
+            else:
+                transport = RequestsTransport(session, pool_connections, pool_maxsize, pool_block)
+        from heycafe.singleflight import SingleFlight
 
-    def _headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {"Accept": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
+        self.transport = transport
+        self._transport_errors = transport.errors
+        self.singleflight = SingleFlight()
 
     def request(
         self,
@@ -72,6 +534,8 @@ class HeyCafeClient:
         data: dict[str, Any] | None = None,
         use_api_key: bool = False,
         use_session: bool = False,
+        use_cache: bool = True,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """
         Perform an API request and return the parsed response.
@@ -83,47 +547,264 @@ class HeyCafeClient:
         :param use_api_key: If True, require api_key to be set (sends Bearer header)
         :param use_session: If True, send session_token as query param when set;
             some endpoints (feed, notifications) require a session rather than API key
+        :param use_cache: If False, bypass the response cache for this call
+        :param headers: Extra HTTP headers for this request (e.g. Idempotency-Key)
         :return: response_data from the API (or full response if no response_data)
         :raises AuthenticationError: When use_api_key=True but no key is set
+        :raises RateLimitError: When the API answers HTTP 429 (see ``retry_after``)
         :raises APIError: When the API returns an error
         """
-        if use_api_key and not self.api_key and not (use_session and self.session_token):
-            raise AuthenticationError(
-                "This endpoint requires an API key or session token. Set api_key or "
-                "session_token when creating the client."
-            )
+        url, req_params, req_data = self._prepare(
+            endpoint, method, params, data, use_api_key, use_session
+        )
+        cache_key = self._cache_key(endpoint, method, params, use_session, use_cache)
+        conditional: dict[str, str] = {}
+        if cache_key is not None:
+            hit, value, conditional = self._cache_lookup(cache_key)
+            if hit:
+                return cast(dict[str, Any], value)
+        if headers:
+            conditional = {**headers, **conditional}
 
-        url = f"{self.base_url}/{endpoint}"
-        req_params = {**self._default_params()}
-        req_data: dict[str, Any] = {}
-
-        if use_session and self.session_token and (params or {}).get("query") is None:
-            req_params["query"] = self.session_token
-
-        if method.upper() == "GET":
-            if params:
-                req_params.update(_serialize_params(params))
-            resp = self._session.get(
-                url,
-                params=req_params,
-                headers=self._headers(),
-                timeout=self.timeout,
+        flight_key = self._flight_key(endpoint, method, req_params)
+        if flight_key is None:
+            return self._fetch(endpoint, method, url, req_params, req_data, cache_key, conditional)
+        return self.singleflight.do(
+            flight_key,
+            lambda: self._fetch(
+                endpoint, method, url, req_params, req_data, cache_key, conditional
+            ),
+        )
+
+    def _fetch(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        req_params: dict[str, str],
+        req_data: dict[str, str],
+        cache_key: CacheKey | None,
+        conditional: dict[str, str],
+    ) -> dict[str, Any]:
+        """Run attempts under the circuit breaker and retry policy."""
+        if self.retry_policy is None and self.circuit_breaker is None:
+            return self._attempt(
+                endpoint, method, url, req_params, req_data, cache_key, conditional
             )
+        if self.retry_policy is not None:
+            self.retry_policy.on_request()
+        attempt = 0
+        while True:
+            self._before_attempt()
+            attempt += 1
+            try:
+                result = self._attempt(
+                    endpoint, method, url, req_params, req_data, cache_key, conditional
+                )
+            except Exception as e:
+                self._after_attempt(e)
+                delay = self._retry_delay(e, method, endpoint, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                self._abandon_attempt()
+                raise
+            self._after_attempt(None)
+            return result
+
+    def _attempt(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        req_params: dict[str, str],
+        req_data: dict[str, str],
+        cache_key: CacheKey | None,
+        conditional: dict[str, str],
+    ) -> dict[str, Any]:
+        """Send the request, parse it and keep the cache up to date."""
+        try:
+            resp = self._send(endpoint, method, url, req_params, req_data, conditional)
+            if cache_key is None:
+                return self._parse_response(resp, endpoint)
+            if resp.status_code == 304 and conditional:
+                hit, value = cast("CacheBackend", self.cache).refresh(cache_key)
+                if hit:
+                    return cast(dict[str, Any], value)
+                # Entry was evicted meanwhile (e.g. by another process); fetch it in full.
+                resp = self._send(endpoint, method, url, req_params, req_data)
+            result = self._parse_response(resp, endpoint)
+            self._cache_store(cache_key, resp, result)
+            return result
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+
+    def _send(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        extra_headers: dict[str, str] | None = None,
+    ) -> Any:
+        headers = self._headers()
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        if self.metrics is None:
+            resp = self.transport.send(method.upper(), url, params, data, headers, self.timeout)
         else:
-            if params:
-                req_params.update(_serialize_params(params))
-            if data:
-                req_data = _serialize_params(data)
-            # POST: some endpoints expect form data
-            resp = self._session.post(
-                url,
-                params=req_params,
-                data=req_data if req_data else None,
-                headers=self._headers(),
-                timeout=self.timeout,
+            started = time.perf_counter()
+            resp = self.transport.send(method.upper(), url, params, data, headers, self.timeout)
+            self._record(endpoint, resp, started, len(resp.content))
+        self._observe(endpoint, resp)
+        return resp
+
+    def stream(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        items_key: str | None = None,
+        use_api_key: bool = False,
+        use_session: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model: type[Model] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Iterate the items of a large list response while its body is downloaded.
+
+        The body is never held in memory as a whole: items under response_data
+        are decoded and yielded one by one as their bytes arrive, so memory stays
+        flat and the first item is available early. The request is sent when
+        iteration starts. It bypasses the cache, coalescing and retries; the
+        rate limiter and circuit breaker still apply.
+
+        :param endpoint: Endpoint name (e.g. get_conversation_comments)
+        :param params: Query parameters
+        :param items_key: Key of the item list when response_data is an object
+            (default: its first list)
+        :param use_api_key: If True, require api_key to be set (sends Bearer header)
+        :param use_session: If True, send session_token as query param when set
+        :param chunk_size: Bytes read from the connection at a time
+        :param model: heycafe.models class to wrap items in when return_models is set
+        :raises APIError: On an HTTP or API error, or a malformed body. An API
+            error flagged after response_data is raised as soon as it arrives,
+            which may be after some items were yielded.
+        """
+        url, req_params, _ = self._prepare(endpoint, "GET", params, None, use_api_key, use_session)
+        model = model if self.return_models else None
+        self._before_attempt()
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            started = time.perf_counter()
+            resp = self.transport.stream(
+                "GET", url, req_params, {}, self._headers(), self.timeout, chunk_size
             )
+        except Exception as e:
+            self._after_attempt(e)
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        except BaseException:
+            self._abandon_attempt()
+            raise
+        self._after_attempt(None)
+        self._observe(endpoint, resp)
+        size = 0
+        try:
+            status = resp.status_code
+            parser = self._item_parser(status, items_key)
+            if parser is None:
+                body = resp.read()
+                size = len(body)
+                yield from self._buffered_items(
+                    endpoint, status, resp.headers, body, items_key, model
+                )
+                return
+            for chunk in resp.iter_bytes():
+                size += len(chunk)
+                yield from self._parse_chunk(parser, chunk, endpoint, status, model)
+            yield from self._parse_chunk(parser, None, endpoint, status, model)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        finally:
+            resp.close()
+            if self.metrics is not None:
+                self._record(endpoint, resp, started, size)
+
+    def upload(
+        self,
+        endpoint: str,
+        files: UploadFiles,
+        data: dict[str, Any] | None = None,
+        use_api_key: bool = True,
+        progress: Progress | None = None,
+        chunk_size: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        POST files as a multipart body that is read from disk while it is sent.
+
+        Memory use stays at about one chunk whatever the file sizes. Like
+        stream(), this bypasses the cache, coalescing and retries; the rate
+        limiter and circuit breaker still apply.
+
+        :param endpoint: Endpoint name (e.g. post_temp_file)
+        :param files: Field name -> path, binary file object, buffer (e.g. an
+            ``mmap``) or heycafe.multipart.FilePart; a FieldPart streams a
+            plain field instead
+        :param data: Form fields sent before the files
+        :param use_api_key: If True, require api_key to be set (sends Bearer header)
+        :param progress: Called with (bytes sent, total bytes) as the body is sent
+        :param chunk_size: Bytes read from a file at a time
+            (default: heycafe.multipart.DEFAULT_UPLOAD_CHUNK_SIZE)
+        """
+        from heycafe.multipart import DEFAULT_UPLOAD_CHUNK_SIZE, MultipartBody
+
+        url, req_params, req_data = self._prepare(endpoint, "POST", None, data, use_api_key, False)
+        body = MultipartBody(
+            req_data, files, chunk_size=chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE, progress=progress
+        )
+        headers = {
+            **self._headers(),
+            "Content-Type": body.content_type,
+            "Content-Length": str(len(body)),
+        }
+        self._before_attempt()
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            started = time.perf_counter()
+            resp = self.transport.upload("POST", url, req_params, body, headers, self.timeout)
+        except Exception as e:
+            self._after_attempt(e)
+            if self.metrics is not None:
+                self.metrics.record_error(endpoint, e)
+            raise
+        except BaseException:
+            self._abandon_attempt()
+            raise
+        self._after_attempt(None)
+        if self.metrics is not None:
+            self._record(endpoint, resp, started, len(resp.content))
+        self._observe(endpoint, resp)
+        return self._parse_upload(resp, endpoint)
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection-pool utilisation per host."""
+        return self.transport.pool_stats()
 
-        return self._parse_response(resp, endpoint)
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.transport.close()
 
     def get(
         self,
@@ -131,6 +812,7 @@ class HeyCafeClient:
         params: dict[str, Any] | None = None,
         use_api_key: bool = False,
         use_session: bool = False,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """GET request to the given endpoint."""
         return self.request(
@@ -139,6 +821,7 @@ class HeyCafeClient:
             params=params,
             use_api_key=use_api_key,
             use_session=use_session,
+            use_cache=use_cache,
         )
 
     def post(
@@ -147,6 +830,7 @@ class HeyCafeClient:
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         use_api_key: bool = False,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """POST request to the given endpoint."""
         return self.request(
@@ -155,41 +839,112 @@ class HeyCafeClient:
             params=params,
             data=data,
             use_api_key=use_api_key,
+            headers=headers,
         )
 
-    def _parse_response(self, response: requests.Response, endpoint: str) -> dict[str, Any]:
+    def batch(self, calls: Iterable[BatchCall], max_workers: int = 8) -> list[Any]:
+        """
+        Run many requests on a bounded thread pool.
+
+        Each call is (endpoint, method, params) (method and params optional) or a
+        dict of request() keyword arguments. Calls go through request(), so
+        client-wide limits apply to each of them.
+
+        :return: One entry per call, in input order: the response, or the exception
+            that call raised (a failing call does not affect the others)
+        """
+        call_list = list(calls)
+        results: list[Any] = [None] * len(call_list)
+        for index, result in self.batch_as_completed(call_list, max_workers=max_workers):
+            results[index] = result
+        return results
+
+    def batch_as_completed(
+        self, calls: Iterable[BatchCall], max_workers: int = 8
+    ) -> Iterator[tuple[int, Any]]:
+        """
+        Like batch(), but yield (index, response or exception) as each call finishes.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        kwargs_list = [_batch_kwargs(call) for call in calls]
+        if not kwargs_list:
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(kwargs_list))),
+            thread_name_prefix="heycafe-batch",
+        )
+        futures: dict[Future[Any], int] = {}
         try:
-            body = response.json()
-        except ValueError:
-            raise APIError(
-                f"Invalid JSON response from {endpoint}",
-                status_code=response.status_code,
-            )
+            for index, kwargs in enumerate(kwargs_list):
+                futures[executor.submit(self._call_isolated, kwargs)] = index
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
+        finally:
+            for fut in futures:
+                fut.cancel()
+            executor.shutdown(wait=False)
 
-        error = body.get("system_api_error")
-        if error is True or (isinstance(error, str) and error.lower() in ("true", "1", "yes")):
-            msg = body.get("system_api_error_message") or str(error) or "API returned an error"
-            raise APIError(msg, status_code=response.status_code, response_data=body)
+    def map(
+        self,
+        endpoint: str,
+        param_list: Iterable[dict[str, Any] | None],
+        method: str = "GET",
+        max_workers: int = 8,
+        use_api_key: bool = False,
+        use_session: bool = False,
+    ) -> list[Any]:
+        """
+        Call one endpoint with many parameter sets; see batch().
 
-        if response.status_code >= 400 and not self.error_no_http:
-            raise APIError(
-                body.get("system_api_error_message") or f"HTTP {response.status_code}",
-                status_code=response.status_code,
-                response_data=body,
-            )
+        Example:
+            infos = client.map("get_account_info", [{"query": a} for a in aliases])
+        """
+        data_key = "params" if method.upper() == "GET" else "data"
+        return self.batch(
+            (
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    data_key: params,
+                    "use_api_key": use_api_key,
+                    "use_session": use_session,
+                }
+                for params in param_list
+            ),
+            max_workers=max_workers,
+        )
 
-        if "response_data" in body:
-            return cast(dict[str, Any], body["response_data"])
-        return cast(dict[str, Any], body)
+    def _call_isolated(self, kwargs: dict[str, Any]) -> Any:
+        try:
+            return self.request(**kwargs)
+        except Exception as e:
+            return e
+
+
+def _batch_kwargs(call: BatchCall) -> dict[str, Any]:
+    """Normalize a BatchCall to keyword arguments for request()."""
+    if isinstance(call, Mapping):
+        return dict(call)
+    if not 1 <= len(call) <= 3:
+        raise ValueError(f"Batch call must be (endpoint[, method[, params]]), got {call!r}")
+    kwargs: dict[str, Any] = {"endpoint": call[0]}
+    if len(call) > 1:
+        kwargs["method"] = call[1]
+    if len(call) > 2:
+        kwargs["params"] = call[2]
+    return kwargs
 
 
 def _serialize_params(params: dict[str, Any]) -> dict[str, str]:
     """Convert params to string values for query/body."""
     out: dict[str, str] = {}
     for k, v in params.items():
-        if v is None:
+        if type(v) is str:  # by far the most common case
+            out[k] = v
+        elif v is None:
             continue
-        if isinstance(v, bool):
+        elif isinstance(v, bool):
             out[k] = "true" if v else "false"
         elif isinstance(v, (list, tuple)):
             out[k] = ",".join(str(x) for x in v)
@@ -199,5 +954,10 @@ def _serialize_params(params: dict[str, Any]) -> dict[str, str]:
 
 
 def encode_content(text: str) -> str:
-    """Base64-encode content for endpoints that require it (e.g. conversation content)."""
+    """
+    Base64-encode content for endpoints that require it (e.g. conversation content).
+
+    For multi-megabyte content, heycafe.multipart.FieldPart(text, base64=True)
+    streams the same encoding without building it in memory.
+    """
     return base64.b64encode(text.encode("utf-8")).decode("ascii")
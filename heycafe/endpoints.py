@@ -0,0 +1,52 @@
+"""Precompiled endpoint descriptors used by the clients' request fast path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class Endpoint(NamedTuple):
+    """Everything about a call that does not change until the client's settings do."""
+
+    name: str
+    #: Upper-case HTTP method
+    method: str
+    url: str
+    use_api_key: bool
+    use_session: bool
+    #: False if the call needs credentials the client does not have
+    authorized: bool
+    #: Query params sent on every call: the error flags, plus the session token
+    #: for session calls. Treat as read-only; the client copies it per request.
+    params: dict[str, str]
+
+
+EndpointKey = tuple[str, str, bool, bool]
+
+
+class EndpointRegistry:
+    """
+    Cache of Endpoint descriptors keyed by (name, method, use_api_key, use_session).
+
+    Descriptors are built on first use by ``build``. ``clear`` drops them all;
+    clients call it whenever the base URL, credentials or error flags change.
+    """
+
+    def __init__(self, build: Callable[[str, str, bool, bool], Endpoint]):
+        self._build = build
+        self._endpoints: dict[EndpointKey, Endpoint] = {}
+
+    def get(self, name: str, method: str, use_api_key: bool, use_session: bool) -> Endpoint:
+        key = (name, method, use_api_key, use_session)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = self._build(*key)
+        return endpoint
+
+    def clear(self) -> None:
+        # Swap rather than clear() so a concurrent get() never sees a half-built dict.
+        self._endpoints = {}
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
@@ -37,7 +37,29 @@ class ValidationError(APIError):
     pass
 
 
+class CircuitOpenError(HeyCafeError):
+    """Raised without sending a request while the circuit breaker for a host is open."""
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        """
+        :param retry_in: Seconds until the breaker lets a probe request through
+        """
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
 class RateLimitError(APIError):
-    """Raised when rate limited by the API."""
+    """Raised when rate limited by the API (HTTP 429)."""
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        response_data: dict[str, Any] | None = None,
+        retry_after: float | None = None,
+    ):
+        """
+        :param retry_after: Seconds the server asked us to wait (from Retry-After), if given
+        """
+        super().__init__(message, status_code=status_code, response_data=response_data)
+        self.retry_after = retry_after
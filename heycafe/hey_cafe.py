@@ -3,119 +3,217 @@ High-level Hey.Café API client.
 
 Use this as the main entry point: instantiate HeyCafe with optional api_key,
 then use .system, .account, .cafe, etc. for typed access to endpoints.
+AsyncHeyCafe exposes the same resources on top of the asyncio client.
 """
 
 from __future__ import annotations
 
+from functools import cached_property
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
 from heycafe.client import HeyCafeClient
-from heycafe.resources import (
-    AccountResource,
-    BotResource,
-    CafeResource,
-    ChatResource,
-    CommentResource,
-    ConversationResource,
-    ExploreResource,
-    FeedResource,
-    SearchResource,
-    StatsResource,
-    SystemResource,
-    TempResource,
-)
-
-
-class HeyCafe:
-    """
-    High-level client for the Hey.Café API.
 
-    Example:
-        client = HeyCafe(api_key="your-key")
-        info = client.account.info("hey")
-        client.system.hello()
-        client.cafe.info("python")
+if TYPE_CHECKING:
+    from heycafe.async_client import AsyncHeyCafeClient
+    from heycafe.resources import (
+        AccountResource,
+        BotResource,
+        CafeResource,
+        ChatResource,
+        CommentResource,
+        ConversationResource,
+        ExploreResource,
+        FeedResource,
+        SearchResource,
+        StatsResource,
+        SystemResource,
+        TempResource,
+    )
+
+
+class _ResourceGroups:
+    """Resource accessors shared by HeyCafe and AsyncHeyCafe.
+
+    Resource methods return whatever the underlying client returns, so with the
+    async client every resource method returns an awaitable. Each resource
+    module is imported on first access and its instance is kept for reuse.
     """
 
-    def __init__(
-        self,
-        api_key: str | None = None,
-        base_url: str | None = None,
-        session_token: str | None = None,
-        **client_kwargs,
-    ):
-        """
-        :param api_key: Account API key for authenticated endpoints
-        :param base_url: Override API base URL (default: https://endpoint.hey.cafe)
-        :param session_token: Optional session token (e.g. from browser login) for
-            endpoints that require a session (feed, notifications)
-        :param client_kwargs: Additional arguments for HeyCafeClient (timeout, session, etc.)
-        """
-        client_kwargs["api_key"] = api_key
-        client_kwargs["session_token"] = session_token
-        if base_url is not None:
-            client_kwargs["base_url"] = base_url
-        self._client = HeyCafeClient(**client_kwargs)
-
-    @property
-    def client(self) -> HeyCafeClient:
-        """Low-level client for raw request/get/post calls."""
-        return self._client
+    _client: Any
 
-    @property
+    @cached_property
     def system(self) -> SystemResource:
         """System: hello, endpoints, emoji, reactions."""
+        from heycafe.resources.system import SystemResource
+
         return SystemResource(self._client)
 
-    @property
+    @cached_property
     def account(self) -> AccountResource:
         """Account: info, cafes, followers, follow, etc."""
+        from heycafe.resources.account import AccountResource
+
         return AccountResource(self._client)
 
-    @property
+    @cached_property
     def cafe(self) -> CafeResource:
         """Café: info, conversations, members, join, etc."""
+        from heycafe.resources.cafe import CafeResource
+
         return CafeResource(self._client)
 
-    @property
+    @cached_property
     def conversation(self) -> ConversationResource:
         """Conversation: info, comments, create, edit, publish."""
+        from heycafe.resources.conversation import ConversationResource
+
         return ConversationResource(self._client)
 
-    @property
+    @cached_property
     def comment(self) -> CommentResource:
         """Comment: info."""
+        from heycafe.resources.comment import CommentResource
+
         return CommentResource(self._client)
 
-    @property
+    @cached_property
     def chat(self) -> ChatResource:
         """Chat: list, info, messages, create, message_create, etc."""
+        from heycafe.resources.chat import ChatResource
+
         return ChatResource(self._client)
 
-    @property
+    @cached_property
     def explore(self) -> ExploreResource:
         """Explore: accounts, cafes, conversations, hot_conversations."""
+        from heycafe.resources.explore import ExploreResource
+
         return ExploreResource(self._client)
 
-    @property
+    @cached_property
     def feed(self) -> FeedResource:
         """Feed: conversations, tags."""
+        from heycafe.resources.feed import FeedResource
+
         return FeedResource(self._client)
 
-    @property
+    @cached_property
     def search(self) -> SearchResource:
         """Search: accounts, cafes, conversations."""
+        from heycafe.resources.search import SearchResource
+
         return SearchResource(self._client)
 
-    @property
+    @cached_property
     def stats(self) -> StatsResource:
         """Stats: platform statistics."""
+        from heycafe.resources.stats import StatsResource
+
         return StatsResource(self._client)
 
-    @property
+    @cached_property
     def bot(self) -> BotResource:
         """Bot: giphy_search, language_detect, website_meta, etc."""
+        from heycafe.resources.bot import BotResource
+
         return BotResource(self._client)
 
-    @property
+    @cached_property
     def temp(self) -> TempResource:
         """Temp: file upload, preview."""
+        from heycafe.resources.temp import TempResource
+
         return TempResource(self._client)
+
+
+class HeyCafe(_ResourceGroups):
+    """
+    High-level client for the Hey.Café API.
+
+    Example:
+        client = HeyCafe(api_key="your-key")
+        info = client.account.info("hey")
+        client.system.hello()
+        client.cafe.info("python")
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        session_token: str | None = None,
+        **client_kwargs,
+    ):
+        """
+        :param api_key: Account API key for authenticated endpoints
+        :param base_url: Override API base URL (default: https://endpoint.hey.cafe)
+        :param session_token: Optional session token (e.g. from browser login) for
+            endpoints that require a session (feed, notifications)
+        :param client_kwargs: Additional arguments for HeyCafeClient (timeout, session, etc.)
+        """
+        client_kwargs["api_key"] = api_key
+        client_kwargs["session_token"] = session_token
+        if base_url is not None:
+            client_kwargs["base_url"] = base_url
+        self._client = HeyCafeClient(**client_kwargs)
+
+    @property
+    def client(self) -> HeyCafeClient:
+        """Low-level client for raw request/get/post calls."""
+        return cast(HeyCafeClient, self._client)
+
+
+class AsyncHeyCafe(_ResourceGroups):
+    """
+    Asyncio high-level client for the Hey.Café API.
+
+    Same resources as HeyCafe; every resource method returns an awaitable.
+
+    Example:
+        async with AsyncHeyCafe(api_key="your-key") as client:
+            info = await client.account.info("hey")
+            await client.system.hello()
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        session_token: str | None = None,
+        **client_kwargs,
+    ):
+        """
+        :param api_key: Account API key for authenticated endpoints
+        :param base_url: Override API base URL (default: https://endpoint.hey.cafe)
+        :param session_token: Optional session token for endpoints that require a session
+        :param client_kwargs: Additional arguments for AsyncHeyCafeClient
+            (timeout, http_client, max_connections, etc.)
+        """
+        from heycafe.async_client import AsyncHeyCafeClient
+
+        client_kwargs["api_key"] = api_key
+        client_kwargs["session_token"] = session_token
+        if base_url is not None:
+            client_kwargs["base_url"] = base_url
+        self._client = AsyncHeyCafeClient(**client_kwargs)
+
+    @property
+    def client(self) -> AsyncHeyCafeClient:
+        """Low-level async client for raw request/get/post calls."""
+        return cast("AsyncHeyCafeClient", self._client)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncHeyCafe:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
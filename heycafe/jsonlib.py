@@ -0,0 +1,117 @@
+"""JSON backends: orjson or msgspec when installed, otherwise the stdlib."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, cast
+
+#: Decodes a JSON document from bytes; raises ValueError on malformed input.
+Loads = Callable[[bytes], Any]
+
+#: Encodes an object as compact UTF-8 JSON bytes.
+Dumps = Callable[[Any], bytes]
+
+#: Backends tried, in order, when none is requested explicitly.
+PREFERENCE: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+
+def _orjson() -> Loads:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Loads:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: bytes) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Callers expect json.loads' error type.
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def _stdlib() -> Loads:
+    return json.loads
+
+
+def _orjson_dumps() -> Dumps:
+    import orjson
+
+    return orjson.dumps
+
+
+def _msgspec_dumps() -> Dumps:
+    import msgspec
+
+    return cast(Dumps, msgspec.json.encode)
+
+
+def _stdlib_dumps() -> Dumps:
+    encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def dumps(obj: Any) -> bytes:
+        return encode(obj).encode()
+
+    return dumps
+
+
+BACKENDS: dict[str, Callable[[], Loads]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+ENCODERS: dict[str, Callable[[], Dumps]] = {
+    "orjson": _orjson_dumps,
+    "msgspec": _msgspec_dumps,
+    "json": _stdlib_dumps,
+}
+
+
+def _pick(table: dict[str, Callable[[], Any]], backend: str | None) -> tuple[str, Any]:
+    if backend is not None:
+        if backend not in table:
+            raise ValueError(f"Unknown JSON backend {backend!r}; expected one of {list(table)}")
+        return backend, table[backend]()
+    for name in PREFERENCE:
+        try:
+            return name, table[name]()
+        except ImportError:
+            continue
+    raise AssertionError("unreachable: the stdlib backend is always available")
+
+
+def resolve(backend: str | None = None) -> tuple[str, Loads]:
+    """
+    Return ``(name, loads)`` for a backend.
+
+    :param backend: "orjson", "msgspec" or "json"; None picks the first installed
+        backend from PREFERENCE
+    :raises ValueError: For an unknown backend name
+    :raises ImportError: If the requested backend is not installed
+    """
+    return _pick(BACKENDS, backend)
+
+
+def resolve_dumps(backend: str | None = None) -> tuple[str, Dumps]:
+    """Return ``(name, dumps)`` for a backend; same arguments and errors as :func:`resolve`."""
+    return _pick(ENCODERS, backend)
+
+
+def available() -> list[str]:
+    """Names of the installed backends, in preference order."""
+    names = []
+    for name in PREFERENCE:
+        try:
+            BACKENDS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
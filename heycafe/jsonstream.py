@@ -0,0 +1,327 @@
+"""
+Incremental parsing of API list responses.
+
+ItemParser is fed the body of a response chunk by chunk and hands back the
+items of the list under ``response_data`` as soon as each one is complete.
+Only the current chunk and the item being parsed are kept in memory, so peak
+memory does not grow with the size of the response. Every other key of the
+envelope (e.g. ``system_api_error``) is decoded as usual and collected in
+``envelope``.
+
+An item split over many chunks is scanned once: the scanner keeps its place
+(offset, nesting depth, string and escape state) between chunks, and the
+chunks are only joined when the item ends.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Generator, Iterable, Iterator
+from typing import Any
+
+#: Bytes read from the connection at a time when streaming a response.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+#: Characters an incomplete item (or other value) may hold before parsing fails.
+DEFAULT_MAX_ITEM_SIZE = 16 * 1024 * 1024
+
+#: Yielded by the parser's generators when the buffer runs out of text.
+_NEED = object()
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+# Where the scan of a value stops: inside a string, outside one, and after a
+# number or literal.
+_STRING_STOP = re.compile(r'["\\]')
+_VALUE_STOP = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r"[ \t\r\n,\]}]")
+
+_Steps = Generator[Any, None, Any]
+
+
+class ItemParser:
+    """
+    Push parser for a ``{"response_data": [...], ...}`` envelope.
+
+    ``response_data`` may be the list itself, or an object holding it under
+    ``items_key`` (default: its first list value, as with pagination). Its
+    other keys end up in ``response_data``; so does a ``response_data`` that
+    holds no list at all.
+
+    Values are decoded with the stdlib's C scanner rather than the client's
+    JSON backend, because it reports where each value ends: finding item
+    boundaries any other way would mean tokenizing the body in Python.
+
+    Example:
+        parser = ItemParser()
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(
+        self,
+        items_key: str | None = None,
+        check: Callable[[dict[str, Any]], None] | None = None,
+        max_item_size: int | None = DEFAULT_MAX_ITEM_SIZE,
+    ):
+        """
+        :param items_key: Key of the item list when response_data is an object
+        :param check: Called with ``envelope`` just before the first item and once
+            the document is complete; raise from it to abort (e.g. on an API error)
+        :param max_item_size: Characters one incomplete value may hold before
+            ValueError is raised (None: no limit)
+        """
+        self.items_key = items_key
+        self.check = check
+        self.max_item_size = max_item_size
+        self.envelope: dict[str, Any] = {}
+        self.response_data: Any = None
+        self.done = False
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._scan = json.JSONDecoder().raw_decode
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        # Scan state of a value that continues past the buffer; see _value_end().
+        self._parts: list[str] | None = None
+        self._held = 0
+        self._scalar = self._in_string = self._escape = False
+        self._depth = 0
+        self._steps = self._document()
+
+    def feed(self, data: bytes) -> list[Any]:
+        """
+        Add the next chunk of the body; return the items it completed.
+
+        :raises ValueError: If the document is malformed or an item exceeds max_item_size
+        """
+        self._append(self._decode(data))
+        return self._run()
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the body; return any remaining items.
+
+        :raises ValueError: If the document is malformed or truncated
+        """
+        self._append(self._decode(b"", True))
+        self._eof = True
+        items = self._run()
+        if not self.done:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _append(self, text: str) -> None:
+        if self._parts is not None:
+            # Inside a long value: collected as is, and joined once when it ends.
+            self._parts.append(text)
+            self._held += len(text)
+            return
+        # Text before _pos has been parsed already; keep only the unparsed tail.
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+
+    def _run(self) -> list[Any]:
+        items = []
+        for step in self._steps:
+            if step is _NEED:
+                break
+            items.append(step)
+        return items
+
+    # Each step below is a generator: it yields _NEED to wait for more text
+    # and returns its result, so callers use ``yield from``. Positions are only
+    # kept in self._pos, since feed() moves the buffer while a step waits.
+
+    def _more(self) -> _Steps:
+        if self._eof:
+            raise ValueError("Truncated JSON document")
+        yield _NEED
+
+    def _char(self) -> _Steps:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            yield from self._more()
+
+    def _expect(self, char: str) -> _Steps:
+        found = yield from self._char()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def _separator(self, close: str, first: bool) -> _Steps:
+        """Consume the comma before a member; return True at the closing bracket."""
+        char = yield from self._char()
+        if char == close:
+            self._pos += 1
+            return True
+        if not first:
+            yield from self._expect(",")
+        return False
+
+    def _value(self) -> _Steps:
+        """Decode one complete value of any type."""
+        yield from self._char()
+        try:
+            value, end = self._scan(self._buf, self._pos)
+        except ValueError:
+            # Usually the value continues in the next chunk.
+            if self._eof:
+                raise
+        else:
+            # A number or literal at the end of the buffer may continue too.
+            if end < len(self._buf) or self._eof:
+                self._pos = end
+                return value
+        # Rather than retrying the decode with every chunk, find the end first;
+        # malformed input also ends up here and fails in the decode below.
+        yield from self._value_end()
+        value, self._pos = self._scan(self._buf, self._pos)
+        return value
+
+    def _value_end(self) -> _Steps:
+        """
+        Find where the value at ``_pos`` ends, without decoding it.
+
+        A value that continues past the buffer moves into ``_parts``; each
+        later chunk is appended there and scanned on its own, from the saved
+        state, and the parts are joined into the buffer once the end is found.
+        """
+        buf, pos = self._buf, self._pos
+        opener = buf[pos]
+        self._scalar = opener not in '"[{'
+        self._in_string = opener == '"'
+        self._depth = int(opener in "[{")
+        self._escape = False
+        end = self._scan_text(buf, pos if self._scalar else pos + 1)
+        if end is not None:
+            return
+        text = buf[pos:]
+        self._parts, self._held = [text], len(text)
+        while end is None:
+            if self.max_item_size is not None and self._held > self.max_item_size:
+                raise ValueError(
+                    f"JSON value exceeds max_item_size ({self.max_item_size} characters)"
+                )
+            if self._eof and self._scalar:
+                # A number or literal may end with the body.
+                break
+            yield from self._more()
+            text = self._parts[-1]
+            end = self._scan_text(text, 0)
+        self._buf, self._pos = "".join(self._parts), 0
+        self._parts = None
+
+    def _scan_text(self, text: str, i: int) -> int | None:
+        """
+        Continue scanning the current value over ``text`` from ``i``.
+
+        Returns the offset just past the value, or None if it goes on past
+        ``text``; the depth, string and escape state are kept for the next call.
+        """
+        if self._scalar:
+            match = _SCALAR_END.search(text, i)
+            return None if match is None else match.start()
+        if self._escape and i < len(text):
+            # The previous text ended with a backslash; skip the escaped character.
+            self._escape = False
+            i += 1
+        while True:
+            if self._in_string:
+                match = _STRING_STOP.search(text, i)
+                if match is None:
+                    return None
+                i = match.end()
+                if match.group() == "\\":
+                    if i == len(text):
+                        self._escape = True
+                        return None
+                    i += 1
+                    continue
+                self._in_string = False
+                if not self._depth:
+                    return i
+            else:
+                match = _VALUE_STOP.search(text, i)
+                if match is None:
+                    return None
+                i = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in "[{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if not self._depth:
+                        return i
+
+    def _key(self) -> _Steps:
+        key = yield from self._value()
+        if not isinstance(key, str):
+            raise ValueError("Object keys must be strings")
+        yield from self._expect(":")
+        return key
+
+    def _document(self) -> _Steps:
+        yield from self._expect("{")
+        first = True
+        while not (yield from self._separator("}", first)):
+            first = False
+            key = yield from self._key()
+            if key == "response_data":
+                if self.check is not None:
+                    self.check(self.envelope)
+                yield from self._response_data()
+            else:
+                self.envelope[key] = yield from self._value()
+        if self.check is not None:
+            self.check(self.envelope)
+        self.done = True
+
+    def _response_data(self) -> _Steps:
+        char = yield from self._char()
+        if char == "[":
+            yield from self._items()
+            return
+        if char != "{":
+            self.response_data = yield from self._value()
+            return
+        self._pos += 1
+        self.response_data = {}
+        streamed, first = False, True
+        while not (yield from self._separator("}", first)):
+            first = False
+            key = yield from self._key()
+            char = yield from self._char()
+            if char == "[" and not streamed and (self.items_key is None or key == self.items_key):
+                streamed = True
+                yield from self._items()
+            else:
+                self.response_data[key] = yield from self._value()
+
+    def _items(self) -> _Steps:
+        yield from self._expect("[")
+        first = True
+        while not (yield from self._separator("]", first)):
+            first = False
+            yield (yield from self._value())
+
+
+def iter_items(
+    chunks: Iterable[bytes],
+    items_key: str | None = None,
+    check: Callable[[dict[str, Any]], None] | None = None,
+    max_item_size: int | None = DEFAULT_MAX_ITEM_SIZE,
+) -> Iterator[Any]:
+    """Yield the items of a response body delivered as ``chunks``; see ItemParser."""
+    parser = ItemParser(items_key, check, max_item_size)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,218 @@
+"""
+Per-endpoint request metrics with a Prometheus text exporter.
+
+A Metrics collector passed to a client records, for every endpoint: HTTP
+responses by status, failed attempts by exception class, a latency
+histogram, response bytes, cache hits and misses, and retries. Without one
+the client only pays for an ``is None`` check per hook.
+
+Example:
+    metrics = Metrics()
+    client = HeyCafe(metrics=metrics)
+    ...
+    metrics.snapshot()["get_account_info"].quantile(0.99)
+    print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+#: Upper bounds, in seconds, of the latency histogram buckets (Prometheus' defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters for one endpoint."""
+
+    #: HTTP responses received
+    requests: int = 0
+    #: Status code -> responses
+    statuses: dict[int, int] = field(default_factory=dict)
+    #: Exception class name -> failed attempts (transport and API errors)
+    errors: dict[str, int] = field(default_factory=dict)
+    #: Responses per latency bucket; the last entry counts those above every bound
+    latency_counts: list[int] = field(default_factory=list)
+    #: Total seconds spent waiting for responses
+    latency_sum: float = 0.0
+    #: Total response body bytes
+    bytes: int = 0
+    #: Calls answered from the response cache
+    cache_hits: int = 0
+    #: Cacheable calls that went to the network
+    cache_misses: int = 0
+    #: Attempts retried after a transient failure
+    retries: int = 0
+    #: Upper bounds of the latency buckets, in seconds
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency_sum / self.requests if self.requests else 0.0
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile from the histogram, as Prometheus'
+        histogram_quantile does: linearly within the bucket that holds it.
+
+        :param q: Quantile between 0 and 1
+        :return: Seconds; the largest bound if the quantile falls above all of them
+        """
+        total = sum(self.latency_counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, self.latency_counts):
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return self.buckets[-1]
+
+
+class Metrics:
+    """
+    Thread-safe collector of per-endpoint metrics, shared by every call of a client.
+
+    Latency is measured per HTTP exchange, from sending the request until its
+    response arrived (for stream(), until the body was read); rate-limiter waits
+    and retry backoff are not included.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        :param buckets: Increasing upper bounds, in seconds, of the latency histogram
+        """
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty increasing sequence")
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def _entry(self, endpoint: str) -> EndpointMetrics:
+        entry = self._endpoints.get(endpoint)
+        if entry is None:
+            entry = EndpointMetrics(
+                latency_counts=[0] * (len(self.buckets) + 1), buckets=self.buckets
+            )
+            self._endpoints[endpoint] = entry
+        return entry
+
+    def record_response(self, endpoint: str, status: int, seconds: float, size: int) -> None:
+        """Count one HTTP response of ``size`` body bytes that took ``seconds``."""
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            entry = self._entry(endpoint)
+            entry.requests += 1
+            entry.statuses[status] = entry.statuses.get(status, 0) + 1
+            entry.latency_counts[index] += 1
+            entry.latency_sum += seconds
+            entry.bytes += size
+
+    def record_error(self, endpoint: str, exc: BaseException) -> None:
+        """Count a failed attempt by the class of the exception it raised."""
+        name = type(exc).__name__
+        with self._lock:
+            errors = self._entry(endpoint).errors
+            errors[name] = errors.get(name, 0) + 1
+
+    def record_cache(self, endpoint: str, hit: bool) -> None:
+        """Count a response-cache lookup."""
+        with self._lock:
+            entry = self._entry(endpoint)
+            if hit:
+                entry.cache_hits += 1
+            else:
+                entry.cache_misses += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """Count a retried attempt."""
+        with self._lock:
+            self._entry(endpoint).retries += 1
+
+    def snapshot(self) -> dict[str, EndpointMetrics]:
+        """Copy of the counters, keyed by endpoint name."""
+        with self._lock:
+            return {
+                name: EndpointMetrics(
+                    requests=entry.requests,
+                    statuses=dict(entry.statuses),
+                    errors=dict(entry.errors),
+                    latency_counts=list(entry.latency_counts),
+                    latency_sum=entry.latency_sum,
+                    bytes=entry.bytes,
+                    cache_hits=entry.cache_hits,
+                    cache_misses=entry.cache_misses,
+                    retries=entry.retries,
+                    buckets=self.buckets,
+                )
+                for name, entry in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Drop all counters."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "heycafe") -> str:
+        """
+        The counters in the Prometheus text exposition format (version 0.0.4).
+
+        Serve it from a worker's metrics endpoint, e.g. with
+        ``prometheus_client``'s custom collectors or any HTTP handler, with
+        Content-Type ``text/plain; version=0.0.4``.
+
+        :param prefix: Prepended to every metric name
+        """
+        snapshot = sorted(self.snapshot().items())
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        metric = family("requests_total", "counter", "HTTP responses by endpoint and status.")
+        for endpoint, entry in snapshot:
+            for status, count in sorted(entry.statuses.items()):
+                lines.append(f'{metric}{{endpoint="{_label(endpoint)}",status="{status}"}} {count}')
+        metric = family("errors_total", "counter", "Failed attempts by endpoint and error class.")
+        for endpoint, entry in snapshot:
+            for error, count in sorted(entry.errors.items()):
+                lines.append(f'{metric}{{endpoint="{_label(endpoint)}",error="{error}"}} {count}')
+        metric = family("request_duration_seconds", "histogram", "Time from request to response.")
+        for endpoint, entry in snapshot:
+            label = f'endpoint="{_label(endpoint)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry.latency_counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {entry.requests}')
+            lines.append(f"{metric}_sum{{{label}}} {entry.latency_sum}")
+            lines.append(f"{metric}_count{{{label}}} {entry.requests}")
+        counters = (
+            ("response_bytes_total", "Response body bytes.", "bytes"),
+            ("cache_hits_total", "Calls answered from the response cache.", "cache_hits"),
+            ("cache_misses_total", "Cacheable calls sent to the API.", "cache_misses"),
+            ("retries_total", "Attempts retried after a transient failure.", "retries"),
+        )
+        for name, help_text, attr in counters:
+            metric = family(name, "counter", help_text)
+            for endpoint, entry in snapshot:
+                lines.append(f'{metric}{{endpoint="{_label(endpoint)}"}} {getattr(entry, attr)}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,208 @@
+"""
+Typed, slot-based models for the main API records.
+
+A model keeps the fields almost every caller reads (id, alias, name, ...) in
+``__slots__``. Everything else, including nested records such as a
+conversation's account or café, is packed into one compact JSON blob and only
+decoded the first time any of it is read. For large result sets this stores a
+record in a fraction of the memory of the equivalent dict.
+
+Models are opt-in: pass ``return_models=True`` to the client (or HeyCafe) and
+``info`` calls and ``iter_*`` paginators return models instead of dicts. The
+blob is packed and unpacked with the client's ``json_backend``.
+
+Example:
+    client = HeyCafe(return_models=True)
+    for conv in client.feed.iter_conversations(limit=1000):
+        print(conv.id, conv.account.alias)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, ClassVar, TypeVar
+
+from heycafe.jsonlib import resolve, resolve_dumps
+
+M = TypeVar("M", bound="Model")
+
+
+class _Codec:
+    """The loads/dumps pair of one JSON backend, shared by every model using it."""
+
+    __slots__ = ("name", "loads", "dumps")
+
+    def __init__(self, json_backend: str | None):
+        self.name, self.loads = resolve(json_backend)
+        self.dumps = resolve_dumps(self.name)[1]
+
+
+_CODECS: dict[str | None, _Codec] = {}
+
+
+def _codec(json_backend: str | None) -> _Codec:
+    codec = _CODECS.get(json_backend)
+    if codec is None:
+        codec = _CODECS[json_backend] = _Codec(json_backend)
+    return codec
+
+
+class Model:
+    """
+    Base class for API records.
+
+    Subclasses list their eagerly stored fields in ``__slots__``; missing ones
+    read as None. Other keys are readable as attributes too, decoded lazily.
+    Models also support ``model["key"]``, ``model.get(key)`` and ``to_dict()``.
+    """
+
+    __slots__ = ("_raw", "_extra", "_absent", "_codec")
+
+    #: Eagerly stored fields; filled in from ``__slots__`` for each subclass
+    _fields: ClassVar[tuple[str, ...]] = ()
+    #: Lazily decoded keys whose dict (or list of dicts) values become models
+    _nested: ClassVar[dict[str, type[Model]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields + tuple(cls.__dict__.get("__slots__", ()))
+
+    def __init__(self, data: Mapping[str, Any], json_backend: str | None = None):
+        """
+        :param data: The API record
+        :param json_backend: "orjson", "msgspec" or "json" for the packed fields
+            (default: fastest installed)
+        """
+        rest = dict(data)
+        absent = 0
+        for bit, name in enumerate(self._fields):
+            if name in rest:
+                setattr(self, name, rest.pop(name))
+            else:
+                setattr(self, name, None)
+                absent |= 1 << bit
+        # Remembered so to_dict() leaves out fields the API did not send.
+        self._absent = absent
+        self._codec = codec = _codec(json_backend)
+        self._raw = codec.dumps(rest) if rest else b""
+        self._extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_data(cls: type[M], data: Any, json_backend: str | None = None) -> Any:
+        """
+        Wrap a response: a dict becomes a model, a list has its dict items wrapped.
+
+        Anything else (None, scalars) is returned unchanged. ``json_backend`` is
+        passed to each model.
+        """
+        if isinstance(data, dict):
+            return cls(data, json_backend)
+        if isinstance(data, list):
+            return [cls(item, json_backend) if isinstance(item, dict) else item for item in data]
+        return data
+
+    def _decode(self) -> dict[str, Any]:
+        extra = self._extra
+        if extra is None:
+            codec = self._codec
+            extra = codec.loads(self._raw) if self._raw else {}
+            for key, model in self._nested.items():
+                if key in extra:
+                    extra[key] = model.from_data(extra[key], codec.name)
+            # The decoded dict replaces the blob, so decoding happens once.
+            self._extra, self._raw = extra, b""
+        return extra
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. for keys outside __slots__.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._decode()[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no field {name!r}") from None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        return self._decode()[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._fields:
+            return not self._absent & (1 << self._fields.index(key))
+        return key in self._decode()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict of every field, with nested models converted back to dicts."""
+        out = {
+            name: getattr(self, name)
+            for bit, name in enumerate(self._fields)
+            if not self._absent & (1 << bit)
+        }
+        for key, value in self._decode().items():
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, Model) else v for v in value]
+            out[key] = value
+        return out
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Model) or type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.to_dict(), self._codec.name)
+
+
+class Account(Model):
+    """A user account."""
+
+    __slots__ = ("id", "alias", "name", "avatar", "bio")
+
+
+class Cafe(Model):
+    """A café (community)."""
+
+    __slots__ = ("id", "alias", "name", "avatar", "bio")
+
+
+class Conversation(Model):
+    """A conversation (post); ``account`` and ``cafe`` decode to models on first access."""
+
+    __slots__ = ("id", "contents", "date_created")
+    _nested = {"account": Account, "cafe": Cafe}
+
+
+class Comment(Model):
+    """A comment on a conversation; ``account`` decodes to an Account on first access."""
+
+    __slots__ = ("id", "conversation", "contents", "date_created")
+    _nested = {"account": Account}
+
+
+class Chat(Model):
+    """A direct chat."""
+
+    __slots__ = ("id", "name", "date_created")
+    _nested = {"accounts": Account}
+
+
+class ChatMessage(Model):
+    """A message in a chat; ``account`` decodes to an Account on first access."""
+
+    __slots__ = ("id", "chat", "contents", "date_created")
+    _nested = {"account": Account}
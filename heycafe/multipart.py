@@ -0,0 +1,360 @@
+"""
+Streaming multipart/form-data bodies for file uploads.
+
+A MultipartBody knows its length before it is sent and yields its bytes a
+chunk at a time: the form fields, then each file read ``chunk_size`` bytes at
+a time from its path, file object or buffer (e.g. an ``mmap``). Sent with a
+Content-Length header, an upload therefore holds about one chunk in memory
+whatever the file size. The body can be iterated again, e.g. to resend it.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import mimetypes
+import mmap
+import os
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Union
+
+#: Bytes read from a file and handed to the connection at a time
+DEFAULT_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+#: A path, a binary file object positioned at the data, or a bytes-like buffer
+UploadSource = Union[str, "os.PathLike[str]", IO[bytes], bytes, bytearray, memoryview, mmap.mmap]
+
+#: A str, a bytes-like buffer, or a binary or text file object positioned at the data
+ContentSource = Union[str, bytes, bytearray, memoryview, mmap.mmap, IO[Any]]
+
+#: Field name -> file, as a mapping or (name, file) pairs to repeat a name
+UploadFiles = Union[Mapping[str, Any], Sequence[tuple[str, Any]]]
+
+#: Called with (bytes sent, total bytes) after each chunk of a body
+Progress = Callable[[int, int], None]
+
+_BUFFERS = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def _quote(value: str) -> str:
+    """Escape a name for a Content-Disposition header, as browsers do."""
+    return value.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+
+
+class FilePart:
+    """One file of a multipart body, read lazily from its source."""
+
+    __slots__ = ("source", "filename", "content_type", "size", "_start")
+
+    def __init__(
+        self,
+        source: UploadSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ):
+        """
+        :param source: Path, binary file object or bytes-like buffer such as an
+            ``mmap``. A file object is read from its current position and must
+            be seekable; it is not closed.
+        :param filename: Name sent for the file (default: the path's or file
+            object's base name, else "upload")
+        :param content_type: MIME type (default: guessed from the filename)
+        :raises TypeError: If ``source`` is none of the above
+        """
+        self.source = source
+        self._start = 0
+        name = ""
+        if isinstance(source, (str, os.PathLike)):
+            name = os.fspath(source)
+            self.size = os.path.getsize(name)
+        elif isinstance(source, _BUFFERS):
+            with memoryview(source) as view:
+                self.size = view.nbytes
+        elif hasattr(source, "read") and hasattr(source, "seek"):
+            name = getattr(source, "name", "")
+            self._start = source.tell()
+            self.size = source.seek(0, os.SEEK_END) - self._start
+            source.seek(self._start)
+        else:
+            raise TypeError(
+                f"Cannot upload {type(source).__name__}: expected a path, file or buffer"
+            )
+        base = os.path.basename(name) if isinstance(name, str) else ""
+        self.filename = filename or base or "upload"
+        self.content_type = (
+            content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        )
+
+    def chunks(self, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the file's bytes, at most ``chunk_size`` at a time."""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from self._read(f, chunk_size)
+        elif isinstance(source, _BUFFERS):
+            # Slicing a memoryview copies nothing; only the chunk handed out is copied.
+            with memoryview(source) as view, view.cast("B") as flat:
+                for start in range(0, self.size, chunk_size):
+                    yield bytes(flat[start : start + chunk_size])
+        else:
+            source.seek(self._start)
+            yield from self._read(source, chunk_size)
+
+    def _read(self, f: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+        remaining = self.size
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                raise ValueError(f"{self.filename} shrank while it was being uploaded")
+            remaining -= len(chunk)
+            yield chunk
+
+
+class FieldPart:
+    """
+    A form field whose value is streamed from a str, buffer or file object.
+
+    Text is sent as UTF-8. With ``base64=True`` the value is base64-encoded on
+    the fly, as ``encode_content`` does for short strings, without building
+    the whole UTF-8 text or its encoding.
+    """
+
+    __slots__ = ("source", "base64", "size", "_start")
+
+    #: Sent as a plain field: no filename and no Content-Type
+    filename = None
+    content_type = None
+
+    def __init__(self, source: ContentSource, base64: bool = False):
+        """
+        :param source: str, bytes-like buffer, or file object. A file object is
+            read from its current position and must be seekable; it is not
+            closed. Text read from it is encoded as UTF-8.
+        :param base64: If True, send the base64 encoding of the value
+        """
+        self.source = source
+        self.base64 = base64
+        self._start = 0 if isinstance(source, (str, *_BUFFERS)) else source.tell()
+        length = _byte_length(source, self._start)
+        self.size = 4 * ((length + 2) // 3) if base64 else length
+
+    def chunks(self, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the (encoded) value, about ``chunk_size`` bytes at a time."""
+        if not self.base64:
+            yield from _source_chunks(self.source, self._start, chunk_size)
+            return
+        # Every 3 bytes of input become 4 of output; leftovers carry over to the
+        # next chunk so that padding only ever appears at the very end.
+        carry = b""
+        for chunk in _source_chunks(self.source, self._start, max(3, chunk_size * 3 // 4)):
+            if carry:
+                chunk = carry + chunk
+            cut = len(chunk) - len(chunk) % 3
+            if cut:
+                with memoryview(chunk) as view:
+                    yield base64.b64encode(view[:cut])
+            carry = chunk[cut:]
+        if carry:
+            yield base64.b64encode(carry)
+
+
+def _source_chunks(source: ContentSource, start: int, chunk_size: int) -> Iterator[bytes]:
+    """Bytes of a str (as UTF-8), buffer or file object, about ``chunk_size`` at a time."""
+    if isinstance(source, str):
+        for offset in range(0, len(source), chunk_size):
+            yield source[offset : offset + chunk_size].encode("utf-8")
+    elif isinstance(source, _BUFFERS):
+        with memoryview(source) as view, view.cast("B") as flat:
+            for offset in range(0, flat.nbytes, chunk_size):
+                yield bytes(flat[offset : offset + chunk_size])
+    else:
+        source.seek(start)
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _byte_length(source: ContentSource, start: int) -> int:
+    """Length in bytes of what _source_chunks yields, without holding it all."""
+    if isinstance(source, str):
+        if source.isascii():
+            return len(source)
+    elif isinstance(source, _BUFFERS):
+        with memoryview(source) as view:
+            return view.nbytes
+    elif not isinstance(source, io.TextIOBase):
+        length = source.seek(0, os.SEEK_END) - start
+        source.seek(start)
+        return length
+    return sum(len(chunk) for chunk in _source_chunks(source, start, DEFAULT_UPLOAD_CHUNK_SIZE))
+
+
+class MultipartBody:
+    """
+    A multipart/form-data body of form fields and files, produced in chunks.
+
+    Fields given as FieldPart are streamed like files, after the plain fields.
+
+    Iterate it (or ``async for`` it) to get the bytes; ``len()`` is the exact
+    total, so it can be sent with Content-Length instead of being buffered.
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, str] | None = None,
+        files: UploadFiles = (),
+        boundary: str | None = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress: Progress | None = None,
+    ):
+        """
+        :param fields: Form fields sent before the files
+        :param files: Field name -> FilePart, FieldPart or upload source, as a
+            mapping or (name, part) pairs to send several files under one name
+        :param boundary: Part separator (default: random)
+        :param chunk_size: Bytes read from a file at a time
+        :param progress: Called with (bytes sent, total bytes) after each chunk
+        """
+        self.fields = dict(fields or {})
+        pairs = files.items() if isinstance(files, Mapping) else files
+        self.files = [
+            (name, part if isinstance(part, (FilePart, FieldPart)) else FilePart(part))
+            for name, part in pairs
+        ]
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._heads = [self._head(name, part) for name, part in self.files]
+        self._form = b"".join(self._field(name, str(value)) for name, value in self.fields.items())
+        self._tail = f"--{self.boundary}--\r\n".encode()
+        self._length = (
+            len(self._form)
+            + sum(len(head) + part.size + 2 for head, (_, part) in zip(self._heads, self.files))
+            + len(self._tail)
+        )
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value, including the boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _field(self, name: str, value: str) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+
+    def _head(self, name: str, part: FilePart | FieldPart) -> bytes:
+        if part.filename is None:
+            return (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            ).encode()
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; '
+            f'filename="{_quote(part.filename)}"\r\n'
+            f"Content-Type: {part.content_type}\r\n\r\n"
+        ).encode()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _chunks(self) -> Iterator[bytes]:
+        if self._form:
+            yield self._form
+        for head, (_, part) in zip(self._heads, self.files):
+            yield head
+            yield from part.chunks(self.chunk_size)
+            yield b"\r\n"
+        yield self._tail
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for chunk in self._chunks():
+            sent += len(chunk)
+            yield chunk
+            if self.progress is not None:
+                self.progress(sent, self._length)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Chunks are small, so each blocking file read only briefly holds the loop.
+        for chunk in self:
+            yield chunk
+
+
+def upload_many(
+    client: Any,
+    endpoint: str,
+    parts: Sequence[FilePart],
+    field: str = "file",
+    data: dict[str, Any] | None = None,
+    max_workers: int = 4,
+    progress: Callable[[int, int, int], None] | None = None,
+) -> Any:
+    """
+    Upload each file in its own request, several at a time.
+
+    :param client: Sync or async low-level client; with the async client this
+        returns an awaitable
+    :param parts: The files, one request each
+    :param field: Form field holding the file
+    :param data: Extra form fields sent with every file
+    :param max_workers: Maximum concurrent uploads
+    :param progress: Called with (file index, bytes sent, total bytes) as each
+        upload advances
+    :return: One entry per file, in input order: the response, or the exception
+        that upload raised (a failing upload does not affect the others)
+    """
+
+    def call(index: int) -> dict[str, Any]:
+        report = None
+        if progress is not None:
+
+            def report(sent: int, total: int) -> None:
+                progress(index, sent, total)
+
+        return {
+            "endpoint": endpoint,
+            "files": {field: parts[index]},
+            "data": data,
+            "progress": report,
+        }
+
+    if getattr(client, "is_async", False):
+        return _upload_many_async(client, [call(i) for i in range(len(parts))], max_workers)
+
+    def run(index: int) -> Any:
+        try:
+            return client.upload(**call(index))
+        except Exception as e:
+            return e
+
+    if not parts:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(parts))), thread_name_prefix="heycafe-upload"
+    ) as executor:
+        return list(executor.map(run, range(len(parts))))
+
+
+async def _upload_many_async(
+    client: Any, calls: list[dict[str, Any]], max_workers: int
+) -> list[Any]:
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run(kwargs: dict[str, Any]) -> Any:
+        async with semaphore:
+            try:
+                return await client.upload(**kwargs)
+            except Exception as e:
+                return e
+
+    return list(await asyncio.gather(*(run(kwargs) for kwargs in calls)))
@@ -0,0 +1,344 @@
+"""Auto-paginating iterators for start/count list endpoints."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from heycafe.models import Model
+
+DEFAULT_PAGE_SIZE = 20
+
+PageFetcher = Callable[[int, int], Any]
+AsyncPageFetcher = Callable[[int, int], Awaitable[Any]]
+ItemKey = Union[str, Callable[[Any], Any], None]
+
+
+def extract_items(page: Any, items_key: str | None = None) -> list[Any]:
+    """
+    Return the list of items in one page of a list response.
+
+    Pages are either a list, or a dict holding the list under ``items_key``.
+    Without ``items_key`` the first list value in the dict is used.
+    """
+    if isinstance(page, list):
+        return page
+    if not isinstance(page, dict):
+        return []
+    if items_key is not None:
+        items = page.get(items_key)
+        return items if isinstance(items, list) else []
+    for value in page.values():
+        if isinstance(value, list):
+            return value
+    return []
+
+
+class _PaginatorBase:
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: int = 0,
+        prefetch: int = 2,
+        items_key: str | None = None,
+        limit: int | None = None,
+        model: type[Model] | None = None,
+        json_backend: str | None = None,
+    ):
+        """
+        :param fetch_page: Called as fetch_page(start, count); returns one page
+        :param page_size: Items requested per page (sent as ``count``)
+        :param start: Offset of the first item
+        :param prefetch: Pages requested ahead of the consumer (0 disables read-ahead)
+        :param items_key: Key holding the item list in each page (default: first list)
+        :param limit: Stop after this many items
+        :param model: Optional heycafe.models class each dict item is wrapped in
+        :param json_backend: JSON backend the models pack their fields with
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.start = start
+        self.prefetch = prefetch
+        self.items_key = items_key
+        self.limit = limit
+        self.model = model
+        self.json_backend = json_backend
+
+    def _items(self, page: Any) -> list[Any]:
+        items = extract_items(page, self.items_key)
+        return items if self.model is None else self.model.from_data(items, self.json_backend)
+
+    def _offsets(self, start: int | None = None) -> Iterator[int]:
+        """Page offsets from ``start``, ending before the one past ``limit`` items."""
+        offset = self.start if start is None else start
+        end = None if self.limit is None else self.start + self.limit
+        while end is None or offset < end:
+            yield offset
+            offset += self.page_size
+
+    def _windows(self, total: int) -> list[int]:
+        """Offsets of the pages covering ``total`` items (capped by ``limit``)."""
+        if self.limit is not None:
+            total = min(total, self.limit)
+        return list(range(self.start, self.start + max(total, 0), self.page_size))
+
+    def _needs_tail(self, pages: list[list[Any]]) -> bool:
+        """True when ``total`` was an underestimate and more pages may follow."""
+        if not pages or len(pages[-1]) < self.page_size:
+            return False
+        return self.limit is None or sum(len(p) for p in pages) < self.limit
+
+    def _truncate(self, items: list[Any]) -> list[Any]:
+        return items if self.limit is None else items[: self.limit]
+
+
+def _dedupe(pages: list[list[Any]], key: ItemKey) -> list[Any]:
+    """
+    Concatenate pages in order, dropping repeats of an already-seen key.
+
+    Items inserted while a crawl is running shift later items to higher
+    offsets, so the same item can show up at the end of one window and the
+    start of the next. Items without a key are always kept.
+    """
+    out: list[Any] = []
+    seen: set[Any] = set()
+    for items in pages:
+        for item in items:
+            if key is None:
+                ident = None
+            elif callable(key):
+                ident = key(item)
+            else:
+                ident = item.get(key) if hasattr(item, "get") else None
+            if ident is not None:
+                if ident in seen:
+                    continue
+                seen.add(ident)
+            out.append(item)
+    return out
+
+
+class Paginator(_PaginatorBase):
+    """
+    Lazily iterate every item of a start/count endpoint.
+
+    Up to ``prefetch`` following pages are fetched on background threads while
+    the consumer processes the current one. Iteration stops on the first short
+    or empty page, or once ``limit`` items have been yielded; pages starting at
+    or past ``start + limit`` are never requested.
+
+    Example:
+        for conv in client.feed.iter_conversations(page_size=50, prefetch=3):
+            ...
+    """
+
+    fetch_page: PageFetcher
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterate()
+
+    def pages(self) -> Iterator[list[Any]]:
+        """Iterate page by page instead of item by item."""
+        offsets = self._offsets()
+        if self.prefetch == 0:
+            for offset in offsets:
+                items = self._items(self.fetch_page(offset, self.page_size))
+                if items:
+                    yield items
+                if len(items) < self.page_size:
+                    return
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.prefetch, thread_name_prefix="heycafe-prefetch"
+        )
+        pending: deque[Future[Any]] = deque()
+        try:
+            # Current page plus `prefetch` pages of read-ahead.
+            for offset in islice(offsets, self.prefetch + 1):
+                pending.append(executor.submit(self.fetch_page, offset, self.page_size))
+            while pending:
+                items = self._items(pending.popleft().result())
+                if items:
+                    yield items
+                if len(items) < self.page_size:
+                    return
+                for offset in islice(offsets, 1):
+                    pending.append(executor.submit(self.fetch_page, offset, self.page_size))
+        finally:
+            for fut in pending:
+                fut.cancel()
+            executor.shutdown(wait=False)
+
+    def fetch_all(
+        self, total: int | None = None, max_workers: int = 4, key: ItemKey = "id"
+    ) -> list[Any]:
+        """
+        Fetch every item, splitting the offset range into concurrent page windows.
+
+        :param total: Expected item count (e.g. from stats or a café's member count).
+            Pages covering it are fetched in parallel; if the last one is full, the
+            remainder is fetched sequentially. When None, pages are read sequentially.
+        :param max_workers: Maximum concurrent page requests
+        :param key: Item field (or callable) used to drop duplicates at window edges
+        :return: Items in offset order
+        """
+        if total is None:
+            return self._truncate(_dedupe(list(self.pages()), key))
+
+        windows = self._windows(total)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(windows) or 1)),
+            thread_name_prefix="heycafe-bulk",
+        ) as executor:
+            futures = [executor.submit(self.fetch_page, o, self.page_size) for o in windows]
+            pages = [self._items(f.result()) for f in futures]
+
+        if self._needs_tail(pages):
+            for offset in self._offsets(windows[-1] + self.page_size):
+                items = self._items(self.fetch_page(offset, self.page_size))
+                pages.append(items)
+                if not self._needs_tail(pages):
+                    break
+        return self._truncate(_dedupe(pages, key))
+
+    def _iterate(self) -> Iterator[Any]:
+        remaining = self.limit
+        for items in self.pages():
+            for item in items:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+            if remaining is not None and remaining <= 0:
+                return
+
+
+class AsyncPaginator(_PaginatorBase):
+    """
+    Async counterpart of :class:`Paginator`; read-ahead pages run as tasks.
+
+    Example:
+        async for conv in client.feed.iter_conversations(page_size=50):
+            ...
+    """
+
+    fetch_page: AsyncPageFetcher
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def pages(self) -> AsyncIterator[list[Any]]:
+        """Iterate page by page instead of item by item."""
+        import asyncio
+
+        offsets = self._offsets()
+        pending: deque[asyncio.Future[Any]] = deque()
+
+        def schedule(count: int) -> None:
+            for offset in islice(offsets, count):
+                pending.append(asyncio.ensure_future(self.fetch_page(offset, self.page_size)))
+
+        try:
+            schedule(self.prefetch + 1)
+            while pending:
+                items = self._items(await pending.popleft())
+                if items:
+                    yield items
+                if len(items) < self.page_size:
+                    return
+                schedule(1)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_all(
+        self, total: int | None = None, max_workers: int = 4, key: ItemKey = "id"
+    ) -> list[Any]:
+        """Async counterpart of :meth:`Paginator.fetch_all`."""
+        import asyncio
+
+        if total is None:
+            return self._truncate(_dedupe([p async for p in self.pages()], key))
+
+        windows = self._windows(total)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(offset: int) -> list[Any]:
+            async with semaphore:
+                return self._items(await self.fetch_page(offset, self.page_size))
+
+        pages = list(await asyncio.gather(*(fetch(o) for o in windows)))
+        if self._needs_tail(pages):
+            for offset in self._offsets(windows[-1] + self.page_size):
+                pages.append(await fetch(offset))
+                if not self._needs_tail(pages):
+                    break
+        return self._truncate(_dedupe(pages, key))
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        remaining = self.limit
+        async for items in self.pages():
+            for item in items:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+            if remaining is not None and remaining <= 0:
+                return
+
+
+def paginate(
+    client: Any,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    items_key: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 2,
+    limit: int | None = None,
+    use_api_key: bool = False,
+    use_session: bool = False,
+    model: type[Model] | None = None,
+) -> Paginator | AsyncPaginator:
+    """
+    Build a paginator over a start/count endpoint for a sync or async client.
+
+    Returns an :class:`AsyncPaginator` when ``client`` is async, otherwise a
+    :class:`Paginator`. ``model`` is only applied when the client was created
+    with ``return_models=True``.
+    """
+    base = {k: v for k, v in (params or {}).items() if k not in ("start", "count")}
+    start = int((params or {}).get("start") or 0)
+
+    def fetch_page(offset: int, count: int) -> Any:
+        return client.get(
+            endpoint,
+            params={**base, "start": offset, "count": count},
+            use_api_key=use_api_key,
+            use_session=use_session,
+        )
+
+    cls = AsyncPaginator if getattr(client, "is_async", False) else Paginator
+    return cls(
+        fetch_page,
+        page_size=page_size,
+        start=start,
+        prefetch=prefetch,
+        items_key=items_key,
+        limit=limit,
+        model=model if getattr(client, "return_models", False) else None,
+        json_backend=getattr(client, "json_backend", None),
+    )
@@ -0,0 +1,808 @@
+"""
+Incremental polling of list endpoints.
+
+Newest-first endpoints (e.g. the feed) are polled from the top until the
+first known item. Oldest-first ones (chat messages, comments) are paged
+forward from the number of items already read.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+
+from heycafe.pagination import (
+    DEFAULT_PAGE_SIZE,
+    AsyncPageFetcher,
+    ItemKey,
+    PageFetcher,
+    extract_items,
+)
+from heycafe.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from heycafe.models import Model
+
+
+class AdaptiveInterval:
+    """
+    Polling delay that follows observed activity.
+
+    After a poll with new items the delay shrinks by ``speedup`` (straight to
+    ``minimum`` when a poll filled a whole page, since items may have been
+    missed); after an empty poll it grows by ``backoff`` up to ``maximum``.
+    Idle sources are polled rarely, busy ones often.
+    """
+
+    def __init__(
+        self,
+        minimum: float = 5.0,
+        maximum: float = 300.0,
+        initial: float | None = None,
+        backoff: float = 1.5,
+        speedup: float = 0.5,
+        jitter: float = 0.1,
+    ):
+        """
+        :param minimum: Shortest delay between polls, in seconds
+        :param maximum: Longest delay between polls, in seconds
+        :param initial: First delay (default: minimum)
+        :param backoff: Factor applied to the delay after a poll without new items
+        :param speedup: Factor applied to the delay after a poll with new items
+        :param jitter: Random +/- fraction added to each delay so that many
+            watchers started together do not poll in lockstep
+        """
+        if not 0 <= minimum <= maximum:
+            raise ValueError("Need 0 <= minimum <= maximum")
+        if backoff < 1 or not 0 < speedup <= 1:
+            raise ValueError("Need backoff >= 1 and 0 < speedup <= 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.speedup = speedup
+        self.jitter = jitter
+        self.current = min(max(initial if initial is not None else minimum, minimum), maximum)
+
+    def update(self, new_items: int, saturated: bool = False) -> float:
+        """
+        Record a poll's outcome and return the delay before the next one.
+
+        :param new_items: Number of new items the poll found
+        :param saturated: True if the poll hit its page limit and may have missed items
+        """
+        if saturated:
+            self.current = self.minimum
+        elif new_items:
+            self.current = max(self.minimum, self.current * self.speedup)
+        else:
+            self.current = min(self.maximum, self.current * self.backoff)
+        if not self.jitter:
+            return self.current
+        return self.current * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class _WatcherBase:
+    def __init__(
+        self,
+        fetch_page: Any,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        items_key: str | None = None,
+        key: ItemKey = "id",
+        interval: AdaptiveInterval | None = None,
+        max_pages: int = 5,
+        include_existing: bool = False,
+        max_polls: int | None = None,
+        remember: int = 1000,
+        model: type[Model] | None = None,
+        json_backend: str | None = None,
+        oldest_first: bool = False,
+    ):
+        """
+        :param fetch_page: Called as fetch_page(start, count); returns one page
+        :param page_size: Items requested per poll page (sent as ``count``)
+        :param items_key: Key holding the item list in each page (default: first list)
+        :param key: Item field (or callable) identifying an item
+        :param interval: Delay policy between polls (default: AdaptiveInterval())
+        :param max_pages: Pages read per poll while every item on them is new
+        :param include_existing: If True, the items already there are yielded too
+            (the first page of a newest-first source, all of an oldest-first one);
+            by default they are only recorded
+        :param max_polls: Stop after this many polls (default: never)
+        :param remember: Number of recent item keys kept for deduplication
+        :param model: Optional heycafe.models class each dict item is wrapped in
+        :param json_backend: JSON backend the models pack their fields with
+        :param oldest_first: The endpoint lists items oldest first, so new ones are
+            appended: each poll pages forward from ``offset`` instead of reading
+            from the top until a known item
+        """
+        if page_size < 1 or max_pages < 1:
+            raise ValueError("page_size and max_pages must be at least 1")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.items_key = items_key
+        self.key = key
+        self.interval = interval or AdaptiveInterval()
+        self.max_pages = max_pages
+        self.include_existing = include_existing
+        self.max_polls = max_polls
+        self.remember = remember
+        self.model = model
+        self.json_backend = json_backend
+        self.oldest_first = oldest_first
+        #: Key of the newest item seen so far
+        self.newest: Any = None
+        #: Items of an oldest-first source read so far; the next poll starts here
+        self.offset = 0
+        #: True if the last poll stopped at max_pages with more items to read
+        self.behind = False
+        self.polls = 0
+        self.requests = 0
+        # Insertion-ordered, so the oldest keys are dropped first.
+        self._seen: dict[Any, None] = {}
+        self._primed = False
+
+    def resume(self, cursor: Any) -> None:
+        """
+        Continue from a ``cursor`` saved earlier.
+
+        The next poll yields the items that came after it rather than priming.
+        """
+        if self.oldest_first:
+            self.offset = int(cursor)
+        else:
+            self.newest = cursor
+            self._seen[cursor] = None
+        self._primed = True
+
+    @property
+    def cursor(self) -> Any:
+        """
+        Where a later run can resume (see resume()), or None before the first poll.
+
+        The newest item's key, or for an oldest-first source the number of items read.
+        """
+        if not self._primed:
+            return None
+        return self.offset if self.oldest_first else self.newest
+
+    def _ident(self, item: Any) -> Any:
+        if callable(self.key):
+            return self.key(item)
+        return item.get(self.key) if isinstance(item, dict) else None
+
+    def _page_start(self, page: int) -> int:
+        return (self.offset if self.oldest_first else 0) + page * self.page_size
+
+    def _scan(self, page: Any, fresh: dict[Any, Any]) -> tuple[bool, int]:
+        """
+        Add a page's unseen items to ``fresh``.
+
+        :return: (reached known items, number of items on the page) - the poll
+            continues with the next page only if the page was full and, for a
+            newest-first source, held no known item
+        """
+        self.requests += 1
+        items = extract_items(page, self.items_key)
+        overlap = False
+        for item in items:
+            ident = self._ident(item)
+            if ident is None:
+                continue
+            if ident in self._seen:
+                if self.oldest_first:
+                    # Earlier items were deleted and this one moved back a place.
+                    continue
+                # Everything after it is older, and was seen (or forgotten) before.
+                overlap = True
+                break
+            if ident not in fresh:
+                # Items shifting down between page requests show up twice.
+                fresh[ident] = item
+        return overlap, len(items)
+
+    def _pages_this_poll(self) -> int:
+        # Before anything is known there is no overlap to stop at, so the first
+        # poll of a newest-first source only reads one page.
+        return self.max_pages if self._primed or self.oldest_first else 1
+
+    def _finish(self, fresh: dict[Any, Any], read: int, saturated: bool) -> tuple[list[Any], float]:
+        """
+        Remember a poll's new items; return them oldest first, and the next delay.
+
+        :param read: Items on the pages this poll read
+        :param saturated: The poll stopped at max_pages with more to read
+        """
+        first_poll = not self._primed
+        self.polls += 1
+        self.behind = saturated
+        if self.oldest_first:
+            self.offset += read
+            idents = list(fresh)
+            # Catching up on what is already there can take several polls.
+            self._primed = self._primed or not saturated
+        else:
+            idents = list(reversed(fresh))
+            self._primed = True
+        if idents:
+            self.newest = idents[-1]
+        for ident in idents:
+            self._seen[ident] = None
+        while len(self._seen) > self.remember:
+            del self._seen[next(iter(self._seen))]
+        items = [fresh[ident] for ident in idents]
+        if first_poll and not self.include_existing:
+            items = []
+        # A newest-first source's first page is full whenever it has enough items.
+        delay = self.interval.update(
+            len(items), saturated and (self.oldest_first or not first_poll)
+        )
+        if self.model is not None:
+            items = self.model.from_data(items, self.json_backend)
+        return items, delay
+
+    def _done(self) -> bool:
+        return self.max_polls is not None and self.polls >= self.max_polls
+
+
+class Watcher(_WatcherBase):
+    """
+    Poll a list endpoint forever, yielding each new item once, oldest first.
+
+    On a newest-first endpoint each poll reads pages until it reaches an item
+    it has already seen. On an oldest-first one (``oldest_first=True``) it reads
+    forward from ``offset``, the number of items read so far, until a page is
+    not full. Either way a poll reads at most ``max_pages``, so bursts between
+    polls are not lost. The delay between polls adapts to activity (see
+    AdaptiveInterval). Errors propagate; give the client a RetryPolicy to ride
+    out transient failures.
+
+    Example:
+        for conv in client.feed.watch():
+            ...
+    """
+
+    fetch_page: PageFetcher
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            items, delay = self.poll()
+            yield from items
+            if self._done():
+                return
+            time.sleep(delay)
+
+    def poll(self) -> tuple[list[Any], float]:
+        """Run one poll now; return (new items oldest first, delay before the next poll)."""
+        fresh: dict[Any, Any] = {}
+        read = 0
+        for page in range(self._pages_this_poll()):
+            data = self.fetch_page(self._page_start(page), self.page_size)
+            overlap, count = self._scan(data, fresh)
+            read += count
+            if overlap or count < self.page_size:
+                return self._finish(fresh, read, False)
+        return self._finish(fresh, read, True)
+
+
+class AsyncWatcher(_WatcherBase):
+    """Async counterpart of :class:`Watcher`; use ``async for``."""
+
+    fetch_page: AsyncPageFetcher
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        import asyncio
+
+        while True:
+            items, delay = await self.poll()
+            for item in items:
+                yield item
+            if self._done():
+                return
+            await asyncio.sleep(delay)
+
+    async def poll(self) -> tuple[list[Any], float]:
+        """Async counterpart of :meth:`Watcher.poll`."""
+        fresh: dict[Any, Any] = {}
+        read = 0
+        for page in range(self._pages_this_poll()):
+            data = await self.fetch_page(self._page_start(page), self.page_size)
+            overlap, count = self._scan(data, fresh)
+            read += count
+            if overlap or count < self.page_size:
+                return self._finish(fresh, read, False)
+        return self._finish(fresh, read, True)
+
+
+class _TailerBase:
+    # If True, a round polls at most max_workers sources, so the heap is
+    # consulted again before the next ones are picked.
+    _one_batch_per_round = False
+
+    def __init__(
+        self,
+        watcher_for: Callable[[Any], _WatcherBase],
+        sources: Iterable[Any] = (),
+        discover: Callable[[], Any] | None = None,
+        max_workers: int = 8,
+        max_rounds: int | None = None,
+        on_error: Callable[[Any, Exception], None] | None = None,
+    ):
+        """
+        :param watcher_for: Builds the Watcher (or AsyncWatcher) for one source
+        :param sources: Keys of the sources to follow (e.g. chat ids)
+        :param discover: Called once before the first poll; returns a list page
+            (or an awaitable of one) whose items' ``id`` fields are added as sources
+        :param max_workers: Maximum number of polls in flight at once
+        :param max_rounds: Stop after this many rounds of polls (default: never)
+        :param on_error: Called with (source, exception) when a poll fails; the
+            source is then retried after its longest interval. By default the
+            exception is raised from the iteration.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.watcher_for = watcher_for
+        self.discover = discover
+        self.max_workers = max_workers
+        self.max_rounds = max_rounds
+        self.on_error = on_error
+        #: One watcher, holding the source's cursor and interval, per source
+        self.watchers: dict[Any, Any] = {}
+        self.rounds = 0
+        # (due time, tie-breaker, source); entries of removed sources are skipped.
+        self._due: list[tuple[float, int, Any]] = []
+        self._seq = itertools.count()
+        for source in sources:
+            self.add(source)
+
+    @property
+    def requests(self) -> int:
+        """Page requests made so far, over all sources."""
+        return sum(w.requests for w in self.watchers.values())
+
+    def add(self, source: Any, since: Any = None) -> None:
+        """
+        Start following ``source``; its first poll is due immediately.
+
+        :param since: The source's cursor from an earlier run's cursors() (see
+            Watcher.cursor); the first poll then yields what came after it
+        """
+        if source not in self.watchers:
+            watcher = self.watcher_for(source)
+            if since is not None:
+                watcher.resume(since)
+            self.watchers[source] = watcher
+            self._schedule(source, 0.0)
+
+    def cursors(self) -> dict[Any, Any]:
+        """Cursor per source (see Watcher.cursor), to save and pass back to add() later."""
+        return {s: w.cursor for s, w in self.watchers.items() if w.cursor is not None}
+
+    def remove(self, source: Any) -> None:
+        """Stop following ``source``."""
+        self.watchers.pop(source, None)
+
+    def _add_discovered(self, page: Any) -> None:
+        for item in extract_items(page):
+            self.add(item.get("id") if isinstance(item, dict) else item)
+
+    def _schedule(self, source: Any, delay: float) -> None:
+        heapq.heappush(self._due, (time.monotonic() + delay, next(self._seq), source))
+
+    def _take_due(self) -> tuple[list[Any], float | None]:
+        """Pop the sources due now; else return the wait until the next one is due."""
+        now = time.monotonic()
+        due: list[Any] = []
+        limit = self.max_workers if self._one_batch_per_round else None
+        while self._due and len(due) != limit:
+            when, _, source = self._due[0]
+            if source not in self.watchers or source in due:
+                heapq.heappop(self._due)
+            elif when <= now:
+                due.append(heapq.heappop(self._due)[2])
+            else:
+                break
+        if due or not self._due:
+            return due, None
+        return due, self._due[0][0] - now
+
+    def _failed(self, source: Any, exc: Exception) -> None:
+        if self.on_error is None:
+            raise exc
+        self.on_error(source, exc)
+        watcher = self.watchers.get(source)
+        if watcher is not None:
+            self._schedule(source, watcher.interval.maximum)
+
+    def _polled(self, source: Any, items: list[Any], delay: float) -> bool:
+        """Reschedule ``source``; False if it was removed while being polled."""
+        if source not in self.watchers:
+            return False
+        self._schedule(source, self._next_delay(source, items, delay))
+        return True
+
+    def _next_delay(self, source: Any, items: list[Any], delay: float) -> float:
+        # The delay proposed by the source's own watcher.
+        return delay
+
+    def _round_done(self) -> bool:
+        self.rounds += 1
+        return self.max_rounds is not None and self.rounds >= self.max_rounds
+
+
+class Tailer(_TailerBase):
+    """
+    Follow many sources at once, yielding ``(source, item)`` pairs.
+
+    Every source keeps its own Watcher: a cursor of the items it has seen and
+    an AdaptiveInterval. A source is only polled when its interval says it is
+    due, so busy sources are polled often and idle ones rarely, and the request
+    rate follows activity rather than the number of sources. The polls that are
+    due together run on a pool of ``max_workers`` threads, and their new items
+    are yielded in one stream as each poll completes.
+
+    Example:
+        for chat, message in client.chat.tail():
+            ...
+    """
+
+    watchers: dict[Any, Watcher]
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        if self.discover is not None:
+            self._add_discovered(self.discover())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                due, wait = self._take_due()
+                if not due:
+                    if wait is None:
+                        return
+                    time.sleep(wait)
+                    continue
+                futures = {pool.submit(self.watchers[s].poll): s for s in due}
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        items, delay = future.result()
+                    except Exception as exc:
+                        self._failed(source, exc)
+                        continue
+                    if self._polled(source, items, delay):
+                        for item in items:
+                            yield source, item
+                if self._round_done():
+                    return
+
+
+class AsyncTailer(_TailerBase):
+    """
+    Async counterpart of :class:`Tailer`; use ``async for``. Polls run as tasks.
+
+    Closing the iterator early (``aclose()``) cancels the polls still running.
+    """
+
+    watchers: dict[Any, AsyncWatcher]
+
+    async def __aiter__(self) -> AsyncIterator[tuple[Any, Any]]:
+        import asyncio
+
+        if self.discover is not None:
+            self._add_discovered(await self.discover())
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def poll(source: Any) -> tuple[Any, Any]:
+            async with limit:
+                try:
+                    return source, await self.watchers[source].poll()
+                except Exception as exc:
+                    return source, exc
+
+        while True:
+            due, wait = self._take_due()
+            if not due:
+                if wait is None:
+                    return
+                await asyncio.sleep(wait)
+                continue
+            tasks = [asyncio.ensure_future(poll(s)) for s in due]
+            unhandled = set(due)
+            try:
+                for done in asyncio.as_completed(tasks):
+                    source, result = await done
+                    unhandled.discard(source)
+                    if isinstance(result, Exception):
+                        self._failed(source, result)
+                        continue
+                    items, delay = result
+                    if self._polled(source, items, delay):
+                        for item in items:
+                            yield source, item
+            finally:
+                # Also reached when the caller stops early or _failed raises:
+                # polls still running would advance their watchers past items
+                # nobody receives, so they are cancelled, and every source not
+                # handed over is due again for the next iteration.
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                for source in unhandled:
+                    self._schedule(source, 0)
+            if self._round_done():
+                return
+
+
+class _Activity:
+    """What an ActivityScheduler knows about one source."""
+
+    __slots__ = ("checked", "active", "rate")
+
+    def __init__(self, now: float):
+        #: When the source was last polled
+        self.checked = now
+        #: When new items were last found (initially: when the source was added)
+        self.active = now
+        #: Estimated new items per second (moving average)
+        self.rate = 0.0
+
+
+class _SchedulerBase(_TailerBase):
+    _one_batch_per_round = True
+    # Wraps a watcher's fetch_page so every page request draws from the budget;
+    # defined by ActivityScheduler and AsyncActivityScheduler.
+    _budgeted: Callable[[Any], Any]
+
+    def __init__(
+        self,
+        watcher_for: Callable[[Any], _WatcherBase],
+        sources: Iterable[Any] = (),
+        requests_per_minute: float = 60.0,
+        min_interval: float = 30.0,
+        max_interval: float = 3600.0,
+        smoothing: float = 0.5,
+        **options: Any,
+    ):
+        """
+        :param watcher_for: Builds the Watcher (or AsyncWatcher) for one source
+        :param sources: Keys of the sources to follow
+        :param requests_per_minute: Budget shared by all page requests
+        :param min_interval: Shortest delay between polls of one source, in seconds
+        :param max_interval: Longest delay between polls of one source, in seconds
+        :param smoothing: Weight of the latest poll in the activity rate estimate
+        :param options: Passed to Tailer (discover, max_workers, max_rounds, on_error)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if not 0 <= min_interval <= max_interval:
+            raise ValueError("Need 0 <= min_interval <= max_interval")
+        if not 0 < smoothing <= 1:
+            raise ValueError("Need 0 < smoothing <= 1")
+        self.budget = TokenBucket(requests_per_minute / 60)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.activity: dict[Any, _Activity] = {}
+        super().__init__(watcher_for, sources, **options)
+
+    def add(self, source: Any, since: Any = None) -> None:
+        """Start following ``source``; see Tailer.add."""
+        if source not in self.watchers:
+            super().add(source, since)
+            watcher = self.watchers[source]
+            watcher.fetch_page = self._budgeted(watcher.fetch_page)
+            self.activity[source] = _Activity(time.monotonic())
+
+    def remove(self, source: Any) -> None:
+        super().remove(source)
+        self.activity.pop(source, None)
+
+    def _next_delay(self, source: Any, items: list[Any], delay: float) -> float:
+        """
+        Delay until ``source`` is expected to have something new.
+
+        That is the smaller of one item at the estimated rate and the time since
+        the source last had new items (or was added), so a quiet source backs
+        off in proportion to how long it has been quiet. A source whose last poll
+        stopped at max_pages with more to read is due again after min_interval.
+        """
+        now = time.monotonic()
+        state = self.activity[source]
+        watcher = self.watchers[source]
+        if watcher.polls > 1:
+            # The first poll says nothing about the rate.
+            observed = len(items) / max(now - state.checked, 1e-3)
+            state.rate += self.smoothing * (observed - state.rate)
+        state.checked = now
+        if items:
+            state.active = now
+        if watcher.behind:
+            return self.min_interval
+        gap = min(self.max_interval, now - state.active)
+        if state.rate > 0:
+            gap = min(gap, 1 / state.rate)
+        return max(self.min_interval, gap)
+
+
+class ActivityScheduler(_SchedulerBase, Tailer):
+    """
+    Keep many sources in sync within a request budget, polling the busiest first.
+
+    Like Tailer, but a source's next poll is due when its next item is
+    expected: from its estimated item rate and how recently it last had new
+    items. The due times form a heap, so when the budget cannot cover every
+    source, the ones expected to be most active are polled first and idle ones
+    wait. Each round polls at most ``max_workers`` due sources, earliest due
+    first. Every page request draws from one token bucket refilled at
+    ``requests_per_minute``.
+
+    Example:
+        sync = client.conversation.sync_comments(ids, requests_per_minute=120)
+        for conversation, comment in sync:
+            ...
+    """
+
+    def _budgeted(self, fetch_page: PageFetcher) -> PageFetcher:
+        budget = self.budget
+
+        def fetch(start: int, count: int) -> Any:
+            wait = budget.reserve()
+            if wait > 0:
+                time.sleep(wait)
+            return fetch_page(start, count)
+
+        return fetch
+
+
+class AsyncActivityScheduler(_SchedulerBase, AsyncTailer):
+    """Async counterpart of :class:`ActivityScheduler`; use ``async for``."""
+
+    def _budgeted(self, fetch_page: AsyncPageFetcher) -> AsyncPageFetcher:
+        import asyncio
+
+        budget = self.budget
+
+        async def fetch(start: int, count: int) -> Any:
+            wait = budget.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await fetch_page(start, count)
+
+        return fetch
+
+
+def watch(
+    client: Any,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    use_api_key: bool = False,
+    use_session: bool = False,
+    model: type[Model] | None = None,
+    **options: Any,
+) -> Watcher | AsyncWatcher:
+    """
+    Build a watcher over a start/count endpoint for a sync or async client.
+
+    Polls bypass the response cache so every poll sees fresh data. ``model``
+    is only applied when the client was created with ``return_models=True``.
+    Other keyword arguments are passed to the watcher (page_size, interval,
+    oldest_first, ...).
+    """
+    base = {k: v for k, v in (params or {}).items() if k not in ("start", "count")}
+
+    def fetch_page(offset: int, count: int) -> Any:
+        return client.get(
+            endpoint,
+            params={**base, "start": offset, "count": count},
+            use_api_key=use_api_key,
+            use_session=use_session,
+            use_cache=False,
+        )
+
+    cls = AsyncWatcher if getattr(client, "is_async", False) else Watcher
+    return cls(
+        fetch_page,
+        model=model if getattr(client, "return_models", False) else None,
+        json_backend=getattr(client, "json_backend", None),
+        **options,
+    )
+
+
+def tail(
+    client: Any,
+    endpoint: str,
+    sources: Iterable[Any] = (),
+    param: str = "query",
+    params: dict[str, Any] | None = None,
+    use_api_key: bool = False,
+    use_session: bool = False,
+    model: type[Model] | None = None,
+    min_interval: float = 5.0,
+    max_interval: float = 300.0,
+    discover: Callable[[], Any] | None = None,
+    max_workers: int = 8,
+    max_rounds: int | None = None,
+    on_error: Callable[[Any, Exception], None] | None = None,
+    **options: Any,
+) -> Tailer | AsyncTailer:
+    """
+    Build a tailer over ``endpoint`` for a sync or async client.
+
+    Each source is polled with ``{param: source, **params}``. Other keyword
+    arguments are passed to each source's watcher (page_size, max_pages, ...).
+    """
+
+    def watcher_for(source: Any) -> Watcher | AsyncWatcher:
+        return watch(
+            client,
+            endpoint,
+            {**(params or {}), param: source},
+            use_api_key=use_api_key,
+            use_session=use_session,
+            model=model,
+            interval=AdaptiveInterval(min_interval, max_interval),
+            **options,
+        )
+
+    cls = AsyncTailer if getattr(client, "is_async", False) else Tailer
+    return cls(
+        watcher_for,
+        sources,
+        discover=discover,
+        max_workers=max_workers,
+        max_rounds=max_rounds,
+        on_error=on_error,
+    )
+
+
+def schedule(
+    client: Any,
+    endpoint: str,
+    sources: Iterable[Any] = (),
+    param: str = "query",
+    params: dict[str, Any] | None = None,
+    use_api_key: bool = False,
+    use_session: bool = False,
+    model: type[Model] | None = None,
+    requests_per_minute: float = 60.0,
+    min_interval: float = 30.0,
+    max_interval: float = 3600.0,
+    max_workers: int = 4,
+    max_rounds: int | None = None,
+    on_error: Callable[[Any, Exception], None] | None = None,
+    **options: Any,
+) -> ActivityScheduler | AsyncActivityScheduler:
+    """
+    Build an activity scheduler over ``endpoint`` for a sync or async client.
+
+    Each source is polled with ``{param: source, **params}``. Other keyword
+    arguments are passed to each source's watcher (page_size, max_pages, ...).
+    """
+
+    def watcher_for(source: Any) -> Watcher | AsyncWatcher:
+        return watch(
+            client,
+            endpoint,
+            {**(params or {}), param: source},
+            use_api_key=use_api_key,
+            use_session=use_session,
+            model=model,
+            interval=AdaptiveInterval(min_interval, max_interval, jitter=0),
+            **options,
+        )
+
+    cls = AsyncActivityScheduler if getattr(client, "is_async", False) else ActivityScheduler
+    return cls(
+        watcher_for,
+        sources,
+        requests_per_minute=requests_per_minute,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        max_workers=max_workers,
+        max_rounds=max_rounds,
+        on_error=on_error,
+    )
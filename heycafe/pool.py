@@ -0,0 +1,124 @@
+"""Connection-pool configuration and utilisation stats for the HTTP clients."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+#: Default per-host pool size of the sync client (requests' own default is 10).
+DEFAULT_POOL_MAXSIZE = 32
+
+
+@dataclass
+class HostPoolStats:
+    """Connections to one host."""
+
+    #: Connections currently open (idle + in use)
+    open: int = 0
+    #: Open connections waiting in the pool for reuse
+    idle: int = 0
+    #: Connections currently serving a request
+    in_use: int = 0
+    #: Requests sent over this pool, when the HTTP library reports it
+    requests: int | None = None
+    #: Open connections speaking HTTP/2
+    http2: int = 0
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of a client's connection pool."""
+
+    #: Connections kept per host (sync) or in total (httpx)
+    maxsize: int | None
+    #: True if callers wait for a free connection instead of opening a throwaway one
+    block: bool
+    http2: bool
+    hosts: dict[str, HostPoolStats] = field(default_factory=dict)
+
+
+def mount_pool(
+    session: requests.Session, connections: int, maxsize: int, block: bool
+) -> HTTPAdapter:
+    """Mount an HTTPAdapter with the given pool sizes for http:// and https://."""
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=connections, pool_maxsize=maxsize, pool_block=block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
+
+
+def requests_pool_stats(session: requests.Session) -> PoolStats:
+    """Pool stats of the HTTPAdapter mounted for https:// on a requests.Session."""
+    adapter = session.get_adapter("https://")
+    return urllib3_pool_stats(
+        getattr(adapter, "poolmanager", None),
+        getattr(adapter, "_pool_maxsize", None),
+        getattr(adapter, "_pool_block", False),
+    )
+
+
+def urllib3_pool_stats(manager: Any, maxsize: int | None, block: bool) -> PoolStats:
+    """Pool stats of a urllib3.PoolManager."""
+    stats = PoolStats(maxsize=maxsize, block=block, http2=False)
+    if manager is None:
+        return stats
+    for key in list(manager.pools.keys()):
+        pool = manager.pools.get(key)
+        if pool is None:
+            continue
+        # The queue holds idle connections plus None placeholders for free slots;
+        # whatever is missing from it is checked out.
+        queued = list(pool.pool.queue) if pool.pool is not None else []
+        idle = sum(conn is not None for conn in queued)
+        in_use = pool.pool.maxsize - len(queued) if pool.pool is not None else 0
+        stats.hosts[f"{pool.host}:{pool.port}"] = HostPoolStats(
+            open=idle + in_use, idle=idle, in_use=in_use, requests=pool.num_requests
+        )
+    return stats
+
+
+def httpx_pool_stats(client: Any, maxsize: int | None, http2: bool) -> PoolStats:
+    """
+    Pool stats of an httpx.Client or httpx.AsyncClient using the default transport.
+
+    httpx exposes no public pool API, so this reads httpx's and httpcore's
+    internals (``client._transport._pool`` and each connection's ``_origin``),
+    as found in httpx 0.24 to 0.28. Every step falls back quietly: with a
+    custom transport or a later httpx that moved them, hosts are empty or
+    named "?" rather than the call failing.
+    """
+    stats = PoolStats(maxsize=maxsize, block=True, http2=http2)
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if not isinstance(connections, (list, tuple)):
+        return stats
+    for conn in list(connections):
+        host = stats.hosts.setdefault(_httpx_origin(conn), HostPoolStats())
+        host.open += 1
+        is_idle = getattr(conn, "is_idle", None)
+        if callable(is_idle) and is_idle():
+            host.idle += 1
+        else:
+            host.in_use += 1
+        info = getattr(conn, "info", None)
+        if callable(info) and "HTTP/2" in str(info()):
+            host.http2 += 1
+    return stats
+
+
+def _httpx_origin(conn: Any) -> str:
+    """The ``host:port`` of an httpcore connection, or "?" if it cannot be read."""
+    origin = getattr(conn, "_origin", None)
+    host = getattr(origin, "host", None)
+    port = getattr(origin, "port", None)
+    if host is None:
+        return "?"
+    if isinstance(host, bytes):
+        host = host.decode("ascii", "replace")
+    return f"{host}:{port}"
@@ -0,0 +1,200 @@
+"""Client-side rate limiting with token buckets."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+#: Longest Retry-After delay accepted, in seconds; larger values are clamped to it
+MAX_RETRY_AFTER = 3600.0
+
+
+def parse_retry_after(value: str | None, maximum: float = MAX_RETRY_AFTER) -> float | None:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP date) into seconds from now.
+
+    :param value: Header value
+    :param maximum: Upper bound on the result, so a bogus header cannot stall the client
+    :return: Seconds between 0 and ``maximum``, or None if the header is missing,
+        malformed or not finite (e.g. "inf" or "nan")
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, OverflowError):
+            return None
+    if not math.isfinite(seconds):
+        return None
+    return min(max(0.0, seconds), maximum)
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Default grouping of endpoints into rate-limit families.
+
+    All writes share the "post" family; reads are grouped by resource,
+    e.g. get_account_info -> "get_account", get_stats_cafes -> "get_stats".
+    """
+    if endpoint.startswith("post_"):
+        return "post"
+    return "_".join(endpoint.split("_", 2)[:2])
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that hands out reservations.
+
+    ``reserve()`` takes a token and returns how long the caller must wait
+    before using it, so the same bucket can pace threads and tasks. After a 429
+    the rate is halved and recovers additively on each success (AIMD), so
+    callers settle near the highest rate the server accepts.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, min_rate: float | None = None):
+        """
+        :param rate: Sustained requests per second
+        :param burst: Bucket capacity (default: max(1, rate))
+        :param min_rate: Floor for the adaptive rate (default: rate / 16)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` and return the seconds to wait before proceeding."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def throttle(self) -> None:
+        """React to a 429: halve the rate."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def recover(self) -> None:
+        """React to a success: grow the rate back towards ``max_rate``."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a RateLimiter."""
+
+    #: Requests that went through acquire()
+    requests: int = 0
+    #: Requests that had to wait for a token
+    delayed: int = 0
+    #: Total seconds spent waiting
+    wait_time: float = 0.0
+    #: 429 responses observed
+    throttled: int = 0
+
+
+class RateLimiter:
+    """
+    Global plus per-family token buckets shared by every call of a client.
+
+    Example:
+        limiter = RateLimiter(rate=20, families={"post": 2, "get_stats": 5})
+        client = HeyCafe(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        families: dict[str, float | tuple[float, float]] | None = None,
+        family_of: Callable[[str], str] = endpoint_family,
+    ):
+        """
+        :param rate: Global requests per second (None: no global limit)
+        :param burst: Global bucket capacity
+        :param families: Per-family limits, as rate or (rate, burst)
+        :param family_of: Maps an endpoint name to its family
+        """
+        self.global_bucket = TokenBucket(rate, burst) if rate else None
+        self.family_buckets: dict[str, TokenBucket] = {}
+        for family, limit in (families or {}).items():
+            if isinstance(limit, tuple):
+                self.family_buckets[family] = TokenBucket(limit[0], limit[1])
+            else:
+                self.family_buckets[family] = TokenBucket(limit)
+        self.family_of = family_of
+        self._blocked_until = 0.0
+        self._stats = RateLimiterStats()
+        self._lock = threading.Lock()
+
+    def _buckets(self, endpoint: str) -> list[TokenBucket]:
+        buckets = [self.global_bucket] if self.global_bucket else []
+        family = self.family_buckets.get(self.family_of(endpoint))
+        if family is not None:
+            buckets.append(family)
+        return buckets
+
+    def reserve(self, endpoint: str) -> float:
+        """Take a token from each applicable bucket; return the seconds to wait."""
+        wait = max((b.reserve() for b in self._buckets(endpoint)), default=0.0)
+        with self._lock:
+            # A Retry-After pause applies to every request, limited bucket or not.
+            wait = max(wait, self._blocked_until - time.monotonic())
+            self._stats.requests += 1
+            if wait > 0:
+                self._stats.delayed += 1
+                self._stats.wait_time += wait
+        return wait
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the calling thread until a request to ``endpoint`` may be sent."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Suspend the calling task until a request to ``endpoint`` may be sent."""
+        import asyncio
+
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, endpoint: str, status_code: int, retry_after: float | None = None) -> None:
+        """
+        Feed a response back: a 429 pauses all requests for ``retry_after`` and
+        halves the bucket rates; successes let the rates recover.
+        """
+        if status_code == 429:
+            with self._lock:
+                self._stats.throttled += 1
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            for bucket in self._buckets(endpoint):
+                bucket.throttle()
+        elif status_code < 400:
+            for bucket in self._buckets(endpoint):
+                bucket.recover()
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(**vars(self._stats))
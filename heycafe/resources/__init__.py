@@ -1,17 +1,38 @@
-"""API resource modules."""
-
-from heycafe.resources.account import AccountResource
-from heycafe.resources.bot import BotResource
-from heycafe.resources.cafe import CafeResource
-from heycafe.resources.chat import ChatResource
-from heycafe.resources.comment import CommentResource
-from heycafe.resources.conversation import ConversationResource
-from heycafe.resources.explore import ExploreResource
-from heycafe.resources.feed import FeedResource
-from heycafe.resources.search import SearchResource
-from heycafe.resources.stats import StatsResource
-from heycafe.resources.system import SystemResource
-from heycafe.resources.temp import TempResource
+"""API resource modules, imported on first use."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from heycafe.resources.account import AccountResource
+    from heycafe.resources.bot import BotResource
+    from heycafe.resources.cafe import CafeResource
+    from heycafe.resources.chat import ChatResource
+    from heycafe.resources.comment import CommentResource
+    from heycafe.resources.conversation import ConversationResource
+    from heycafe.resources.explore import ExploreResource
+    from heycafe.resources.feed import FeedResource
+    from heycafe.resources.search import SearchResource
+    from heycafe.resources.stats import StatsResource
+    from heycafe.resources.system import SystemResource
+    from heycafe.resources.temp import TempResource
+
+_MODULES = {
+    "SystemResource": "system",
+    "AccountResource": "account",
+    "CafeResource": "cafe",
+    "ConversationResource": "conversation",
+    "ChatResource": "chat",
+    "CommentResource": "comment",
+    "ExploreResource": "explore",
+    "FeedResource": "feed",
+    "SearchResource": "search",
+    "StatsResource": "stats",
+    "BotResource": "bot",
+    "TempResource": "temp",
+}
 
 __all__ = [
     "SystemResource",
@@ -27,3 +48,16 @@ __all__ = [
     "BotResource",
     "TempResource",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Any
+
+from heycafe.bulk import BulkResult, bulk_action
+from heycafe.models import Account
+from heycafe.pagination import DEFAULT_PAGE_SIZE, AsyncPaginator, Paginator, paginate
 from heycafe.resources.base import BaseResource
 
 
@@ -14,9 +20,13 @@ class AccountResource(BaseResource):
     do not.
     """
 
-    def info(self, query: str) -> dict:
+    __slots__ = ()
+
+    def info(self, query: str) -> dict | Account:
         """Get account info by alias or id. Public."""
-        return self._client.get("get_account_info", params={"query": query})
+        return self._as_model(
+            Account, self._client.get("get_account_info", params={"query": query})
+        )
 
     def cafes(self, **params: str) -> dict:
         """Get cafes for the account. Requires API key."""
@@ -34,6 +44,44 @@ class AccountResource(BaseResource):
         """Get accounts that the account follows. Requires API key."""
         return self._client.get("get_account_following", params=params, use_api_key=True)
 
+    def iter_followers(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all followers with read-ahead. Requires API key."""
+        return paginate(
+            self._client,
+            "get_account_followers",
+            params,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            use_api_key=True,
+            model=Account,
+        )
+
+    def iter_following(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all followed accounts with read-ahead. Requires API key."""
+        return paginate(
+            self._client,
+            "get_account_following",
+            params,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            use_api_key=True,
+            model=Account,
+        )
+
     def friends(self, **params: str) -> dict:
         """Get account friends. Requires API key."""
         return self._client.get("get_account_friends", params=params, use_api_key=True)
@@ -100,6 +148,99 @@ class AccountResource(BaseResource):
             "post_account_unsubscribe", data={"query": query}, use_api_key=True
         )
 
+    def _following(self) -> Any:
+        # Raw dicts whatever return_models says: only ids and aliases are needed.
+        return paginate(
+            self._client, "get_account_following", {}, page_size=100, use_api_key=True
+        ).fetch_all()
+
+    def follow_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        check: bool = True,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """
+        Follow many accounts concurrently; accounts already followed are skipped.
+
+        Requires API key. See heycafe.bulk. Returns a BulkResult (awaitable with
+        the async client) with the response or error per account.
+
+        :param queries: Account ids or aliases
+        :param current: Ids or aliases already followed, if known; by default the
+            following list is fetched once (from the response cache if it has a TTL
+            for get_account_following)
+        :param check: If False, skip the state check and send every follow
+        :param max_workers: Maximum concurrent requests
+        """
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_account_follow",
+            queries,
+            wanted=True,
+            current=current,
+            load_current=self._following if check else None,
+            invalidate=("get_account_following",),
+            max_workers=max_workers,
+        )
+
+    def unfollow_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        check: bool = True,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """Unfollow many accounts concurrently; see follow_many(). Requires API key."""
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_account_unfollow",
+            queries,
+            wanted=False,
+            current=current,
+            load_current=self._following if check else None,
+            invalidate=("get_account_following",),
+            max_workers=max_workers,
+        )
+
+    def subscribe_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """
+        Subscribe to many accounts concurrently. Requires API key.
+
+        The API has no list of subscriptions to check against, so every account is
+        sent unless ``current`` (ids or aliases already subscribed to) is given.
+        """
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_account_subscribe",
+            queries,
+            wanted=True,
+            current=current,
+            max_workers=max_workers,
+        )
+
+    def unsubscribe_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """Unsubscribe from many accounts concurrently; see subscribe_many()."""
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_account_unsubscribe",
+            queries,
+            wanted=False,
+            current=current,
+            max_workers=max_workers,
+        )
+
     def update_ghost_cafes(self, **data: str) -> dict:
         """Update ghost cafes preference. Requires API key."""
         return self._client.post("post_account_update_ghost_cafes", data=data, use_api_key=True)
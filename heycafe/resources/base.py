@@ -2,14 +2,42 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from heycafe.client import HeyCafeClient
+    from heycafe.models import Model
+
+M = TypeVar("M", bound="Model")
+
+
+async def _from_awaitable(
+    model: type[Model], result: Awaitable[Any], json_backend: str | None
+) -> Any:
+    return model.from_data(await result, json_backend)
 
 
 class BaseResource:
     """Base class for resource modules that use the low-level client."""
 
+    # Subclasses declare empty __slots__ too, so instances carry no __dict__.
+    __slots__ = ("_client",)
+
     def __init__(self, client: HeyCafeClient):
         self._client = client
+
+    def _as_model(self, model: type[M], result: dict[str, Any]) -> dict[str, Any] | M:
+        """
+        Wrap ``result`` in ``model`` if the client was created with return_models=True.
+
+        The model packs its fields with the client's JSON backend.
+        """
+        if not getattr(self._client, "return_models", False):
+            return result
+        json_backend = getattr(self._client, "json_backend", None)
+        if getattr(self._client, "is_async", False):
+            # The async client hands back an awaitable; so does this, then.
+            return cast(M, _from_awaitable(model, cast("Awaitable[Any]", result), json_backend))
+        return cast(M, model.from_data(result, json_backend))
@@ -8,6 +8,8 @@ from heycafe.resources.base import BaseResource
 class BotResource(BaseResource):
     """Bot and utility endpoints. Public."""
 
+    __slots__ = ()
+
     def giphy_search(self, query: str, **params: str) -> dict:
         """Search Giphy. query required."""
         return self._client.get("get_bot_giphy_search", params={"query": query, **params})
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from heycafe.bulk import BulkResult, bulk_action
+from heycafe.models import Account, Cafe, Conversation
+from heycafe.pagination import DEFAULT_PAGE_SIZE, AsyncPaginator, Paginator, paginate
 from heycafe.resources.base import BaseResource
 
 
 class CafeResource(BaseResource):
     """Café (community) endpoints."""
 
-    def info(self, query: str) -> dict:
+    __slots__ = ()
+
+    def info(self, query: str) -> dict | Cafe:
         """Get café info by alias or id. Public."""
-        return self._client.get("get_cafe_info", params={"query": query})
+        return self._as_model(Cafe, self._client.get("get_cafe_info", params={"query": query}))
 
     def conversations(self, query: str, **params: str) -> dict:
         """Get café conversations. query is café alias or id."""
@@ -20,6 +28,56 @@ class CafeResource(BaseResource):
         """Get café members. query is café alias or id."""
         return self._client.get("get_cafe_members", params={"query": query, **params})
 
+    def iter_conversations(
+        self,
+        query: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all café conversations with read-ahead. Returns a Paginator."""
+        return paginate(
+            self._client,
+            "get_cafe_conversations",
+            {"query": query, **params},
+            items_key="conversations",
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            model=Conversation,
+        )
+
+    def iter_members(
+        self,
+        query: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all café members with read-ahead. Returns a Paginator."""
+        return paginate(
+            self._client,
+            "get_cafe_members",
+            {"query": query, **params},
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            model=Account,
+        )
+
+    def stream_members(self, query: str, **params: str) -> Iterator[Any] | AsyncIterator[Any]:
+        """
+        Iterate the members of one (possibly huge) response while it downloads.
+
+        Makes a single request and never holds the whole body in memory; pass
+        ``count`` to size it. See HeyCafeClient.stream.
+        """
+        return self._client.stream(
+            "get_cafe_members", params={"query": query, **params}, model=Account
+        )
+
     def create(self, **data: str) -> dict:
         """Create a café. Requires API key."""
         return self._client.post("post_cafe_create", data=data, use_api_key=True)
@@ -40,6 +98,79 @@ class CafeResource(BaseResource):
         """Unfavourite a café. Requires API key."""
         return self._client.post("post_cafe_unfavourite", data={"query": query}, use_api_key=True)
 
+    def _joined(self) -> Any:
+        # Raw dicts whatever return_models says: only ids and aliases are needed.
+        return paginate(
+            self._client, "get_account_cafes", {}, page_size=100, use_api_key=True
+        ).fetch_all()
+
+    def join_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        check: bool = True,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """
+        Join many cafés concurrently; cafés the account is already in are skipped.
+
+        Requires API key. See heycafe.bulk. Returns a BulkResult (awaitable with
+        the async client) with the response or error per café.
+
+        :param queries: Café ids or aliases
+        :param current: Ids or aliases of cafés already joined, if known; by default
+            every page of the account's cafés is fetched (get_account_cafes)
+        :param check: If False, skip the state check and send every join
+        :param max_workers: Maximum concurrent requests
+        """
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_cafe_join",
+            queries,
+            wanted=True,
+            current=current,
+            load_current=self._joined if check else None,
+            invalidate=("get_account_cafes",),
+            max_workers=max_workers,
+        )
+
+    def favourite_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """
+        Favourite many cafés concurrently. Requires API key.
+
+        The API has no list of favourites to check against, so every café is sent
+        unless ``current`` (ids or aliases already favourited) is given.
+        """
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_cafe_favourite",
+            queries,
+            wanted=True,
+            current=current,
+            max_workers=max_workers,
+        )
+
+    def unfavourite_many(
+        self,
+        queries: Iterable[str],
+        current: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> BulkResult:
+        """Unfavourite many cafés concurrently; see favourite_many()."""
+        return bulk_action(  # type: ignore[no-any-return]
+            self._client,
+            "post_cafe_unfavourite",
+            queries,
+            wanted=False,
+            current=current,
+            max_workers=max_workers,
+        )
+
     def update_notifications(self, **data: str) -> dict:
         """Update café notification settings. Requires API key."""
         return self._client.post("post_cafe_update_notifications", data=data, use_api_key=True)
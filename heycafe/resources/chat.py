@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+
+from heycafe.models import Chat, ChatMessage
+from heycafe.pagination import DEFAULT_PAGE_SIZE, AsyncPaginator, Paginator, paginate
+from heycafe.polling import AsyncTailer, Tailer, tail
 from heycafe.resources.base import BaseResource
 
 
 class ChatResource(BaseResource):
     """Direct chat endpoints. Most require API key."""
 
+    __slots__ = ()
+
     def account(self, **params: str) -> dict:
         """Get chat account info. Requires API key."""
         return self._client.get("get_chat_account", params=params, use_api_key=True)
 
-    def info(self, query: str, **params: str) -> dict:
+    def info(self, query: str, **params: str) -> dict | Chat:
         """Get chat info. Requires API key."""
-        return self._client.get(
-            "get_chat_info", params={"query": query, **params}, use_api_key=True
+        return self._as_model(
+            Chat,
+            self._client.get("get_chat_info", params={"query": query, **params}, use_api_key=True),
         )
 
     def list(self, **params: str) -> dict:
@@ -30,6 +38,73 @@ class ChatResource(BaseResource):
             use_api_key=True,
         )
 
+    def iter_messages(
+        self,
+        query: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all messages of a chat with read-ahead. Requires API key."""
+        return paginate(
+            self._client,
+            "get_chat_messages",
+            {"query": query, **params},
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            use_api_key=True,
+            model=ChatMessage,
+        )
+
+    def tail(
+        self,
+        chats: Iterable[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        max_workers: int = 8,
+        max_pages: int = 5,
+        max_rounds: int | None = None,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> Tailer | AsyncTailer:
+        """
+        Follow new messages in many chats, as one stream of ``(chat, message)`` pairs.
+
+        Returns a Tailer (AsyncTailer with the async client). Messages are listed
+        oldest first, so each chat keeps the number of messages read as its
+        cursor and pages forward from it. Each chat also has its own polling
+        interval: chats with recent messages are polled every ``min_interval``
+        seconds, idle ones back off to ``max_interval``. Due polls run
+        ``max_workers`` at a time. Messages already in a chat when it is first
+        polled are not yielded; reaching the end of a long chat may take several
+        polls. Requires API key.
+
+        :param chats: Chat ids to follow (default: every chat from list())
+        :param page_size: Messages requested per poll page
+        :param max_pages: Pages read per poll when a burst overflows the first page
+        :param max_rounds: Stop after this many rounds of polls (default: never)
+        :param on_error: Called with (chat, exception) when a poll fails, instead
+            of raising; the chat is retried after max_interval
+        """
+        return tail(
+            self._client,
+            "get_chat_messages",
+            chats or (),
+            use_api_key=True,
+            model=ChatMessage,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            discover=self.list if chats is None else None,
+            max_workers=max_workers,
+            max_rounds=max_rounds,
+            on_error=on_error,
+            page_size=page_size,
+            max_pages=max_pages,
+            oldest_first=True,
+        )
+
     def accept(self, query: str) -> dict:
         """Accept a chat invite. Requires API key."""
         return self._client.post("post_chat_accept", data={"query": query}, use_api_key=True)
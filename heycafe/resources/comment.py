@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from heycafe.models import Comment
 from heycafe.resources.base import BaseResource
 
 
 class CommentResource(BaseResource):
     """Comment endpoints."""
 
-    def info(self, query: str) -> dict:
+    __slots__ = ()
+
+    def info(self, query: str) -> dict | Comment:
         """Get comment info by id. Public."""
-        return self._client.get("get_comment_info", params={"query": query})
+        return self._as_model(
+            Comment, self._client.get("get_comment_info", params={"query": query})
+        )
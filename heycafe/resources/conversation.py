@@ -2,53 +2,185 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
 from heycafe.client import encode_content
+from heycafe.models import Comment, Conversation
+from heycafe.pagination import DEFAULT_PAGE_SIZE, AsyncPaginator, Paginator, paginate
+from heycafe.polling import ActivityScheduler, AsyncActivityScheduler, schedule
 from heycafe.resources.base import BaseResource
 
+if TYPE_CHECKING:
+    from heycafe.multipart import ContentSource
+
+
+def create_data(
+    cafe: str,
+    content: str | None = None,
+    content_raw: str | None = None,
+    file: str | None = None,
+    image_url: str | None = None,
+    alt: str | None = None,
+    draft: bool = False,
+) -> dict[str, str]:
+    """Form data for post_conversation_create; see ConversationResource.create."""
+    data = {"cafe": cafe}
+    if content_raw is not None:
+        data["content_raw"] = content_raw
+    if content is not None:
+        data["content"] = content
+    elif content_raw is not None:
+        data["content"] = encode_content(content_raw)
+    if file:
+        data["file"] = file
+    if image_url:
+        data["image_url"] = image_url
+    if alt is not None:
+        data["alt"] = alt
+    if draft:
+        data["draft"] = "true"
+    return data
+
 
 class ConversationResource(BaseResource):
     """Conversation (post) endpoints."""
 
-    def info(self, query: str) -> dict:
+    __slots__ = ()
+
+    def info(self, query: str) -> dict | Conversation:
         """Get conversation info by id. Public."""
-        return self._client.get("get_conversation_info", params={"query": query})
+        return self._as_model(
+            Conversation, self._client.get("get_conversation_info", params={"query": query})
+        )
 
     def comments(self, query: str, **params: str) -> dict:
         """Get conversation comments. query is conversation id."""
         return self._client.get("get_conversation_comments", params={"query": query, **params})
 
+    def iter_comments(
+        self,
+        query: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+        **params: str,
+    ) -> Paginator | AsyncPaginator:
+        """Iterate all comments of a conversation with read-ahead. Returns a Paginator."""
+        return paginate(
+            self._client,
+            "get_conversation_comments",
+            {"query": query, **params},
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            model=Comment,
+        )
+
+    def stream_comments(self, query: str, **params: str) -> Iterator[Any] | AsyncIterator[Any]:
+        """
+        Iterate the comments of one (possibly huge) response while it downloads.
+
+        Unlike iter_comments, this makes a single request and never holds the whole
+        body in memory; pass ``count`` to size it. See HeyCafeClient.stream.
+        """
+        return self._client.stream(
+            "get_conversation_comments", params={"query": query, **params}, model=Comment
+        )
+
+    def sync_comments(
+        self,
+        conversations: Iterable[str] = (),
+        requests_per_minute: float = 60.0,
+        min_interval: float = 30.0,
+        max_interval: float = 3600.0,
+        cursors: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_pages: int = 5,
+        max_workers: int = 4,
+        max_rounds: int | None = None,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> ActivityScheduler | AsyncActivityScheduler:
+        """
+        Follow new comments on many conversations within a request budget.
+
+        Returns an ActivityScheduler (AsyncActivityScheduler with the async
+        client) yielding ``(conversation, comment)`` pairs. Comments are listed
+        oldest first, so each conversation keeps the number of comments read and
+        pages forward from it: only newer comments are fetched. Reaching the end
+        of a long thread the first time may take several polls.
+        Conversations are polled when their next comment is expected, from their
+        comment rate and how recently they were active, and all requests share
+        a budget of ``requests_per_minute``.
+
+        :param conversations: Conversation ids to follow
+        :param cursors: Comments read per conversation, as returned by a previous
+            run's cursors(); those conversations resume from there instead of priming
+        :param page_size: Comments requested per poll page
+        :param max_pages: Pages read per poll when many comments arrived at once
+        :param max_workers: Polls in flight at once
+        :param max_rounds: Stop after this many rounds of polls (default: never)
+        :param on_error: Called with (conversation, exception) when a poll fails,
+            instead of raising; the conversation is retried after max_interval
+        """
+        sync = schedule(
+            self._client,
+            "get_conversation_comments",
+            model=Comment,
+            requests_per_minute=requests_per_minute,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            max_workers=max_workers,
+            max_rounds=max_rounds,
+            on_error=on_error,
+            page_size=page_size,
+            max_pages=max_pages,
+            oldest_first=True,
+        )
+        for conversation in conversations:
+            sync.add(conversation, (cursors or {}).get(conversation))
+        for conversation, since in (cursors or {}).items():
+            sync.add(conversation, since)
+        return sync
+
     def create(
         self,
         cafe: str,
         content: str | None = None,
-        content_raw: str | None = None,
+        content_raw: ContentSource | None = None,
         file: str | None = None,
         image_url: str | None = None,
         alt: str | None = None,
         draft: bool = False,
+        stream: bool = False,
     ) -> dict:
         """
         Create a new conversation in a café.
 
         Requires API key. Provide either content (base64), content_raw (plain text), or both.
         Optional: file (from post_temp_file), image_url, alt (alt text, base64 or plain), draft.
+
+        With ``stream=True`` the content is sent as a multipart body instead of
+        a form: content_raw is read and base64-encoded a chunk at a time while
+        the request is sent (see HeyCafeClient.upload), so a very long post is
+        never copied into a form dict. content_raw may then also be bytes, an
+        ``mmap`` or a file object. Check that the API accepts multipart posts
+        before relying on it.
+
+        :raises TypeError: If content_raw is not text and stream is False
         """
-        data: dict = {"cafe": cafe}
-        if content_raw is not None:
-            data["content_raw"] = content_raw
-        if content is not None:
-            data["content"] = content
-        elif content_raw is not None:
-            data["content"] = encode_content(content_raw)
-        if file:
-            data["file"] = file
-        if image_url:
-            data["image_url"] = image_url
-        if alt is not None:
-            data["alt"] = alt
-        if draft:
-            data["draft"] = "true"
-        return self._client.post("post_conversation_create", data=data, use_api_key=True)
+        if not stream or content_raw is None:
+            if content_raw is not None and not isinstance(content_raw, str):
+                raise TypeError("content_raw must be str unless stream=True")
+            data = create_data(cafe, content, content_raw, file, image_url, alt, draft)
+            return self._client.post("post_conversation_create", data=data, use_api_key=True)
+        from heycafe.multipart import FieldPart
+
+        data = create_data(cafe, content, None, file, image_url, alt, draft)
+        fields = {"content_raw": FieldPart(content_raw)}
+        if content is None:
+            fields["content"] = FieldPart(content_raw, base64=True)
+        return self._client.upload("post_conversation_create", fields, data=data)
 
     def edit(self, query: str, **data: str) -> dict:
         """Edit a conversation. Requires API key."""
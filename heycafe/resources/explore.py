@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from heycafe.models import Conversation
 from heycafe.resources.base import BaseResource
 
 
 class ExploreResource(BaseResource):
     """Explore/discovery endpoints. Public."""
 
+    __slots__ = ()
+
     def accounts(self, **params: str) -> dict:
         """Explore accounts."""
         return self._client.get("get_explore_accounts", params=params)
@@ -20,6 +26,14 @@ class ExploreResource(BaseResource):
         """Explore conversations."""
         return self._client.get("get_explore_conversations", params=params)
 
+    def stream_conversations(self, **params: str) -> Iterator[Any] | AsyncIterator[Any]:
+        """
+        Iterate explore conversations of one (possibly huge) response while it downloads.
+
+        See HeyCafeClient.stream.
+        """
+        return self._client.stream("get_explore_conversations", params=params, model=Conversation)
+
     def comments(self, **params: str) -> dict:
         """Explore comments."""
         return self._client.get("get_explore_comments", params=params)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from heycafe.models import Conversation
+from heycafe.pagination import DEFAULT_PAGE_SIZE, AsyncPaginator, Paginator, paginate
+from heycafe.polling import AdaptiveInterval, AsyncWatcher, Watcher, watch
 from heycafe.resources.base import BaseResource
 
 
 class FeedResource(BaseResource):
     """Feed endpoints. get_feed_conversations requires API key for personalized feed."""
 
+    __slots__ = ()
+
     def conversations(
         self,
         start: int | None = None,
@@ -43,6 +48,77 @@ class FeedResource(BaseResource):
             use_session=True,
         )
 
+    def iter_conversations(
+        self,
+        rule: str | None = None,
+        cafe: str | None = None,
+        account: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 2,
+        limit: int | None = None,
+    ) -> Paginator | AsyncPaginator:
+        """
+        Iterate all feed conversations, fetching pages ahead in the background.
+
+        Returns a Paginator (AsyncPaginator with the async client). See conversations().
+        """
+        params = {"rule": rule, "cafe": cafe, "account": account}
+        return paginate(
+            self._client,
+            "get_feed_conversations",
+            {k: v for k, v in params.items() if v},
+            items_key="conversations",
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            use_api_key=True,
+            use_session=True,
+            model=Conversation,
+        )
+
+    def watch(
+        self,
+        rule: str | None = None,
+        cafe: str | None = None,
+        account: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        max_pages: int = 5,
+        include_existing: bool = False,
+        max_polls: int | None = None,
+    ) -> Watcher | AsyncWatcher:
+        """
+        Follow the feed: poll it and yield each new conversation once, oldest first.
+
+        Returns a Watcher (AsyncWatcher with the async client); iterate it with
+        ``for`` / ``async for``. Polls back off towards ``max_interval`` while the
+        feed is idle and tighten towards ``min_interval`` while it is busy. See
+        conversations() for the filters.
+
+        :param page_size: Conversations requested per poll page
+        :param min_interval: Shortest delay between polls, in seconds
+        :param max_interval: Longest delay between polls, in seconds
+        :param max_pages: Pages read per poll when a burst overflows the first page
+        :param include_existing: Also yield the conversations already in the feed
+        :param max_polls: Stop after this many polls (default: never)
+        """
+        params = {"rule": rule, "cafe": cafe, "account": account}
+        return watch(
+            self._client,
+            "get_feed_conversations",
+            {k: v for k, v in params.items() if v},
+            use_api_key=True,
+            use_session=True,
+            model=Conversation,
+            items_key="conversations",
+            page_size=page_size,
+            interval=AdaptiveInterval(min_interval, max_interval),
+            max_pages=max_pages,
+            include_existing=include_existing,
+            max_polls=max_polls,
+        )
+
     def tags(self, **params: str) -> dict:
         """Get feed tags. Requires API key or session."""
         return self._client.get(
@@ -8,6 +8,8 @@ from heycafe.resources.base import BaseResource
 class SearchResource(BaseResource):
     """Search endpoints. Public."""
 
+    __slots__ = ()
+
     def accounts(self, query: str, **params: str) -> dict:
         """Search accounts."""
         return self._client.get("get_search_accounts", params={"query": query, **params})
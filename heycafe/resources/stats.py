@@ -2,12 +2,101 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
 from heycafe.resources.base import BaseResource
 
+#: Every stats metric; each maps to the get_stats_<name> endpoint and a method of the same name.
+METRICS: tuple[str, ...] = (
+    "accounts",
+    "accounts_pro",
+    "accounts_verified",
+    "accounts_today",
+    "accounts_week",
+    "accounts_month",
+    "accounts_type_person",
+    "accounts_type_business",
+    "accounts_type_robot",
+    "accounts_type_creator",
+    "accounts_type_news",
+    "accounts_status_active",
+    "accounts_status_banned",
+    "accounts_status_deleted",
+    "accounts_follows",
+    "accounts_notifications",
+    "accounts_subs",
+    "accounts_online",
+    "accounts_online_today",
+    "accounts_online_week",
+    "accounts_online_month",
+    "accounts_tags",
+    "chats",
+    "chats_messages",
+    "chats_messages_today",
+    "chats_messages_week",
+    "chats_messages_month",
+    "cafes",
+    "cafes_members",
+    "cafes_tags",
+    "cafes_conversations",
+    "conversations",
+    "conversations_tagged",
+    "conversations_reactions",
+    "conversations_today",
+    "conversations_week",
+    "conversations_month",
+    "comments",
+    "comments_reactions",
+    "comments_today",
+    "comments_week",
+    "comments_month",
+)
+
+
+@dataclass
+class MetricResult:
+    """Outcome of fetching one stats metric."""
+
+    name: str
+    endpoint: str
+    value: Any = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class StatsSnapshot:
+    """Merged result of StatsResource.snapshot(); one MetricResult per metric."""
+
+    metrics: dict[str, MetricResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.metrics[name].value
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """Values of the metrics that were fetched successfully."""
+        return {name: r.value for name, r in self.metrics.items() if r.ok}
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Exceptions of the metrics that failed."""
+        return {name: r.error for name, r in self.metrics.items() if r.error is not None}
+
 
 class StatsResource(BaseResource):
     """Platform statistics. All public."""
 
+    __slots__ = ()
+
     def _get(self, endpoint: str, params: dict | None = None) -> dict:
         return self._client.get(endpoint, params=params or {})
 
@@ -136,3 +225,64 @@ class StatsResource(BaseResource):
 
     def comments_month(self) -> dict:
         return self._get("get_stats_comments_month")
+
+    def snapshot(self, metrics: list[str] | None = None, max_workers: int = 8) -> StatsSnapshot:
+        """
+        Fetch many stats metrics concurrently and merge them into one StatsSnapshot.
+
+        A failing metric is recorded in its MetricResult.error and does not fail
+        the snapshot. With the async client this returns an awaitable.
+
+        :param metrics: Metric names from METRICS (default: all of them)
+        :param max_workers: Maximum concurrent requests
+        """
+        names = self._metric_names(metrics)
+        if getattr(self._client, "is_async", False):
+            return self._asnapshot(names, max_workers)  # type: ignore[return-value]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(names) or 1)),
+            thread_name_prefix="heycafe-stats",
+        ) as executor:
+            results = list(executor.map(self._fetch_metric, names))
+        return StatsSnapshot({r.name: r for r in results}, time.perf_counter() - started)
+
+    async def _asnapshot(self, names: list[str], max_workers: int) -> StatsSnapshot:
+        import asyncio
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(name: str) -> MetricResult:
+            result = MetricResult(name, f"get_stats_{name}")
+            async with semaphore:
+                t0 = time.perf_counter()
+                try:
+                    result.value = await self._get(result.endpoint)  # type: ignore[misc]
+                except Exception as e:
+                    result.error = e
+                result.elapsed = time.perf_counter() - t0
+            return result
+
+        results = await asyncio.gather(*(fetch(name) for name in names))
+        return StatsSnapshot({r.name: r for r in results}, time.perf_counter() - started)
+
+    def _fetch_metric(self, name: str) -> MetricResult:
+        result = MetricResult(name, f"get_stats_{name}")
+        t0 = time.perf_counter()
+        try:
+            result.value = self._get(result.endpoint)
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.perf_counter() - t0
+        return result
+
+    @staticmethod
+    def _metric_names(metrics: list[str] | None) -> list[str]:
+        if metrics is None:
+            return list(METRICS)
+        unknown = [m for m in metrics if m not in METRICS]
+        if unknown:
+            raise ValueError(f"Unknown stats metrics: {', '.join(unknown)}")
+        return list(dict.fromkeys(metrics))
@@ -10,6 +10,8 @@ from heycafe.resources.base import BaseResource
 class SystemResource(BaseResource):
     """System and utility endpoints. No API key required."""
 
+    __slots__ = ()
+
     def hello(self) -> str:
         """Ping the API. Returns 'hello'."""
         return cast(str, self._client.get("get_system_hello"))
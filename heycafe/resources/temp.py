@@ -2,16 +2,80 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from heycafe.multipart import FilePart, Progress, UploadSource, upload_many
 from heycafe.resources.base import BaseResource
 
 
 class TempResource(BaseResource):
     """Temporary file and preview. post_temp_file typically requires API key."""
 
+    __slots__ = ()
+
     def file(self, **data: str) -> dict:
         """Upload a temp file. Returns file id for post_conversation_create. Requires API key."""
         return self._client.post("post_temp_file", data=data, use_api_key=True)
 
+    def upload(
+        self,
+        source: UploadSource,
+        filename: str | None = None,
+        content_type: str | None = None,
+        field: str = "file",
+        progress: Progress | None = None,
+        **data: str,
+    ) -> dict:
+        """
+        Upload a temp file as a streamed multipart body. Requires API key.
+
+        The file is read a chunk at a time while it is sent, so memory use does
+        not grow with its size. Returns the file id for post_conversation_create.
+
+        :param source: Path, binary file object or buffer such as an ``mmap``
+        :param filename: Name sent for the file (default: taken from the source)
+        :param content_type: MIME type (default: guessed from the filename)
+        :param field: Form field holding the file
+        :param progress: Called with (bytes sent, total bytes) as the upload advances
+        :param data: Extra form fields
+        """
+        part = FilePart(source, filename, content_type)
+        return self._client.upload("post_temp_file", {field: part}, data=data, progress=progress)
+
+    def upload_many(
+        self,
+        sources: Iterable[UploadSource | FilePart],
+        field: str = "file",
+        max_workers: int = 4,
+        progress: Callable[[int, int, int], None] | None = None,
+        **data: str,
+    ) -> Any:
+        """
+        Upload several temp files concurrently, one streamed request each.
+
+        Use it to prepare the attachments of a post before
+        ``conversation.create``. Requires API key.
+
+        :param sources: Paths, file objects, buffers or FileParts
+        :param field: Form field holding each file
+        :param max_workers: Maximum concurrent uploads
+        :param progress: Called with (file index, bytes sent, total bytes)
+        :param data: Extra form fields sent with every file
+        :return: One entry per file, in input order: its response, or the
+            exception its upload raised
+        """
+        parts = [s if isinstance(s, FilePart) else FilePart(s) for s in sources]
+        return upload_many(
+            self._client,
+            "post_temp_file",
+            parts,
+            field=field,
+            data=data,
+            max_workers=max_workers,
+            progress=progress,
+        )
+
     def preview(self, **data: str) -> dict:
         """Create a preview. Requires API key."""
         return self._client.post("post_temp_preview", data=data, use_api_key=True)
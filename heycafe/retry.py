@@ -0,0 +1,245 @@
+"""Retry policy with backoff and retry budget, and a per-host circuit breaker."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from heycafe.exceptions import APIError, CircuitOpenError, RateLimitError
+
+#: HTTP statuses treated as transient.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient(exc: BaseException, transport_errors: tuple[type[BaseException], ...]) -> bool:
+    """True for connection-level errors and API errors with a transient HTTP status."""
+    if isinstance(exc, transport_errors):
+        return True
+    return isinstance(exc, APIError) and exc.status_code in RETRY_STATUSES
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent requests so retries cannot amplify load.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``) and every
+    retry withdraws one. ``min_tokens`` retries are always allowed at start.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+@dataclass
+class RetryStats:
+    """Counters for a RetryPolicy."""
+
+    #: Requests made under the policy
+    requests: int = 0
+    #: Retries performed
+    retries: int = 0
+    #: Requests that failed after using all attempts
+    exhausted: int = 0
+    #: Retries refused because the budget was empty
+    budget_denied: int = 0
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with exponential backoff and full jitter.
+
+    Only GET requests and endpoints listed in ``idempotent_endpoints`` are
+    retried. A 429 waits at least the server's Retry-After delay.
+
+    Example:
+        client = HeyCafe(retry_policy=RetryPolicy(max_attempts=5))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        idempotent_endpoints: Iterable[str] = (),
+        budget: RetryBudget | None = None,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        :param max_attempts: Total attempts per request, including the first
+        :param backoff_base: Backoff cap for the first retry, doubled on each retry
+        :param backoff_max: Upper bound on a single backoff
+        :param idempotent_endpoints: POST endpoints that are safe to retry
+        :param budget: RetryBudget shared by all requests (default: 10% of requests)
+        :param max_retry_after: Longest Retry-After delay waited before a retry;
+            longer ones are clamped to it
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+        self.budget = budget if budget is not None else RetryBudget()
+        self._stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def is_retryable(self, method: str, endpoint: str) -> bool:
+        return method.upper() == "GET" or endpoint in self.idempotent_endpoints
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number ``attempt`` (1-based)."""
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)  # nosec B311 - jitter, not cryptography
+
+    def on_request(self) -> None:
+        self.budget.deposit()
+        with self._lock:
+            self._stats.requests += 1
+
+    def next_delay(
+        self,
+        exc: BaseException,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        transport_errors: tuple[type[BaseException], ...] = (),
+    ) -> float | None:
+        """
+        Decide whether to retry after ``attempt`` failed attempts.
+
+        :return: Seconds to sleep before retrying, or None to give up
+        """
+        if not self.is_retryable(method, endpoint) or not is_transient(exc, transport_errors):
+            return None
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self._stats.exhausted += 1
+            return None
+        if not self.budget.withdraw():
+            with self._lock:
+                self._stats.budget_denied += 1
+            return None
+        with self._lock:
+            self._stats.retries += 1
+        return self.wait_for(exc, self.backoff(attempt))
+
+    def wait_for(self, exc: BaseException, delay: float) -> float:
+        """Raise a backoff ``delay`` to a 429's Retry-After, capped at ``max_retry_after``."""
+        if isinstance(exc, RateLimitError) and exc.retry_after:
+            delay = max(delay, min(exc.retry_after, self.max_retry_after))
+        return delay
+
+    @property
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(**vars(self._stats))
+
+
+@dataclass
+class CircuitState:
+    """State of one host's circuit."""
+
+    #: "closed" (normal), "open" (failing fast) or "half_open" (probing)
+    state: str = "closed"
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    #: Requests rejected while the circuit was open
+    rejected: int = 0
+    #: Times the circuit has opened
+    trips: int = 0
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After ``failure_threshold`` consecutive transient failures to a host, its
+    circuit opens and requests fail fast with CircuitOpenError. After
+    ``recovery_timeout`` seconds one probe request is let through; its success
+    closes the circuit, its failure opens it again. A probe that ends without
+    an outcome (e.g. cancelled) is released, which also reopens the circuit,
+    so another probe is let through after ``recovery_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._hosts: dict[str, CircuitState] = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str) -> None:
+        """Raise CircuitOpenError if requests to ``host`` should fail fast."""
+        with self._lock:
+            st = self._hosts.setdefault(host, CircuitState())
+            if st.state == "closed":
+                return
+            remaining = st.opened_at + self.recovery_timeout - time.monotonic()
+            if st.state == "open" and remaining <= 0:
+                st.state = "half_open"
+                return
+            st.rejected += 1
+            raise CircuitOpenError(
+                f"Circuit open for {host}; failing fast", retry_in=max(0.0, remaining)
+            )
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            st = self._hosts.setdefault(host, CircuitState())
+            st.state = "closed"
+            st.consecutive_failures = 0
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            st = self._hosts.setdefault(host, CircuitState())
+            st.consecutive_failures += 1
+            if st.state == "half_open" or (
+                st.state == "closed" and st.consecutive_failures >= self.failure_threshold
+            ):
+                st.state = "open"
+                st.opened_at = time.monotonic()
+                st.trips += 1
+
+    def release(self, host: str) -> None:
+        """
+        End a request that stopped without an outcome, e.g. one that was cancelled.
+
+        If it was the half-open probe, the circuit opens again without counting
+        a failure; otherwise no later request would ever be let through.
+        """
+        with self._lock:
+            st = self._hosts.get(host)
+            if st is not None and st.state == "half_open":
+                st.state = "open"
+                st.opened_at = time.monotonic()
+
+    def state(self, host: str) -> CircuitState:
+        """Snapshot of one host's circuit."""
+        with self._lock:
+            return CircuitState(**vars(self._hosts.get(host, CircuitState())))
+
+    def snapshot(self) -> dict[str, CircuitState]:
+        """Snapshot of every known host's circuit."""
+        with self._lock:
+            return {host: CircuitState(**vars(st)) for host, st in self._hosts.items()}
@@ -0,0 +1,132 @@
+"""Single-flight coalescing of identical concurrent requests."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    #: Calls made through the group
+    calls: int = 0
+    #: Calls that actually ran (one per burst of identical calls)
+    executions: int = 0
+    #: Calls that shared another call's result instead of running
+    collapsed: int = 0
+    #: Keys currently running
+    in_flight: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group.
+
+    While a call for a key is running, other callers with the same key wait for
+    it and receive its result or exception instead of starting their own.
+
+    Example:
+        group = SingleFlight()
+        group.do(("get_account_info", "hey"), lambda: fetch("hey"))
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats = SingleFlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn() unless a call for key is already running; then share its outcome."""
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats.executions += 1
+            else:
+                self._stats.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                self._stats.calls,
+                self._stats.executions,
+                self._stats.collapsed,
+                len(self._calls),
+            )
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines running on one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn() unless a call for key is already running; then share its outcome."""
+        import asyncio  # imported here so sync-only users never load asyncio
+
+        self._stats.calls += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self._stats.collapsed += 1
+            # shield: a cancelled follower must not cancel the shared call.
+            return await asyncio.shield(future)
+
+        self._stats.executions += 1
+        future = asyncio.ensure_future(fn())
+        self._calls[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done() and self._calls.get(key) is future:
+                del self._calls[key]
+            elif not future.done():
+                future.add_done_callback(lambda _: self._calls.pop(key, None))
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            self._stats.calls,
+            self._stats.executions,
+            self._stats.collapsed,
+            len(self._calls),
+        )
@@ -0,0 +1,304 @@
+"""SQLite-backed response cache that survives process restarts."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+from heycafe.cache import DEFAULT_TTLS, CacheBackend, CacheKey, CacheStats, params_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    params TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO usage (id, entries, bytes)
+    SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+    UPDATE usage SET entries = entries + 1, bytes = bytes + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+    UPDATE usage SET entries = entries - 1, bytes = bytes - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_resize AFTER UPDATE OF size ON responses BEGIN
+    UPDATE usage SET bytes = bytes + new.size - old.size;
+END;
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent response cache stored in one SQLite file.
+
+    Bodies are stored as zlib-compressed JSON with a wall-clock expiry, so
+    entries survive restarts. Expired entries that carry an ETag or
+    Last-Modified are kept and revalidated with a conditional request. The
+    database runs in WAL mode, so several processes on one host can share the
+    file. When the total stored size exceeds ``max_bytes``, the least recently
+    used entries are deleted.
+
+    The entry count and total size are kept in a one-row table by triggers, so
+    neither lookups nor stores scan the table. Hits do not write: their access
+    times are buffered and written ``touch_batch`` at a time (and before an
+    eviction or on close), so LRU order between processes is approximate.
+
+    Every call does blocking file I/O. ``AsyncHeyCafeClient`` runs them in a
+    worker thread (see ``blocking``) so the event loop is not stalled.
+
+    Example:
+        client = HeyCafe(cache=SQLiteCache("~/.cache/heycafe.sqlite3"))
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float | None = None,
+        compress_level: int = 6,
+        busy_timeout: float = 30.0,
+        touch_batch: int = 64,
+    ):
+        """
+        :param path: SQLite database file (created if missing)
+        :param max_bytes: Cap on the total compressed size of stored bodies
+        :param ttls: Per-endpoint TTLs in seconds, merged over DEFAULT_TTLS
+        :param default_ttl: TTL for GET endpoints not in ``ttls`` (None: don't cache them)
+        :param compress_level: zlib level for stored bodies (0-9)
+        :param busy_timeout: Seconds to wait for a lock held by another process
+        :param touch_batch: Hits whose access time is buffered before one batched write
+        """
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self.busy_timeout = busy_timeout
+        self.touch_batch = max(1, touch_batch)
+        self._local = threading.local()
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._touched: dict[str, float] = {}
+        # One transaction, so the usage row is seeded and its triggers created together.
+        self._conn().executescript(f"BEGIN IMMEDIATE;{_SCHEMA}COMMIT;")
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite handles locking between processes."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(key: CacheKey) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def _count(self, attr: str, n: int = 1) -> None:
+        with self._counter_lock:
+            setattr(self, attr, getattr(self, attr) + n)
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (hit, value) for a fresh entry. Stale entries stay for revalidation."""
+        now = time.time()
+        row_key = self._key(key)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = ?", (row_key,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            self._count("_misses")
+            return False, None
+        with self._counter_lock:
+            self._hits += 1
+            self._touched[row_key] = now
+            flush = len(self._touched) >= self.touch_batch
+        if flush:
+            self._flush_touched(conn)
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write the buffered access times of hits in one transaction."""
+        with self._counter_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            with conn:
+                conn.executemany(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ? AND accessed_at < ?",
+                    [(at, row_key, at) for row_key, at in touched.items()],
+                )
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        ttl: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a value with optional validators for later revalidation."""
+        ttl = self.ttl_for(key[0]) if ttl is None else ttl
+        if not ttl:
+            return
+        body = zlib.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8"), self.compress_level
+        )
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            # An upsert rather than INSERT OR REPLACE: REPLACE's implicit delete
+            # does not fire the trigger that keeps the usage row in step.
+            conn.execute(
+                "INSERT INTO responses (key, endpoint, identity, params, body, size,"
+                " expires_at, accessed_at, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET body = excluded.body, size = excluded.size,"
+                " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at,"
+                " etag = excluded.etag, last_modified = excluded.last_modified",
+                (
+                    self._key(key),
+                    key[0],
+                    key[2],
+                    json.dumps(key[1]),
+                    body,
+                    len(body),
+                    now + ttl,
+                    now,
+                    etag,
+                    last_modified,
+                ),
+            )
+        if self._usage(conn)[1] > self.max_bytes:
+            self._evict(conn, now)
+
+    @staticmethod
+    def _usage(conn: sqlite3.Connection) -> tuple[int, int]:
+        """(entries, total body bytes), kept up to date by triggers."""
+        entries, total = conn.execute("SELECT entries, bytes FROM usage").fetchone()
+        return int(entries), int(total)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop unrevalidatable expired entries, then LRU entries until under max_bytes."""
+        self._flush_touched(conn)
+        with conn:
+            conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL"
+                " AND last_modified IS NULL",
+                (now,),
+            )
+            total = self._usage(conn)[1]
+            doomed = []
+            # Walks the accessed_at index and stops as soon as enough is freed.
+            for row_key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ):
+                if total <= self.max_bytes:
+                    break
+                doomed.append((row_key,))
+                total -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._count("_evictions", len(doomed))
+
+    def validators(self, key: CacheKey) -> dict[str, str]:
+        row = (
+            self._conn()
+            .execute("SELECT etag, last_modified FROM responses WHERE key = ?", (self._key(key),))
+            .fetchone()
+        )
+        headers: dict[str, str] = {}
+        if row is not None:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def refresh(self, key: CacheKey, ttl: float | None = None) -> tuple[bool, Any]:
+        ttl = self.ttl_for(key[0]) if ttl is None else ttl
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + (ttl or 0), now, self._key(key)),
+            )
+            row = conn.execute(
+                "SELECT body FROM responses WHERE key = ?", (self._key(key),)
+            ).fetchone()
+        if row is None:
+            return False, None
+        self._count("_hits")
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def invalidate(
+        self,
+        endpoint: str | None = None,
+        params: dict[str, Any] | None = None,
+        identity: str | None = None,
+    ) -> int:
+        """Drop matching entries; with no arguments the whole cache is cleared."""
+        clauses, args = [], []
+        if endpoint is not None:
+            clauses.append("endpoint = ?")
+            args.append(endpoint)
+        if params is not None:
+            clauses.append("params = ?")
+            args.append(json.dumps(params_key(params)))
+        if identity is not None:
+            clauses.append("identity = ?")
+            args.append(identity)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(f"DELETE FROM responses{where}", args)  # nosec B608
+        return cur.rowcount
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM responses")
+        with self._counter_lock:
+            self._hits = self._misses = self._evictions = 0
+            self._touched.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, self._usage(self._conn())[0])
+
+    def close(self) -> None:
+        """Write buffered access times and close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._flush_touched(conn)
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return int(self.stats.size)
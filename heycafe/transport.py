@@ -0,0 +1,568 @@
+"""
+Pluggable HTTP transports for the sync client.
+
+Each transport imports its HTTP library when it is created, so a process
+only pays for the library it uses.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Union
+from urllib.parse import urlencode
+
+from heycafe.jsonstream import DEFAULT_CHUNK_SIZE
+from heycafe.pool import (
+    DEFAULT_POOL_MAXSIZE,
+    PoolStats,
+    httpx_pool_stats,
+    mount_pool,
+    requests_pool_stats,
+    urllib3_pool_stats,
+)
+
+if TYPE_CHECKING:
+    import requests
+    import urllib3
+
+    from heycafe.multipart import MultipartBody
+
+
+class Response:
+    """Minimal response for transports whose HTTP library has no suitable type."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code: int, content: bytes = b"", headers: Any = None):
+        """
+        :param status_code: HTTP status
+        :param content: Raw body
+        :param headers: Case-insensitive mapping of response headers
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else _headers({})
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class StreamedResponse:
+    """A response whose body is read from the connection chunk by chunk."""
+
+    __slots__ = ("status_code", "headers", "_chunks", "_close")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Any,
+        chunks: Iterable[bytes],
+        close: Callable[[], None] | None = None,
+    ):
+        """
+        :param status_code: HTTP status
+        :param headers: Case-insensitive mapping of response headers
+        :param chunks: The body, in order
+        :param close: Releases the connection; called by ``close``
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self._chunks = chunks
+        self._close = close
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        return iter(self._chunks)
+
+    def read(self) -> bytes:
+        return b"".join(self._chunks)
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+
+
+def _split(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start : start + chunk_size]
+
+
+class Transport(ABC):
+    """
+    Interface between HeyCafeClient and an HTTP library.
+
+    ``send`` performs one request and returns a response exposing
+    ``status_code``, case-insensitive ``headers``, ``content`` and ``json()``.
+    ``stream`` returns a StreamedResponse instead, for bodies too large to
+    buffer. ``upload`` sends a MultipartBody chunk by chunk. Caching, retries,
+    rate limiting and error mapping stay in the client, so a transport only
+    moves bytes.
+    """
+
+    #: Connection-level exceptions raised by ``send``; retried as transient.
+    errors: tuple[type[BaseException], ...] = ()
+
+    @abstractmethod
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Any:
+        """Send one request; ``data`` is form-encoded into the body when non-empty."""
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StreamedResponse:
+        """
+        Send one request without buffering the response body.
+
+        The default implementation buffers it through ``send``; transports over
+        a streaming-capable library override this.
+        """
+        resp = self.send(method, url, params, data, headers, timeout)
+        return StreamedResponse(resp.status_code, resp.headers, _split(resp.content, chunk_size))
+
+    @abstractmethod
+    def upload(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        body: MultipartBody,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Any:
+        """
+        Send one request whose body is read from ``body`` as it is sent.
+
+        ``headers`` already carry its Content-Type and Content-Length.
+        """
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection-pool utilisation per host."""
+        return PoolStats(maxsize=None, block=False, http2=False)
+
+    def close(self) -> None:
+        """Release pooled connections."""
+
+
+class RequestsTransport(Transport):
+    """Transport over a ``requests.Session`` (the default)."""
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ):
+        """
+        :param session: Session to use as-is; the pool_* options are then ignored
+        :param pool_connections: Number of hosts whose pools are kept
+        :param pool_maxsize: Connections kept alive per host
+        :param pool_block: If True, wait for a free connection when the pool is exhausted
+
+        There is no keep-alive timeout to set: urllib3 keeps an idle connection
+        until the server closes it, and replaces a closed one when it is next used.
+        """
+        import requests
+
+        if session is None:
+            session = requests.Session()
+            mount_pool(session, pool_connections, pool_maxsize, pool_block)
+        self.session = session
+        self.errors = (requests.ConnectionError, requests.Timeout)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> requests.Response:
+        return self.session.request(
+            method,
+            url,
+            params=params,
+            data=data if data else None,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StreamedResponse:
+        resp = self.session.request(
+            method,
+            url,
+            params=params,
+            data=data if data else None,
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
+        return StreamedResponse(
+            resp.status_code, resp.headers, resp.iter_content(chunk_size), resp.close
+        )
+
+    def upload(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        body: MultipartBody,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> requests.Response:
+        # requests streams any iterable body; len() gives it the Content-Length.
+        return self.session.request(
+            method, url, params=params, data=body, headers=headers, timeout=timeout
+        )
+
+    def pool_stats(self) -> PoolStats:
+        return requests_pool_stats(self.session)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport straight on a ``urllib3.PoolManager``.
+
+    Skips the requests layers (hooks, cookies, redirects, environment
+    proxies), which is a noticeable share of the cost of small JSON calls.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_POOL_MAXSIZE,
+        block: bool = False,
+        num_pools: int = 10,
+        pool_manager: urllib3.PoolManager | None = None,
+    ):
+        """
+        :param maxsize: Connections kept alive per host
+        :param block: If True, wait for a free connection when the pool is exhausted
+        :param num_pools: Number of hosts whose pools are kept
+        :param pool_manager: PoolManager to use as-is instead of the options above
+        """
+        import urllib3
+
+        self.maxsize = maxsize if pool_manager is None else None
+        self.block = block
+        self.pool = pool_manager or urllib3.PoolManager(
+            num_pools=num_pools, maxsize=maxsize, block=block
+        )
+        self._default_headers = urllib3.util.make_headers(accept_encoding=True)
+        self.errors = (urllib3.exceptions.HTTPError,)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Response:
+        resp = self._request(method, url, params, data, headers, timeout, preload=True)
+        return Response(resp.status, resp.data, resp.headers)
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StreamedResponse:
+        resp = self._request(method, url, params, data, headers, timeout, preload=False)
+        # A fully read response has already gone back to the pool; close() only
+        # drops the connection when the body was abandoned halfway.
+        return StreamedResponse(resp.status, resp.headers, resp.stream(chunk_size), resp.close)
+
+    def upload(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        body: MultipartBody,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Response:
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        resp = self.pool.request(
+            method,
+            url,
+            body=iter(body),
+            headers={**self._default_headers, **headers},
+            timeout=timeout,
+            retries=False,
+        )
+        return Response(resp.status, resp.data, resp.headers)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+        preload: bool,
+    ) -> urllib3.BaseHTTPResponse:
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        headers = {**self._default_headers, **headers}
+        body = None
+        if data:
+            body = urlencode(data)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return self.pool.request(
+            method,
+            url,
+            body=body,
+            headers=headers,
+            timeout=timeout,
+            retries=False,
+            preload_content=preload,
+        )
+
+    def pool_stats(self) -> PoolStats:
+        return urllib3_pool_stats(self.pool, self.maxsize, self.block)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+class HttpxTransport(Transport):
+    """Transport over a sync ``httpx.Client``, optionally multiplexed over HTTP/2."""
+
+    def __init__(
+        self,
+        client: Any = None,
+        http2: bool = False,
+        maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_expiry: float | None = 5.0,
+    ):
+        """
+        :param client: httpx.Client to use as-is instead of the options below
+        :param http2: If True, share one HTTP/2 connection per host (requires ``heycafe[http2]``)
+        :param maxsize: Maximum number of connections
+        :param keepalive_expiry: Seconds an idle connection is kept before closing it
+        """
+        extra = "http2" if http2 else "async"
+        try:
+            import httpx
+
+            if client is None:
+                client = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=maxsize,
+                        max_keepalive_connections=maxsize,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                )
+        except ImportError as e:
+            raise ImportError(
+                f"HttpxTransport requires httpx. Install it with: pip install 'heycafe[{extra}]'"
+            ) from e
+        self.client = client
+        self.http2 = http2
+        self.maxsize = maxsize
+        self.errors = (httpx.TransportError,)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Any:
+        return self.client.request(
+            method,
+            url,
+            params=params,
+            data=data if data else None,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StreamedResponse:
+        request = self.client.build_request(
+            method,
+            url,
+            params=params,
+            data=data if data else None,
+            headers=headers,
+            timeout=timeout,
+        )
+        resp = self.client.send(request, stream=True)
+        return StreamedResponse(
+            resp.status_code, resp.headers, resp.iter_bytes(chunk_size), resp.close
+        )
+
+    def upload(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        body: MultipartBody,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Any:
+        # The Content-Length header stops httpx from using chunked encoding.
+        return self.client.request(
+            method, url, params=params, content=body, headers=headers, timeout=timeout
+        )
+
+    def pool_stats(self) -> PoolStats:
+        return httpx_pool_stats(self.client, self.maxsize, self.http2)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+@dataclass
+class MockRequest:
+    """A request recorded by MockTransport."""
+
+    method: str
+    endpoint: str
+    params: dict[str, str]
+    data: dict[str, str]
+    headers: dict[str, str] = field(default_factory=dict)
+    #: Raw body of an upload
+    body: bytes = b""
+
+
+MockHandler = Callable[[MockRequest], Union[Response, tuple, Any]]
+
+
+class MockTransport(Transport):
+    """
+    In-process transport for tests: nothing touches the network.
+
+    Register responses per endpoint with ``add``; they are served in order and
+    the last one repeats. A ``handler`` can compute responses instead. Every
+    request is recorded in ``requests``.
+
+    Example:
+        mock = MockTransport()
+        mock.add("get_system_hello", {"system_api_error": False, "response_data": "hi"})
+        client = HeyCafe(transport=mock)
+    """
+
+    def __init__(self, handler: MockHandler | None = None):
+        """
+        :param handler: Called with each MockRequest; returns a Response, a
+            (status, body) tuple or a body served with status 200
+        """
+        self.handler = handler
+        self.routes: dict[str, list[Response]] = {}
+        self.requests: list[MockRequest] = []
+
+    def add(
+        self,
+        endpoint: str,
+        body: Any = None,
+        status: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Queue a response for ``endpoint``; ``body`` is JSON-encoded unless it is bytes."""
+        self.routes.setdefault(endpoint, []).append(_mock_response(status, body, headers))
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        data: dict[str, str],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Response:
+        request = MockRequest(method.upper(), url.rsplit("/", 1)[-1], params, data, headers)
+        return self._respond(request)
+
+    def upload(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, str],
+        body: MultipartBody,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Response:
+        endpoint = url.rsplit("/", 1)[-1]
+        content = b"".join(body)
+        return self._respond(
+            MockRequest(method.upper(), endpoint, params, body.fields, headers, content)
+        )
+
+    def _respond(self, request: MockRequest) -> Response:
+        self.requests.append(request)
+        if self.handler is not None:
+            result = self.handler(request)
+            if isinstance(result, Response):
+                return result
+            if isinstance(result, tuple):
+                return _mock_response(*result)
+            return _mock_response(200, result)
+        queue = self.routes.get(request.endpoint)
+        if not queue:
+            raise LookupError(f"No mock response registered for {request.endpoint}")
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+def _mock_response(status: int, body: Any, headers: Mapping[str, str] | None = None) -> Response:
+    content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    return Response(status, content, _headers(headers or {}))
+
+
+def _headers(headers: Mapping[str, str]) -> Any:
+    """Case-insensitive copy of ``headers``, like the ones real transports return."""
+    from requests.structures import CaseInsensitiveDict
+
+    return CaseInsensitiveDict(headers)
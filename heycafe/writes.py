@@ -0,0 +1,406 @@
+"""
+Bulk writes: send many posts with bounded concurrency.
+
+A WritePipeline takes an iterable (or queue) of Write specs and yields one
+WriteResult per write as it completes. Up to ``max_workers`` writes are in
+flight at once. Every request goes through the client, so the client's rate
+limiter and circuit breaker apply to the whole pipeline.
+
+Each write carries a client-generated idempotency token. It is sent in the
+Idempotency-Key header, and the tokens of completed writes are recorded in
+a ledger. Resubmitting the same writes after a crash or a partial failure
+skips writes recorded as completed in the ledger (or already in flight).
+Failed attempts are only retried when the API refused the request (HTTP 429
+or 503, or an open circuit breaker) and so cannot have applied it.
+
+This does not make writes exactly-once. After an ambiguous failure (a
+timeout, a connection reset) the post may or may not have been applied, and
+the write is not recorded, so resubmitting it can create a duplicate. The
+Idempotency-Key header gives no guarantee either: nothing says the API
+deduplicates on it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, MutableMapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from heycafe.exceptions import APIError, CircuitOpenError
+from heycafe.resources.conversation import create_data
+from heycafe.retry import RetryPolicy
+
+#: Header carrying a write's idempotency token.
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+#: Statuses that mean the API refused a request without applying it.
+REFUSED_STATUSES = frozenset({429, 503})
+
+
+def new_token() -> str:
+    """A random idempotency token."""
+    return uuid.uuid4().hex
+
+
+def created_id(response: Any) -> str:
+    """
+    Id of the item a create call returned.
+
+    :raises APIError: If the response holds no ``id``, at the top level or one level down
+    """
+    if isinstance(response, dict):
+        candidates = [response, *(v for v in response.values() if isinstance(v, dict))]
+        for candidate in candidates:
+            if candidate.get("id"):
+                return str(candidate["id"])
+    raise APIError("Create response holds no id to publish", response_data=response)
+
+
+@dataclass
+class Write:
+    """One write for a WritePipeline: a POST, optionally followed by a publish call."""
+
+    endpoint: str
+    data: dict[str, Any]
+    #: Idempotency token; keep it when resubmitting the same write
+    token: str = field(default_factory=new_token)
+    #: Endpoint called with ``{"query": <created id>}`` after the first call succeeds
+    publish: str | None = None
+
+    @classmethod
+    def conversation(
+        cls,
+        cafe: str,
+        content: str | None = None,
+        content_raw: str | None = None,
+        file: str | None = None,
+        image_url: str | None = None,
+        alt: str | None = None,
+        draft: bool = False,
+        stage: bool = False,
+        token: str | None = None,
+    ) -> Write:
+        """
+        A new conversation; arguments as for ConversationResource.create.
+
+        By default a published conversation takes one request: it is created
+        published rather than as a draft that is then published. With
+        ``stage=True`` it is created as a draft and published as soon as the draft
+        exists, for content the API must process before publishing.
+
+        :param draft: Leave the conversation as an unpublished draft
+        :param stage: Create a draft first and then publish it (two requests)
+        :param token: Idempotency token (default: a new random one)
+        """
+        data = create_data(cafe, content, content_raw, file, image_url, alt, draft or stage)
+        publish = "post_conversation_publish" if stage and not draft else None
+        return cls("post_conversation_create", data, token or new_token(), publish)
+
+    @classmethod
+    def publish_draft(cls, query: str, token: str | None = None) -> Write:
+        """Publishing of an existing draft conversation."""
+        return cls("post_conversation_publish", {"query": query}, token or new_token())
+
+    @classmethod
+    def chat_message(cls, chat: str, token: str | None = None, **data: str) -> Write:
+        """A chat message; arguments as for ChatResource.message_create."""
+        return cls("post_chat_message_create", {"query": chat, **data}, token or new_token())
+
+
+@dataclass
+class WriteResult:
+    """Outcome of one write."""
+
+    #: Position of the write in the submitted sequence
+    index: int
+    write: Write
+    #: True if the write was applied (or had been by an earlier run: see skipped)
+    ok: bool
+    #: Response of the last call (the publish call for staged conversations)
+    response: Any = None
+    #: Why the write failed
+    error: BaseException | None = None
+    #: True if the token was already completed or in flight, so nothing was sent
+    skipped: bool = False
+    #: Requests sent for this write, retries included
+    requests: int = 0
+    #: Seconds from the write being started to its result
+    elapsed: float = 0.0
+
+
+@dataclass
+class WriteStats:
+    """Counters for a WritePipeline."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    #: Requests sent, retries included
+    requests: int = 0
+    #: Seconds since the pipeline started its first run
+    elapsed: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """Successful writes per second."""
+        return self.succeeded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _PipelineBase:
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = 4,
+        ledger: MutableMapping[str, Any] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        :param client: HeyCafe / AsyncHeyCafe, or their low-level client
+        :param max_workers: Maximum number of writes in flight at once
+        :param ledger: Token -> response of completed writes. Pass a persistent
+            mapping (e.g. a ``shelve``) to skip completed writes across runs.
+        :param retry_policy: Attempts and backoff for refused requests
+            (default: RetryPolicy(max_attempts=3))
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.client = getattr(client, "client", client)
+        self.max_workers = max_workers
+        self.ledger: MutableMapping[str, Any] = ledger if ledger is not None else {}
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=3)
+        self._inflight: set[str] = set()
+        self._stats = WriteStats()
+        self._started: float | None = None
+        self._lock = threading.Lock()
+
+    def stats(self) -> WriteStats:
+        """Snapshot of the counters, including the current throughput."""
+        with self._lock:
+            snapshot = replace(self._stats)
+        if self._started is not None:
+            snapshot.elapsed = time.monotonic() - self._started
+        return snapshot
+
+    def _start(self) -> None:
+        if self._started is None:
+            self._started = time.monotonic()
+
+    def _claim(self, index: int, write: Write) -> WriteResult | None:
+        """Reserve the write's token; return a skipped result if it is taken."""
+        with self._lock:
+            self._stats.submitted += 1
+            if write.token in self.ledger:
+                self._stats.skipped += 1
+                return WriteResult(index, write, True, self.ledger[write.token], skipped=True)
+            if write.token in self._inflight:
+                self._stats.skipped += 1
+                return WriteResult(index, write, False, skipped=True)
+            self._inflight.add(write.token)
+        return None
+
+    def _finish(self, result: WriteResult, started: float) -> WriteResult:
+        result.elapsed = time.monotonic() - started
+        with self._lock:
+            self._inflight.discard(result.write.token)
+            if result.ok:
+                self.ledger[result.write.token] = result.response
+                self._stats.succeeded += 1
+            else:
+                self._stats.failed += 1
+        return result
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self._stats.requests += 1
+
+    def _retry_delay(self, exc: BaseException, attempt: int) -> float | None:
+        """
+        Seconds to wait before resending after ``attempt`` refused attempts, or None.
+
+        Only refusals are retried. After an ambiguous failure (timeout, connection
+        reset) the post may have been applied, and resending could duplicate it.
+        """
+        refused = isinstance(exc, CircuitOpenError) or (
+            isinstance(exc, APIError) and exc.status_code in REFUSED_STATUSES
+        )
+        if not refused or attempt >= self.retry_policy.max_attempts:
+            return None
+        delay = self.retry_policy.wait_for(exc, self.retry_policy.backoff(attempt))
+        if isinstance(exc, CircuitOpenError):
+            delay = max(delay, exc.retry_in)
+        return delay
+
+    def _draft_key(self, write: Write) -> str:
+        # A staged conversation's draft is recorded on its own, so that a rerun
+        # after a failed publish publishes that draft instead of creating another.
+        return f"{write.token}:draft"
+
+
+class WritePipeline(_PipelineBase):
+    """
+    Send many writes with bounded concurrency; see the module docstring.
+
+    Example:
+        pipeline = WritePipeline(client, max_workers=8)
+        writes = (Write.conversation("python", content_raw=text) for text in texts)
+        for result in pipeline.run(writes):
+            if not result.ok:
+                log.warning("write %s failed: %s", result.write.token, result.error)
+        print(pipeline.stats().per_second)
+    """
+
+    def run(self, writes: Iterable[Write]) -> Iterator[WriteResult]:
+        """
+        Send ``writes`` and yield their results in completion order.
+
+        ``writes`` is consumed lazily, so it may be a generator fed from a queue
+        (e.g. ``iter(queue.get, None)``). Failures are reported in the results,
+        not raised. If iteration stops early, the writes already submitted
+        still run to completion and are recorded in the ledger.
+        """
+        self._start()
+        pending: set[Future[WriteResult]] = set()
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="heycafe-write") as pool:
+            for index, write in enumerate(writes):
+                pending.add(pool.submit(self._execute, index, write))
+                if len(pending) >= 2 * self.max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+    def _execute(self, index: int, write: Write) -> WriteResult:
+        started = time.monotonic()
+        skipped = self._claim(index, write)
+        if skipped is not None:
+            return skipped
+        result = WriteResult(index, write, False)
+        try:
+            with self._lock:
+                response = self.ledger.get(self._draft_key(write))
+            if response is None:
+                response = self._post(result, write.endpoint, write.data, write.token)
+                if write.publish is not None:
+                    with self._lock:
+                        self.ledger[self._draft_key(write)] = response
+            if write.publish is not None:
+                query = {"query": created_id(response)}
+                response = self._post(result, write.publish, query, f"{write.token}:publish")
+            result.ok, result.response = True, response
+        except Exception as exc:
+            result.error = exc
+        return self._finish(result, started)
+
+    def _post(self, result: WriteResult, endpoint: str, data: dict[str, Any], token: str) -> Any:
+        attempt = 0
+        while True:
+            attempt += 1
+            result.requests += 1
+            self._count_request()
+            try:
+                return self.client.post(
+                    endpoint, data=data, use_api_key=True, headers={IDEMPOTENCY_HEADER: token}
+                )
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+
+class AsyncWritePipeline(_PipelineBase):
+    """Async counterpart of :class:`WritePipeline`; writes run as tasks."""
+
+    async def run(
+        self, writes: Iterable[Write] | AsyncIterable[Write]
+    ) -> AsyncIterator[WriteResult]:
+        """
+        Async counterpart of :meth:`WritePipeline.run`; ``writes`` may be async.
+
+        If iteration stops early (``break`` and ``aclose()``, or an error from
+        ``writes``), the writes already started are awaited, not cancelled: a
+        post cut off midway may still have been applied, so each one is left to
+        finish and be recorded in the ledger. Their results are not yielded.
+        """
+        import asyncio
+
+        self._start()
+        pending: set[asyncio.Task[WriteResult]] = set()
+        index = 0
+        try:
+            async for write in _aiter(writes):
+                pending.add(asyncio.ensure_future(self._execute(index, write)))
+                index += 1
+                if len(pending) >= self.max_workers:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _execute(self, index: int, write: Write) -> WriteResult:
+        started = time.monotonic()
+        skipped = self._claim(index, write)
+        if skipped is not None:
+            return skipped
+        result = WriteResult(index, write, False)
+        try:
+            response = self.ledger.get(self._draft_key(write))
+            if response is None:
+                response = await self._post(result, write.endpoint, write.data, write.token)
+                if write.publish is not None:
+                    self.ledger[self._draft_key(write)] = response
+            if write.publish is not None:
+                query = {"query": created_id(response)}
+                response = await self._post(result, write.publish, query, f"{write.token}:publish")
+            result.ok, result.response = True, response
+        except Exception as exc:
+            result.error = exc
+        return self._finish(result, started)
+
+    async def _post(
+        self, result: WriteResult, endpoint: str, data: dict[str, Any], token: str
+    ) -> Any:
+        import asyncio
+
+        attempt = 0
+        while True:
+            attempt += 1
+            result.requests += 1
+            self._count_request()
+            try:
+                return await self.client.post(
+                    endpoint, data=data, use_api_key=True, headers={IDEMPOTENCY_HEADER: token}
+                )
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+
+async def _aiter(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def pipeline(client: Any, **options: Any) -> WritePipeline | AsyncWritePipeline:
+    """Build the right write pipeline for a sync or async client; see WritePipeline."""
+    low_level = getattr(client, "client", client)
+    cls = AsyncWritePipeline if getattr(low_level, "is_async", False) else WritePipeline
+    return cls(client, **options)
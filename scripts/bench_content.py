@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compare encode_content() with streamed base64 encoding on multi-megabyte posts.
+
+First the encoding alone: encode_content() builds the UTF-8 bytes, their
+base64 encoding and a str copy of it, while FieldPart(text, base64=True)
+yields the encoding a chunk at a time. Then a whole conversation.create()
+against a local server that discards the body: as a form dict (the
+default) and streamed as a multipart body (stream=True).
+Peak memory allocated by Python is measured with tracemalloc in a separate
+run.
+
+    python scripts/bench_content.py [megabytes]
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe import HeyCafe, encode_content
+from heycafe.multipart import FieldPart
+
+REPLY = b'{"system_api_error": false, "response_data": {"id": "c1"}}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(REPLY)))
+        self.end_headers()
+        self.wfile.write(REPLY)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(run) -> tuple[float, int]:
+    """(seconds, peak bytes) of ``run``."""
+    start = time.perf_counter()
+    run()
+    total = time.perf_counter() - start
+    # tracemalloc slows allocations down a lot, so memory is measured in a second run.
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, peak
+
+
+def drain(chunks) -> None:
+    for _ in chunks:
+        pass
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    paragraph = "Ein Café-Beitrag mit Umlauten: äöü, and some plain ASCII text too. ☕\n"
+    text = paragraph * (megabytes * 1024 * 1024 // len(paragraph.encode()))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = HeyCafe(base_url=f"http://127.0.0.1:{server.server_port}", api_key="bench")
+
+    def create(streamed: bool):
+        def run():
+            client.conversation.create("python", content_raw=text, stream=streamed)
+
+        return run
+
+    modes = {
+        "encode_content()": lambda: encode_content(text),
+        "FieldPart chunks": lambda: drain(FieldPart(text, base64=True).chunks()),
+        "create(), form": create(streamed=False),
+        "create(), streamed": create(streamed=True),
+    }
+    print(f"{len(text.encode()) / 1e6:.1f} MB of UTF-8 content")
+    for name, run in modes.items():
+        total, peak = measure(run)
+        print(f"{name:>20}: {total * 1e3:8.1f} ms  peak {peak / 1e6:8.1f} MB")
+    client.client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
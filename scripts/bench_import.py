@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start cost: import time, client construction and resource access.
+
+Each import is timed in a fresh interpreter (the median of several runs is
+reported). Construction and resource access are timed in-process.
+
+    python scripts/bench_import.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, ROOT)
+
+IMPORTS = {
+    "python (baseline)": "pass",
+    "import heycafe": "import heycafe",
+    "from heycafe import HeyCafe": "from heycafe import HeyCafe",
+    "HeyCafe() (requests)": "from heycafe import HeyCafe; HeyCafe()",
+    "HeyCafe() (urllib3)": (
+        "from heycafe import HeyCafe, Urllib3Transport; HeyCafe(transport=Urllib3Transport())"
+    ),
+    "HeyCafe().stats.accounts": "from heycafe import HeyCafe; HeyCafe().stats.accounts",
+}
+
+
+def cold(statement: str, runs: int) -> float:
+    """Median wall time in ms of a fresh interpreter running ``statement``."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    env = {**os.environ, "PYTHONPATH": ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    times = [
+        float(subprocess.check_output([sys.executable, "-c", code], env=env, text=True))
+        for _ in range(runs)
+    ]
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, statement in IMPORTS.items():
+        print(f"{name:>30}: {cold(statement, runs):7.1f} ms")
+
+    from heycafe import HeyCafe
+
+    n = 2000
+    construct = timeit.timeit(HeyCafe, number=n) / n
+    client = HeyCafe()
+    access = timeit.timeit(lambda: client.stats, number=100_000) / 100_000
+    print(f"{'HeyCafe()':>30}: {construct * 1e6:7.1f} us")
+    print(f"{'client.stats (cached)':>30}: {access * 1e9:7.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Compare JSON decoding backends on API-shaped payloads.
+
+Builds conversation listings like get_cafe_conversations returns them and
+times each installed backend on the raw bytes, next to the old path of
+requests.Response.json() (decode to text, then the stdlib parser).
+
+    python scripts/bench_json.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from heycafe import jsonlib
+
+
+def conversation(i: int) -> dict:
+    account = {
+        "id": f"A{i:08d}",
+        "alias": f"user{i}",
+        "name": f"User Nämé {i} ☕",
+        "avatar": f"https://cdn.hey.cafe/avatars/{i}.png",
+        "verified": i % 7 == 0,
+        "followers": i * 13,
+    }
+    return {
+        "id": f"C{i:08d}",
+        "title": f"Conversation {i}",
+        "contents": "Lorem ipsum dolor sit amet, consectetur adipiscing élit. " * 4,
+        "date_created": 1700000000 + i,
+        "comments": i % 50,
+        "reactions": {"like": i % 11, "love": i % 5, "laugh": i % 3},
+        "tags": ["python", "coffee", f"tag{i % 20}"],
+        "account": account,
+        "cafe": {"id": f"K{i % 100:06d}", "alias": f"cafe{i % 100}", "members": 1234},
+    }
+
+
+def payload(items: int) -> bytes:
+    body = {
+        "system_api_error": False,
+        "response_data": {"conversations": [conversation(i) for i in range(items)]},
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def response_json(data: bytes):
+    resp = requests.Response()
+    resp._content = data
+    resp.status_code = 200
+    return lambda: resp.json()
+
+
+def main() -> None:
+    for items in (20, 500, 5000):
+        data = payload(items)
+        cases = {"requests .json()": response_json(data)}
+        for name in jsonlib.available():
+            loads = jsonlib.resolve(name)[1]
+            cases[name] = lambda loads=loads: loads(data)
+        print(f"{items} conversations, {len(data) / 1024:.0f} KiB:")
+        number = max(1, 2000 // items)
+        for name, fn in cases.items():
+            per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number
+            print(f"  {name:>18}: {per_call * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
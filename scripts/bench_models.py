@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare the memory held by raw dicts and by heycafe.models for a large result set.
+
+Builds synthetic conversation records shaped like get_feed_conversations items
+(a dozen scalar fields plus nested account and café records), then measures
+with tracemalloc what it costs to keep them all alive as dicts and as
+Conversation models.
+
+    python scripts/bench_models.py [records]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe.jsonlib import resolve, resolve_dumps
+from heycafe.models import Conversation
+
+
+def profile(i: int) -> dict:
+    return {
+        "id": f"A{i:08d}",
+        "alias": f"user{i}",
+        "name": f"User {i}",
+        "avatar": f"https://cdn.hey.cafe/avatar/{i}.png",
+        "header": f"https://cdn.hey.cafe/header/{i}.png",
+        "bio": "Coffee, code and cats.",
+        "verified": "0",
+        "color": "#336699",
+        "date_created": "2023-02-01 10:00:00",
+    }
+
+
+def record(i: int) -> dict:
+    return {
+        "id": f"C{i:08d}",
+        "contents": f"Conversation number {i} with a short body of text.",
+        "date_created": "2024-05-01 12:00:00",
+        "date_updated": "2024-05-01 12:30:00",
+        "title": "",
+        "tags": ["coffee", "python"],
+        "comments": str(i % 37),
+        "reactions": str(i % 11),
+        "views": str(i * 3),
+        "anonymous": "0",
+        "draft": "0",
+        "pinned": "0",
+        "language": "en",
+        "account": profile(i),
+        "cafe": {**profile(i % 100), "id": f"F{i % 100:08d}", "members": "1200"},
+    }
+
+
+def held(build) -> tuple[int, float]:
+    """Bytes still allocated once ``build`` returns, and the seconds it took."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size, elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    loads = resolve()[1]
+    dumps = resolve_dumps()[1]
+    # Decode from one JSON document so dict and model runs start from the same input.
+    page = dumps([record(i) for i in range(n)])
+
+    dict_bytes, dict_time = held(lambda: loads(page))
+    model_bytes, model_time = held(lambda: Conversation.from_data(loads(page)))
+
+    print(f"{'dicts':>8}: {dict_bytes / n:8.0f} B/record  {dict_time * 1e6 / n:6.2f} us/record")
+    print(f"{'models':>8}: {model_bytes / n:8.0f} B/record  {model_time * 1e6 / n:6.2f} us/record")
+    print(f"{'saved':>8}: {1 - model_bytes / dict_bytes:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
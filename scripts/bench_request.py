@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Measure the client's own per-call overhead.
+
+Requests go through MockTransport, so no I/O happens and the timings are the
+cost of preparing the request, parsing the canned response and the client
+bookkeeping around it. The last case adds a Metrics collector, to show its
+cost per call.
+
+    python scripts/bench_request.py [calls]
+"""
+
+import os
+import sys
+import timeit
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe import HeyCafe, Metrics, MockTransport
+from heycafe.transport import Response
+
+BODY = b'{"system_api_error":false,"response_data":{"alias":"hey"}}'
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    response = Response(200, BODY)
+    client = HeyCafe(api_key="key", transport=MockTransport(lambda request: response))
+    low = client.client
+    metered = HeyCafe(
+        api_key="key", transport=MockTransport(lambda request: response), metrics=Metrics()
+    ).client
+    cases = {
+        "client._prepare()": lambda: low._prepare(
+            "get_account_info", "GET", {"query": "hey", "count": 20}, None, True, False
+        ),
+        "client.get()": lambda: low.get("get_account_info", params={"query": "hey"}),
+        "account.info()": lambda: client.account.info("hey"),
+        "get() with metrics": lambda: metered.get("get_account_info", params={"query": "hey"}),
+    }
+    for name, fn in cases.items():
+        fn()
+        per_call = min(timeit.repeat(fn, number=n, repeat=3)) / n
+        print(f"{name:>20}: {per_call * 1e6:6.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare get() with stream() on one very large list response.
+
+A local HTTP server answers with a get_conversation_comments-style envelope
+of N comments. For each mode, the script reports the time to the first item,
+the total time and the peak memory allocated by Python (tracemalloc, in a
+separate run) while the items are consumed one by one.
+
+    python scripts/bench_stream.py [items]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe import HeyCafeClient, Urllib3Transport
+
+BODY = b""
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def comment(i: int) -> dict:
+    return {
+        "id": f"M{i:08d}",
+        "contents": f"Comment {i}: " + "lorem ipsum " * 8,
+        "date_created": "2024-05-01 12:00:00",
+        "account": {"id": f"A{i % 500:08d}", "alias": f"user{i % 500}", "name": "Someone"},
+    }
+
+
+def measure(consume) -> tuple[float, float, int]:
+    """(seconds to first item, total seconds, peak bytes) of ``consume``."""
+    start = time.perf_counter()
+    first = None
+    for _ in consume():
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    # tracemalloc slows allocations down a lot, so memory is measured in a second run.
+    tracemalloc.start()
+    for _ in consume():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first or total, total, peak
+
+
+def main() -> None:
+    global BODY
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    BODY = json.dumps(
+        {"system_api_error": False, "response_data": {"comments": [comment(i) for i in range(n)]}}
+    ).encode()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = HeyCafeClient(base_url=f"http://127.0.0.1:{server.server_port}")
+    client.transport = Urllib3Transport()
+    client.get("get_system_hello")  # open the connection
+
+    modes = {
+        "get()": lambda: client.get("get_conversation_comments")["comments"],
+        "stream()": lambda: client.stream("get_conversation_comments"),
+    }
+    print(f"{n} items, {len(BODY) / 1e6:.1f} MB body")
+    for name, consume in modes.items():
+        first, total, peak = measure(consume)
+        print(
+            f"{name:>10}: first item {first * 1e3:8.1f} ms  total {total * 1e3:8.1f} ms"
+            f"  peak {peak / 1e6:7.1f} MB"
+        )
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare the client-side cost of each HTTP transport.
+
+Starts a local HTTP server that answers every request with a small API
+envelope, then times sequential GETs through HeyCafeClient with each
+transport. Network latency is near zero, so the numbers mostly reflect the
+per-request overhead of the HTTP stack.
+
+    python scripts/bench_transport.py [requests]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe import HeyCafeClient, HttpxTransport, RequestsTransport, Urllib3Transport
+
+BODY = json.dumps({"system_api_error": False, "response_data": {"hello": "world"}}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    transports = {"requests": RequestsTransport, "urllib3": Urllib3Transport}
+    try:
+        HttpxTransport()
+        transports["httpx"] = HttpxTransport
+    except ImportError:
+        print("httpx not installed; skipping HttpxTransport")
+
+    for name, make in transports.items():
+        client = HeyCafeClient(base_url=base_url, transport=make())
+        client.get("get_system_hello")  # open the connection
+        start = time.perf_counter()
+        for _ in range(n):
+            client.get("get_system_hello", params={"query": "hey"})
+        elapsed = time.perf_counter() - start
+        client.close()
+        print(f"{name:>10}: {elapsed / n * 1e6:8.1f} us/request ({n} requests)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare an in-memory form upload with a streamed multipart upload.
+
+A temporary file of N MB is sent to a local HTTP server that reads and
+discards the body: once as base64 content through temp.file(), the way a
+form dict has to carry it, and once through temp.upload(), which reads the
+file while it is sent. For each mode the script reports the time and the
+peak memory allocated by Python (tracemalloc, in a separate run).
+
+    python scripts/bench_upload.py [megabytes]
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure the package is importable when run from project root or scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from heycafe import HeyCafe
+
+REPLY = b'{"system_api_error": false, "response_data": {"file": "f1"}}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(REPLY)))
+        self.end_headers()
+        self.wfile.write(REPLY)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(upload) -> tuple[float, int]:
+    """(seconds, peak bytes) of ``upload``."""
+    start = time.perf_counter()
+    upload()
+    total = time.perf_counter() - start
+    # tracemalloc slows allocations down a lot, so memory is measured in a second run.
+    tracemalloc.start()
+    upload()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, peak
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = HeyCafe(base_url=f"http://127.0.0.1:{server.server_port}", api_key="bench")
+
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
+        for _ in range(megabytes):
+            f.write(os.urandom(1 << 20))
+        f.flush()
+
+        def in_memory():
+            with open(f.name, "rb") as source:
+                client.temp.file(file=base64.b64encode(source.read()).decode())
+
+        modes = {
+            "temp.file()": in_memory,
+            "temp.upload()": lambda: client.temp.upload(f.name),
+        }
+        print(f"{megabytes} MB file")
+        for name, upload in modes.items():
+            total, peak = measure(upload)
+            print(f"{name:>14}: {total * 1e3:8.1f} ms  peak {peak / 1e6:8.1f} MB")
+    client.client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 """Pytest fixtures for heycafe tests."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
 
 from heycafe import HeyCafe, HeyCafeClient
@@ -33,3 +38,55 @@ def heycafe(base_url):
 def heycafe_with_key(base_url):
     """HeyCafe high-level client with API key."""
     return HeyCafe(base_url=base_url, api_key="test-api-key")
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """
+    Answers every request with an API envelope describing the request.
+
+    An ``items=N`` query param adds a list of N small records to the response.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        url = urlsplit(self.path)
+        data = {
+            "method": self.command,
+            "endpoint": url.path.lstrip("/"),
+            "query": url.query,
+            "body": self.rfile.read(length).decode(),
+        }
+        count = parse_qs(url.query).get("items")
+        if count:
+            data["items"] = [{"id": str(i), "name": f"item {i}"} for i in range(int(count[0]))]
+        body = json.dumps({"system_api_error": False, "response_data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionError:
+            pass  # the client hung up, e.g. after abandoning a stream
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_url():
+    """Base URL of a local HTTP server that echoes each request."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
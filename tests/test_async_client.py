@@ -0,0 +1,160 @@
+"""Tests for AsyncHeyCafeClient and AsyncHeyCafe."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from heycafe import AsyncHeyCafe, AsyncHeyCafeClient
+from heycafe.exceptions import APIError, AuthenticationError
+
+
+def mock_http(handler):
+    """httpx.AsyncClient whose requests are answered by handler(request) -> httpx.Response."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_get_returns_response_data(base_url):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(
+            200, json={"system_api_error": False, "response_data": {"alias": "hey"}}
+        )
+
+    async def run():
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=mock_http(handler)) as c:
+            return await c.get("get_account_info", params={"query": "hey"})
+
+    assert asyncio.run(run()) == {"alias": "hey"}
+    assert seen[0].url.path == "/get_account_info"
+    assert seen[0].url.params["query"] == "hey"
+    assert seen[0].url.params["error_boolean"] == "true"
+
+
+def test_async_api_error_raises(base_url):
+    def handler(request):
+        return httpx.Response(
+            200, json={"system_api_error": True, "system_api_error_message": "Nope"}
+        )
+
+    async def run():
+        client = AsyncHeyCafeClient(base_url=base_url, http_client=mock_http(handler))
+        await client.get("get_system_hello")
+
+    with pytest.raises(APIError) as exc_info:
+        asyncio.run(run())
+    assert "Nope" in str(exc_info.value)
+
+
+def test_async_use_api_key_without_key_raises(base_url):
+    async def run():
+        client = AsyncHeyCafeClient(base_url=base_url, http_client=mock_http(None))
+        await client.get("get_account_cafes", use_api_key=True)
+
+    with pytest.raises(AuthenticationError):
+        asyncio.run(run())
+
+
+def test_async_post_sends_form_and_bearer(base_url):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"system_api_error": False, "response_data": {"id": "c"}})
+
+    async def run():
+        hc = AsyncHeyCafe(base_url=base_url, api_key="k", http_client=mock_http(handler))
+        async with hc:
+            return await hc.conversation.create(cafe="cafe1", content_raw="Hi")
+
+    assert asyncio.run(run()) == {"id": "c"}
+    req = seen[0]
+    assert req.method == "POST"
+    assert req.headers["Authorization"] == "Bearer k"
+    assert b"cafe=cafe1" in req.content
+
+
+def test_async_resources_share_pool_concurrently(base_url):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"system_api_error": False, "response_data": "1"})
+
+    async def run():
+        async with AsyncHeyCafe(base_url=base_url, http_client=mock_http(handler)) as hc:
+            return await asyncio.gather(hc.stats.accounts(), hc.stats.cafes(), hc.system.hello())
+
+    assert asyncio.run(run()) == ["1", "1", "1"]
+    assert sorted(calls) == ["/get_stats_accounts", "/get_stats_cafes", "/get_system_hello"]
+
+
+def test_async_stats_snapshot_all_metrics(base_url):
+    from heycafe.resources.stats import METRICS
+
+    def handler(request):
+        if request.url.path == "/get_stats_chats":
+            return httpx.Response(500, json={"system_api_error": False})
+        return httpx.Response(200, json={"system_api_error": False, "response_data": "7"})
+
+    async def run():
+        async with AsyncHeyCafe(base_url=base_url, http_client=mock_http(handler)) as hc:
+            return await hc.stats.snapshot(max_workers=4)
+
+    snap = asyncio.run(run())
+    assert set(snap.metrics) == set(METRICS)
+    assert list(snap.errors) == ["chats"]
+    assert snap["accounts"] == "7"
+
+
+def test_async_batch_and_map(base_url):
+    def handler(request):
+        query = request.url.params.get("query")
+        if query == "bad":
+            return httpx.Response(404, json={"system_api_error_message": "missing"})
+        return httpx.Response(200, json={"system_api_error": False, "response_data": query})
+
+    async def run():
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=mock_http(handler)) as c:
+            mapped = await c.map("get_cafe_info", [{"query": q} for q in ("a", "bad", "c")])
+            streamed = [i async for i, _ in c.batch_as_completed([("get_cafe_info",)] * 3)]
+            return mapped, streamed
+
+    mapped, streamed = asyncio.run(run())
+    assert mapped[0] == "a" and mapped[2] == "c"
+    assert isinstance(mapped[1], APIError) and mapped[1].status_code == 404
+    assert sorted(streamed) == [0, 1, 2]
+
+
+def test_async_batch_as_completed_cancels_on_early_exit_and_bad_calls(base_url):
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(request):
+            if request.url.params.get("query") != "fast":
+                await release.wait()
+            return httpx.Response(200, json={"system_api_error": False, "response_data": 1})
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=http) as c:
+            calls = [("get_cafe_info", "GET", {"query": q}) for q in ("fast", "slow", "slow")]
+            stream = c.batch_as_completed(calls)
+            async for index, _ in stream:
+                break
+            await stream.aclose()
+            assert all(t.done() for t in asyncio.all_tasks() if t is not asyncio.current_task())
+
+            def bad_calls():
+                yield ("get_cafe_info", "GET", {"query": "slow"})
+                raise RuntimeError("bad call list")
+
+            with pytest.raises(RuntimeError):
+                async for _ in c.batch_as_completed(bad_calls()):
+                    pass
+            await asyncio.sleep(0)
+            assert all(t.done() for t in asyncio.all_tasks() if t is not asyncio.current_task())
+            return index
+
+    assert asyncio.run(run()) == 0
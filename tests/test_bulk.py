@@ -0,0 +1,108 @@
+"""Tests for bulk social-graph actions."""
+
+import asyncio
+
+import httpx
+
+from heycafe import AsyncHeyCafe, HeyCafe, MockTransport, RateLimiter, ResponseCache
+from heycafe.bulk import BulkResult, member_keys
+from heycafe.transport import Response
+
+
+def ok(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+FOLLOWING = [{"id": f"id{i}", "alias": f"User{i}"} for i in range(3)]
+CAFES = [{"id": f"f{i}", "alias": "python" if i == 0 else f"cafe{i}"} for i in range(150)]
+
+
+def social_handler(request):
+    if request.endpoint == "get_account_following":
+        start = int(request.params.get("start", 0))
+        return ok({"accounts": FOLLOWING[start:]})
+    if request.endpoint == "get_account_cafes":
+        start, count = int(request.params["start"]), int(request.params["count"])
+        return ok({"cafes": CAFES[start : start + count]})
+    if request.data.get("query") == "broken":
+        return Response(500, b'{"system_api_error": true, "system_api_error_message": "nope"}')
+    return ok({"query": request.data["query"]})
+
+
+def test_member_keys_reads_ids_and_aliases():
+    assert member_keys([{"id": 1, "alias": "Hey"}, {"id": "x"}, "junk"]) == {"1", "hey", "x"}
+
+
+def test_follow_many_skips_accounts_already_followed():
+    mock = MockTransport(social_handler)
+    client = HeyCafe(api_key="k", transport=mock)
+    targets = ["user0", "id1", "new1", "new2", "new1", "broken"]
+    result = client.account.follow_many(targets, max_workers=4)
+
+    assert isinstance(result, BulkResult)
+    assert result.skipped == ["user0", "id1"]
+    assert result.done == {"new1": {"query": "new1"}, "new2": {"query": "new2"}}
+    assert list(result.failed) == ["broken"] and not result.ok
+    assert result.summary() == {"done": 2, "skipped": 2, "failed": 1}
+    posts = [r.data["query"] for r in mock.requests if r.method == "POST"]
+    assert sorted(posts) == ["broken", "new1", "new2"]
+    assert all(r.headers["Authorization"] == "Bearer k" for r in mock.requests)
+
+
+def test_unfollow_many_only_sends_followed_accounts_and_refreshes_the_cache():
+    mock = MockTransport(social_handler)
+    client = HeyCafe(
+        api_key="k",
+        transport=mock,
+        cache=ResponseCache(ttls={"get_account_following": 300}),
+        rate_limiter=RateLimiter(rate=1000),
+    )
+    result = client.account.unfollow_many(["user2", "stranger"])
+    assert list(result.done) == ["user2"] and result.skipped == ["stranger"]
+    # The cached list was dropped after the unfollow, so the next call reloads it.
+    client.account.follow_many(["user1"])
+    client.account.follow_many(["user1"])
+    crawls = [
+        r
+        for r in mock.requests
+        if r.endpoint == "get_account_following" and r.params["start"] == "0"
+    ]
+    assert len(crawls) == 2
+    assert client.client.rate_limiter.stats.requests == len(mock.requests)
+
+
+def test_state_can_be_given_or_skipped():
+    mock = MockTransport(social_handler)
+    client = HeyCafe(api_key="k", transport=mock)
+    result = client.account.subscribe_many(["a", "b"], current=["A"])
+    assert result.skipped == ["a"] and list(result.done) == ["b"]
+    assert client.account.unsubscribe_many(["a", "b"]).summary()["done"] == 2
+    assert client.cafe.join_many(["python", "rust"]).skipped == ["python"]
+    assert client.cafe.join_many(["python"], check=False).skipped == []
+    assert list(client.cafe.favourite_many(["rust"]).done) == ["rust"]
+    assert not any(r.endpoint == "get_account_following" for r in mock.requests)
+
+
+def test_join_many_checks_every_page_of_joined_cafes():
+    mock = MockTransport(social_handler)
+    client = HeyCafe(api_key="k", transport=mock)
+    result = client.cafe.join_many(["cafe120", "f149", "rust"])
+    assert result.skipped == ["cafe120", "f149"] and list(result.done) == ["rust"]
+    starts = [r.params["start"] for r in mock.requests if r.endpoint == "get_account_cafes"]
+    assert starts[:2] == ["0", "100"]
+
+
+def test_async_bulk(base_url):
+    def handler(request):
+        if request.url.path.endswith("get_account_following"):
+            start = int(request.url.params.get("start", 0))
+            return httpx.Response(200, json=ok({"accounts": FOLLOWING[start:]}))
+        return httpx.Response(200, json=ok({"done": True}))
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            return await client.account.follow_many(["id0", "fresh"])
+
+    result = asyncio.run(run())
+    assert result.skipped == ["id0"] and result.done == {"fresh": {"done": True}}
@@ -0,0 +1,86 @@
+"""Tests for the in-memory response cache."""
+
+import time
+
+import pytest
+import responses
+
+from heycafe import HeyCafe, HeyCafeClient
+from heycafe.cache import CacheBackend, ResponseCache, auth_identity, make_key
+
+
+def add_info(base_url, endpoint="get_account_info", method=responses.GET):
+    responses.add(
+        method,
+        f"{base_url}/{endpoint}",
+        json={"system_api_error": False, "response_data": {"alias": "hey"}},
+    )
+
+
+def test_cache_ttl_expiry_and_lru_eviction(monkeypatch):
+    cache = ResponseCache(maxsize=2, ttls={"e": 10})
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    keys = [make_key("e", {"q": str(i)}, "anonymous") for i in range(3)]
+    cache.set(keys[0], "a")
+    cache.set(keys[1], "b")
+    assert cache.get(keys[0]) == (True, "a")  # keys[0] is now most recent
+    cache.set(keys[2], "c")  # evicts keys[1]
+    assert cache.get(keys[1]) == (False, None)
+    now[0] += 11
+    assert cache.get(keys[0]) == (False, None)
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 2, 1, 1)
+
+
+def test_uncached_endpoint_has_no_ttl():
+    cache = ResponseCache()
+    assert cache.ttl_for("get_account_info") == 60.0
+    assert cache.ttl_for("get_feed_conversations") is None
+    assert ResponseCache(ttls={"get_account_info": 0}).ttl_for("get_account_info") is None
+
+
+@responses.activate
+def test_client_serves_repeat_get_from_cache(base_url):
+    add_info(base_url)
+    client = HeyCafeClient(base_url=base_url, cache=ResponseCache())
+    assert client.get("get_account_info", params={"query": "hey"}) == {"alias": "hey"}
+    assert client.get("get_account_info", params={"query": "hey"}) == {"alias": "hey"}
+    assert len(responses.calls) == 1
+    client.get("get_account_info", params={"query": "hey"}, use_cache=False)
+    assert len(responses.calls) == 2
+    assert client.cache.stats.hits == 1
+
+
+@responses.activate
+def test_cache_keyed_on_auth_identity_and_invalidate(base_url):
+    add_info(base_url)
+    cache = ResponseCache()
+    anon = HeyCafeClient(base_url=base_url, cache=cache)
+    keyed = HeyCafeClient(base_url=base_url, api_key="k", cache=cache)
+    anon.get("get_account_info", params={"query": "hey"})
+    keyed.get("get_account_info", params={"query": "hey"})
+    assert len(responses.calls) == 2
+    assert keyed.invalidate_cache("get_account_info", {"query": "hey"}) == 1
+    assert cache.invalidate(identity=auth_identity(None, None)) == 1
+    assert len(cache) == 0
+
+
+@responses.activate
+def test_post_and_session_requests_are_not_cached(base_url):
+    add_info(base_url, "get_cafe_info", responses.POST)
+    add_info(base_url)
+    hc = HeyCafe(base_url=base_url, session_token="s", cache=ResponseCache())
+    for _ in range(2):
+        hc.client.post("get_cafe_info")
+        hc.client.get("get_account_info", use_session=True)
+    assert len(responses.calls) == 4
+
+
+def test_incomplete_backend_fails_when_created():
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return False, None
+
+    with pytest.raises(TypeError, match="abstract"):
+        GetOnly()
@@ -1,5 +1,7 @@
 """Tests for HeyCafeClient."""
 
+import json
+
 import pytest
 import responses
 
@@ -148,3 +150,76 @@ def test_encode_content():
     from heycafe.client import encode_content
 
     assert encode_content("hello") == "aGVsbG8="
+
+
+@responses.activate
+def test_batch_returns_results_and_exceptions_in_order(client, base_url):
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_system_hello",
+        json={"system_api_error": False, "response_data": "hello"},
+    )
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_cafe_info",
+        json={"system_api_error": True, "system_api_error_message": "No cafe"},
+    )
+    results = client.batch(
+        [
+            ("get_system_hello",),
+            ("get_cafe_info", "GET", {"query": "nope"}),
+            {"endpoint": "get_system_hello"},
+        ],
+        max_workers=3,
+    )
+    assert results[0] == "hello"
+    assert isinstance(results[1], APIError)
+    assert results[2] == "hello"
+
+
+@responses.activate
+def test_map_and_batch_as_completed(client, base_url):
+    def callback(request):
+        alias = request.params["query"]
+        body = {"system_api_error": False, "response_data": {"alias": alias}}
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(responses.GET, f"{base_url}/get_account_info", callback=callback)
+    aliases = [f"user{i}" for i in range(20)]
+    infos = client.map("get_account_info", [{"query": a} for a in aliases], max_workers=4)
+    assert [i["alias"] for i in infos] == aliases
+
+    seen = dict(client.batch_as_completed([("get_account_info", "GET", {"query": "x"})] * 5))
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+
+
+def test_batch_rejects_malformed_call(client):
+    with pytest.raises(ValueError):
+        client.batch([()])
+
+
+def test_prepared_requests_follow_setting_changes(client):
+    url, params, data = client._prepare(
+        "get_feed_conversations", "GET", {"start": 0, "query": None}, None, False, True
+    )
+    assert url == "https://endpoint.hey.cafe/get_feed_conversations"
+    assert params == {"error_boolean": "true", "start": "0"}
+    assert len(client.endpoints) == 1
+    with pytest.raises(AuthenticationError):
+        client._prepare("get_account_key", "GET", None, None, True, False)
+
+    client.session_token = "tok"
+    client.error_no_http = True
+    assert len(client.endpoints) == 0
+    _, params, _ = client._prepare("get_feed_conversations", "GET", None, None, True, True)
+    assert params == {"error_boolean": "true", "error_no_http": "true", "query": "tok"}
+    _, params, _ = client._prepare(
+        "get_feed_conversations", "GET", {"query": "alias"}, None, True, True
+    )
+    assert params["query"] == "alias"
+
+    client.api_key = "key"
+    client.base_url = "https://example.test/"
+    assert client._headers()["Authorization"] == "Bearer key"
+    url, _, _ = client._prepare("get_account_key", "GET", None, None, True, False)
+    assert url == "https://example.test/get_account_key"
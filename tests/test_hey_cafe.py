@@ -1,5 +1,9 @@
 """Tests for high-level HeyCafe client and resources."""
 
+import subprocess
+import sys
+
+import pytest
 import responses
 
 
@@ -142,3 +146,65 @@ def test_hey_cafe_client_low_level_access(heycafe, base_url):
     )
     result = heycafe.client.get("get_system_endpoints")
     assert "recommended" in result
+
+
+@responses.activate
+def test_hey_cafe_stats_snapshot_isolates_failures(heycafe, base_url):
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_stats_accounts",
+        json={"system_api_error": False, "response_data": "12345"},
+    )
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_stats_cafes",
+        json={"system_api_error": True, "system_api_error_message": "down"},
+    )
+    snap = heycafe.stats.snapshot(["accounts", "cafes"], max_workers=2)
+    assert snap["accounts"] == "12345"
+    assert snap.values == {"accounts": "12345"}
+    assert "down" in str(snap.errors["cafes"])
+    assert snap.metrics["accounts"].endpoint == "get_stats_accounts"
+    assert snap.metrics["accounts"].elapsed >= 0
+
+
+def test_hey_cafe_stats_snapshot_rejects_unknown_metric(heycafe):
+    with pytest.raises(ValueError):
+        heycafe.stats.snapshot(["nope"])
+
+
+def test_hey_cafe_resources_are_cached_and_slotted(heycafe):
+    assert heycafe.stats is heycafe.stats
+    assert not hasattr(heycafe.stats, "__dict__")
+    with pytest.raises(AttributeError):
+        heycafe.account.extra = 1
+
+
+def test_import_heycafe_is_lazy():
+    code = (
+        "import sys, heycafe\n"
+        "assert 'requests' not in sys.modules and 'heycafe.client' not in sys.modules\n"
+        "heycafe.HeyCafe().feed\n"
+        "loaded = {m for m in sys.modules if m.startswith('heycafe.resources.')}\n"
+        "assert loaded == {'heycafe.resources.base', 'heycafe.resources.feed'}, loaded\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert heycafe.StatsResource.__name__ == 'StatsResource'\n"
+        "assert 'HeyCafe' in dir(heycafe)\n"
+        "try:\n    heycafe.Nope\nexcept AttributeError:\n    pass\nelse:\n    raise SystemExit(1)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_http_libraries_load_with_the_transport_that_uses_them():
+    code = (
+        "import sys\n"
+        "from heycafe import HeyCafe\n"
+        "import heycafe.client\n"
+        "heavy = {'requests', 'urllib3', 'httpx', 'concurrent.futures', 'email.utils',\n"
+        "         'heycafe.cache', 'heycafe.multipart', 'heycafe.transport'}\n"
+        "assert not heavy & set(sys.modules), heavy & set(sys.modules)\n"
+        "from heycafe import Urllib3Transport\n"
+        "HeyCafe(transport=Urllib3Transport())\n"
+        "assert 'urllib3' in sys.modules and 'requests' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
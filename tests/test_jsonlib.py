@@ -0,0 +1,59 @@
+"""Tests for the pluggable JSON decoding backends."""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from heycafe import AsyncHeyCafeClient, HeyCafeClient, MockTransport, jsonlib
+from heycafe.exceptions import APIError
+
+BACKENDS = jsonlib.available()
+
+
+def test_auto_selection_prefers_fast_backends():
+    assert BACKENDS[-1] == "json"
+    assert jsonlib.resolve()[0] == BACKENDS[0]
+    with pytest.raises(ValueError):
+        jsonlib.resolve("simplejson")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("msgspec") is not None, reason="msgspec installed")
+def test_missing_backend_raises_import_error():
+    with pytest.raises(ImportError):
+        HeyCafeClient(json_backend="msgspec")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_decode_bytes_and_reject_garbage(backend):
+    mock = MockTransport()
+    mock.add("get_account_info", {"system_api_error": False, "response_data": {"name": "Café ☕"}})
+    mock.add("get_system_hello", b"\xff not json")
+    client = HeyCafeClient(transport=mock, json_backend=backend)
+    assert client.json_backend == backend
+    assert client.get("get_account_info") == {"name": "Café ☕"}
+    with pytest.raises(APIError, match="Invalid JSON"):
+        client.get("get_system_hello")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_encoders_write_compact_utf8(backend):
+    name, dumps = jsonlib.resolve_dumps(backend)
+    assert name == backend
+    encoded = dumps({"name": "Café", "tags": [1, 2]})
+    assert b" " not in encoded
+    assert jsonlib.resolve(backend)[1](encoded) == {"name": "Café", "tags": [1, 2]}
+
+
+def test_async_client_uses_backend(base_url):
+    def handler(request):
+        return httpx.Response(200, content=b'{"system_api_error":false,"response_data":[1,2]}')
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=http) as c:
+            assert c.json_backend == BACKENDS[0]
+            return await c.get("get_system_hello")
+
+    assert asyncio.run(run()) == [1, 2]
@@ -0,0 +1,188 @@
+"""Tests for streaming list responses."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from heycafe import (
+    AsyncHeyCafeClient,
+    HeyCafe,
+    HeyCafeClient,
+    HttpxTransport,
+    MockTransport,
+    RequestsTransport,
+    Urllib3Transport,
+)
+from heycafe.exceptions import APIError, AuthenticationError
+from heycafe.jsonstream import ItemParser, iter_items
+from heycafe.models import Comment
+from heycafe.transport import Response
+
+ITEMS = [
+    {"id": i, "text": 'quote " brace } bracket ] \\ é' * (i % 3), "tags": [{"n": None}, True]}
+    for i in range(40)
+]
+
+
+def body(data, **envelope):
+    return json.dumps({"system_api_error": False, **envelope, "response_data": data}).encode()
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_parser_yields_items_across_chunk_boundaries(size):
+    doc = body({"total": 40, "comments": ITEMS, "more": [1]}, trailer="x")
+    parser = ItemParser()
+    items = []
+    for chunk in chunked(doc, size):
+        items += parser.feed(chunk)
+    items += parser.close()
+    assert items == ITEMS
+    assert parser.response_data == {"total": 40, "more": [1]}
+    assert parser.envelope == {"system_api_error": False, "trailer": "x"}
+
+
+def test_parser_items_key_and_plain_lists():
+    doc = body({"first": [1, 2], "wanted": [3, 4]})
+    assert list(iter_items(chunked(doc, 3), items_key="wanted")) == [3, 4]
+    # Numbers split across chunks are not cut short.
+    doc = b' {"response_data" : [ 1 , -2.5e3 , 12345, null ] } '
+    assert list(iter_items(chunked(doc, 2))) == [1, -2500.0, 12345, None]
+    parser = ItemParser()
+    assert parser.feed(body("not a list")) == [] and parser.close() == []
+    assert parser.response_data == "not a list"
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [b'{"response_data": [1, 2', b"[1, 2]", b'{"a" 1}', b'{"response_data": [1 2]}'],
+)
+def test_parser_rejects_malformed_documents(doc):
+    with pytest.raises(ValueError):
+        list(iter_items([doc]))
+
+
+def test_parser_decodes_a_long_item_once_and_caps_its_size():
+    item = {"id": 1, "text": 'a "quoted" \\ line\n' * 5000, "nested": [[{}]] * 100}
+    doc = body([item, 2])
+    parser = ItemParser()
+    decoded = []
+    scan = parser._scan
+    parser._scan = lambda text, pos: decoded.append(pos) or scan(text, pos)
+    items = []
+    for chunk in chunked(doc, 7):
+        items += parser.feed(chunk)
+    assert items + parser.close() == [item, 2]
+    # At most twice per value (once cut short by a chunk), not once per chunk.
+    assert len(decoded) <= 2 * 5 < len(chunked(doc, 7))
+    parser = ItemParser(max_item_size=1000)
+    with pytest.raises(ValueError, match="max_item_size"):
+        for chunk in chunked(doc, 64):
+            parser.feed(chunk)
+
+
+def test_parser_memory_stays_flat_and_first_item_is_early():
+    doc = body([{"id": i, "pad": "x" * 200} for i in range(20_000)])
+    pulled = []
+
+    def chunks():
+        for chunk in chunked(doc, 8192):
+            pulled.append(len(chunk))
+            yield chunk
+
+    parser = ItemParser()
+    stream = iter(chunks())
+    first = []
+    while not first:
+        first = parser.feed(next(stream))
+    assert first[0]["id"] == 0 and len(pulled) == 1
+    peak = 0
+    for chunk in stream:
+        parser.feed(chunk)
+        peak = max(peak, len(parser._buf))
+    parser.close()
+    assert len(doc) > 4_000_000
+    assert peak < 128 * 1024
+
+
+def test_client_stream_with_mock_transport_and_models():
+    mock = MockTransport()
+    mock.add("get_conversation_comments", body({"comments": ITEMS[:3]}))
+    hc = HeyCafe(transport=mock, return_models=True)
+    comments = list(hc.conversation.stream_comments("c1", count="3"))
+    assert [c.id for c in comments] == [0, 1, 2]
+    assert all(isinstance(c, Comment) for c in comments)
+    assert mock.requests[0].params["count"] == "3"
+
+
+def test_client_stream_detects_system_errors():
+    mock = MockTransport()
+    before = b'{"system_api_error": true, "system_api_error_message": "nope", "response_data": [1]}'
+    mock.add("get_cafe_members", before)
+    client = HeyCafeClient(transport=mock)
+    with pytest.raises(APIError, match="nope"):
+        list(client.stream("get_cafe_members"))
+
+    after = b'{"response_data": [1, 2], "system_api_error": "true"}'
+    mock.add("get_explore_conversations", after)
+    seen = []
+    with pytest.raises(APIError):
+        for item in client.stream("get_explore_conversations", chunk_size=8):
+            seen.append(item)
+    assert seen == [1, 2]
+
+    mock.add("get_system_hello", b'{"response_data": [1, ')
+    with pytest.raises(APIError, match="Invalid JSON"):
+        list(client.stream("get_system_hello"))
+
+
+def test_client_stream_error_statuses_use_buffered_path():
+    def handler(request):
+        if request.endpoint == "get_cafe_members":
+            return 500, {"system_api_error": True, "system_api_error_message": "Server exploded"}
+        return Response(404, b"<html>not found</html>")
+
+    client = HeyCafeClient(transport=MockTransport(handler))
+    with pytest.raises(APIError, match="Server exploded") as err:
+        list(client.stream("get_cafe_members"))
+    assert err.value.status_code == 500
+    with pytest.raises(APIError, match="Invalid JSON"):
+        list(client.stream("get_explore_conversations"))
+    with pytest.raises(AuthenticationError):
+        list(client.stream("get_chat_messages", use_api_key=True))
+
+
+@pytest.mark.parametrize("make", [RequestsTransport, Urllib3Transport, HttpxTransport])
+def test_network_transports_stream(local_url, make):
+    client = HeyCafeClient(base_url=local_url, transport=make())
+    items = list(client.stream("get_cafe_members", params={"items": 3000}, chunk_size=1024))
+    assert len(items) == 3000 and items[-1] == {"id": "2999", "name": "item 2999"}
+    # Abandoning a stream halfway releases the connection for the next request.
+    stream = client.stream("get_cafe_members", params={"items": 3000}, chunk_size=1024)
+    assert next(stream)["id"] == "0"
+    stream.close()
+    assert client.get("get_system_hello")["endpoint"] == "get_system_hello"
+    client.close()
+
+
+def test_async_client_stream(base_url):
+    def handler(request):
+        if request.url.path.endswith("get_cafe_members"):
+            return httpx.Response(200, content=body({"members": ITEMS}))
+        return httpx.Response(200, content=b'{"system_api_error": true, "response_data": []}')
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=http) as client:
+            items = [item async for item in client.stream("get_cafe_members", chunk_size=7)]
+            with pytest.raises(APIError):
+                async for _ in client.stream("get_explore_conversations"):
+                    pass
+        return items
+
+    assert asyncio.run(run()) == ITEMS
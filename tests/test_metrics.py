@@ -0,0 +1,145 @@
+"""Tests for per-endpoint metrics and the Prometheus exporter."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from heycafe import AsyncHeyCafe, HeyCafe, Metrics, MockTransport, ResponseCache, RetryPolicy
+from heycafe.exceptions import APIError
+from heycafe.metrics import EndpointMetrics
+from heycafe.transport import Response
+
+
+def ok(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+def test_client_records_counts_errors_bytes_cache_and_retries():
+    mock = MockTransport()
+    mock.add("get_account_info", ok({"alias": "hey"}))
+    mock.add("get_cafe_info", {"system_api_error": True}, status=503)
+    mock.add("get_cafe_info", ok({"alias": "python"}))
+    mock.add("post_account_follow", {"system_api_error": True}, status=500)
+    metrics = Metrics()
+    client = HeyCafe(
+        api_key="k",
+        transport=mock,
+        metrics=metrics,
+        cache=ResponseCache(ttls={"get_account_info": 60}),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0),
+    )
+    for _ in range(3):
+        client.account.info("hey")
+    client.cafe.info("python")
+    with pytest.raises(APIError):
+        client.account.follow("someone")
+
+    snapshot = metrics.snapshot()
+    info = snapshot["get_account_info"]
+    assert (info.requests, info.cache_hits, info.cache_misses) == (1, 2, 1)
+    body = mock.routes["get_account_info"][0].content
+    assert info.statuses == {200: 1} and info.bytes == len(body)
+    cafe = snapshot["get_cafe_info"]
+    assert cafe.statuses == {503: 1, 200: 1} and cafe.retries == 1
+    assert cafe.errors == {"APIError": 1}
+    follow = snapshot["post_account_follow"]
+    assert follow.errors == {"APIError": 1} and follow.error_count == 1 and follow.retries == 0
+    assert sum(info.latency_counts) == info.requests and info.mean_latency > 0
+    # The snapshot is a copy.
+    info.statuses.clear()
+    assert metrics.snapshot()["get_account_info"].statuses == {200: 1}
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_transport_errors_stream_and_upload_are_recorded(tmp_path):
+    def handler(request):
+        if request.endpoint == "get_chat_list":
+            raise ConnectionError("reset")
+        if request.endpoint == "post_temp_file":
+            return ok({"file": "f1"})
+        return ok({"comments": [{"id": "1"}, {"id": "2"}]})
+
+    metrics = Metrics()
+    client = HeyCafe(api_key="k", transport=MockTransport(handler), metrics=metrics)
+    with pytest.raises(ConnectionError):
+        client.chat.list()
+    assert len(list(client.conversation.stream_comments("c1"))) == 2
+    path = tmp_path / "a.txt"
+    path.write_text("hello")
+    client.temp.upload(path)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["get_chat_list"].errors == {"ConnectionError": 1}
+    assert snapshot["get_chat_list"].requests == 0
+    assert snapshot["get_conversation_comments"].requests == 1
+    assert snapshot["get_conversation_comments"].bytes > 0
+    assert snapshot["post_temp_file"].statuses == {200: 1}
+
+
+def test_histogram_and_quantiles():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 0.5, 3.0):
+        metrics.record_response("e", 200, seconds, 10)
+    entry = metrics.snapshot()["e"]
+    assert entry.latency_counts == [2, 2, 1]
+    assert entry.quantile(0.2) == pytest.approx(0.05)
+    assert entry.quantile(0.6) == pytest.approx(0.55)
+    assert entry.quantile(0.99) == 1.0
+    assert EndpointMetrics().quantile(0.5) == 0.0
+    with pytest.raises(ValueError):
+        Metrics(buckets=(1.0, 0.5))
+
+
+def test_prometheus_export():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.record_response("get_x", 200, 0.05, 100)
+    metrics.record_response("get_x", 200, 0.5, 50)
+    metrics.record_response("get_x", 429, 2.0, 0)
+    metrics.record_error('we"ird', APIError("boom"))
+    metrics.record_cache("get_x", hit=True)
+    metrics.record_retry("get_x")
+    lines = metrics.to_prometheus(prefix="hc").splitlines()
+
+    assert "# TYPE hc_requests_total counter" in lines
+    assert 'hc_requests_total{endpoint="get_x",status="200"} 2' in lines
+    assert 'hc_requests_total{endpoint="get_x",status="429"} 1' in lines
+    assert 'hc_errors_total{endpoint="we\\"ird",error="APIError"} 1' in lines
+    assert "# TYPE hc_request_duration_seconds histogram" in lines
+    assert 'hc_request_duration_seconds_bucket{endpoint="get_x",le="0.1"} 1' in lines
+    assert 'hc_request_duration_seconds_bucket{endpoint="get_x",le="1.0"} 2' in lines
+    assert 'hc_request_duration_seconds_bucket{endpoint="get_x",le="+Inf"} 3' in lines
+    assert 'hc_request_duration_seconds_count{endpoint="get_x"} 3' in lines
+    assert 'hc_response_bytes_total{endpoint="get_x"} 150' in lines
+    assert 'hc_cache_hits_total{endpoint="get_x"} 1' in lines
+    assert 'hc_retries_total{endpoint="get_x"} 1' in lines
+    assert all(line.startswith(("# ", "hc_")) for line in lines)
+
+
+def test_metrics_are_off_by_default():
+    client = HeyCafe(transport=MockTransport(lambda request: Response(200, b"{}")))
+    client.system.hello()
+    assert client.client.metrics is None
+
+
+def test_async_client_records(base_url):
+    def handler(request):
+        if request.url.path.endswith("get_cafe_info"):
+            return httpx.Response(500, json={"system_api_error": True})
+        return httpx.Response(200, json=ok({"alias": "hey"}))
+
+    metrics = Metrics()
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, http_client=http, metrics=metrics) as client:
+            await client.account.info("hey")
+            with pytest.raises(APIError):
+                await client.cafe.info("python")
+
+    asyncio.run(run())
+    snapshot = metrics.snapshot()
+    assert snapshot["get_account_info"].statuses == {200: 1}
+    assert snapshot["get_cafe_info"].statuses == {500: 1}
+    assert snapshot["get_cafe_info"].errors == {"APIError": 1}
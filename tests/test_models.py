@@ -0,0 +1,123 @@
+"""Tests for the slot-based response models."""
+
+import asyncio
+import pickle
+
+import httpx
+import pytest
+
+from heycafe import AsyncHeyCafe, HeyCafe, MockTransport
+from heycafe.models import Account, Cafe, ChatMessage, Comment, Conversation
+
+CONVERSATION = {
+    "id": "c1",
+    "contents": "hello",
+    "date_created": "2024-05-01",
+    "views": "12",
+    "account": {"id": "a1", "alias": "hey", "name": "Hey", "verified": "1"},
+    "cafe": {"id": "f1", "alias": "python"},
+    "tags": ["x", "y"],
+}
+
+
+def envelope(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+def test_models_are_slotted():
+    conv = Conversation(CONVERSATION)
+    assert not hasattr(conv, "__dict__")
+    with pytest.raises(AttributeError):
+        conv.undeclared = 1
+    assert Account._fields == ("id", "alias", "name", "avatar", "bio")
+
+
+def test_eager_fields_and_missing_fields():
+    conv = Conversation(CONVERSATION)
+    assert (conv.id, conv.contents, conv.date_created) == ("c1", "hello", "2024-05-01")
+    assert Account({"id": "a1"}).bio is None
+    assert repr(Cafe({"id": "f1"})) == "Cafe(id='f1', alias=None, name=None, avatar=None, bio=None)"
+
+
+def test_other_fields_are_decoded_lazily_once():
+    conv = Conversation(CONVERSATION)
+    assert conv._extra is None and conv._raw
+    account = conv.account
+    assert isinstance(account, Account) and account.alias == "hey"
+    assert account.verified == "1"
+    assert isinstance(conv.cafe, Cafe)
+    assert conv.views == "12" and conv["tags"] == ["x", "y"]
+    assert conv._raw == b""
+    assert conv.account is account
+    with pytest.raises(AttributeError):
+        conv.missing
+    with pytest.raises(KeyError):
+        conv["missing"]
+    assert conv.get("missing", 0) == 0
+
+
+def test_to_dict_round_trip_and_pickle():
+    conv = Conversation(CONVERSATION)
+    assert conv.to_dict() == CONVERSATION
+    assert "views" in conv and "id" in conv and "nope" not in conv
+    assert pickle.loads(pickle.dumps(conv)) == conv
+    assert conv != Conversation({**CONVERSATION, "views": "13"})
+
+
+def test_from_data_wraps_lists_and_passes_through_other_values():
+    items = Comment.from_data([{"id": "1"}, "odd", {"id": "2"}])
+    assert [type(i) for i in items] == [Comment, str, Comment]
+    assert Comment.from_data(None) is None
+
+
+def test_resources_return_dicts_by_default():
+    mock = MockTransport()
+    mock.add("get_conversation_info", envelope(CONVERSATION))
+    assert HeyCafe(transport=mock).conversation.info("c1") == CONVERSATION
+
+
+def test_resources_return_models_when_enabled():
+    mock = MockTransport()
+    mock.add("get_conversation_info", envelope(CONVERSATION))
+    mock.add("get_account_info", envelope({"id": "a1", "alias": "hey"}))
+    client = HeyCafe(transport=mock, return_models=True)
+    conv = client.conversation.info("c1")
+    assert isinstance(conv, Conversation) and conv.account.alias == "hey"
+    assert client.account.info("hey") == Account({"id": "a1", "alias": "hey"})
+
+
+def test_paginators_yield_models():
+    mock = MockTransport()
+    page = [{"id": str(i), "contents": f"m{i}", "account": {"id": "a1"}} for i in range(3)]
+    mock.add("get_chat_messages", envelope({"messages": page}))
+    client = HeyCafe(api_key="key", transport=mock, return_models=True)
+    messages = client.chat.iter_messages("chat", page_size=5).fetch_all()
+    assert [m.contents for m in messages] == ["m0", "m1", "m2"]
+    assert all(isinstance(m, ChatMessage) for m in messages)
+    assert messages[0].account.id == "a1"
+
+
+def test_models_use_the_client_json_backend():
+    mock = MockTransport()
+    mock.add("get_conversation_info", envelope(CONVERSATION))
+    mock.add("get_chat_messages", envelope({"messages": [{"id": "1", "account": {"id": "a1"}}]}))
+    client = HeyCafe(api_key="key", transport=mock, return_models=True, json_backend="json")
+    conv = client.conversation.info("c1")
+    message = client.chat.iter_messages("chat").fetch_all()[0]
+    for model in (conv, conv.account, message, message.account):
+        assert model._codec.name == "json"
+    assert pickle.loads(pickle.dumps(conv))._codec.name == "json"
+    assert Conversation(CONVERSATION, "json").to_dict() == CONVERSATION
+
+
+def test_async_resources_return_models(base_url):
+    def handler(request):
+        return httpx.Response(200, json=envelope(CONVERSATION))
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, http_client=http, return_models=True) as c:
+            return await c.conversation.info("c1")
+
+    conv = asyncio.run(run())
+    assert isinstance(conv, Conversation) and conv.cafe.alias == "python"
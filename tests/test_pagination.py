@@ -0,0 +1,167 @@
+"""Tests for auto-paginating iterators."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import responses
+
+from heycafe import AsyncHeyCafe
+from heycafe.pagination import AsyncPaginator, Paginator, extract_items
+
+
+def make_fetch(total, calls=None):
+    """fetch_page over `total` integer items, recording requested offsets."""
+
+    def fetch(start, count):
+        if calls is not None:
+            calls.append(start)
+        return {"items": list(range(start, min(start + count, total)))}
+
+    return fetch
+
+
+def test_extract_items():
+    assert extract_items([1, 2]) == [1, 2]
+    assert extract_items({"count": 3, "members": [1]}) == [1]
+    assert extract_items({"a": [1], "b": [2]}, items_key="b") == [2]
+    assert extract_items("12345") == []
+
+
+def test_paginator_yields_all_items_and_stops_on_short_page():
+    calls = []
+    items = list(Paginator(make_fetch(45, calls), page_size=10, prefetch=2))
+    assert items == list(range(45))
+    # Pages at 0..40 are consumed; 50 and 60 may have been prefetched past the end.
+    assert set(calls) >= {0, 10, 20, 30, 40}
+    assert max(calls) <= 60
+
+
+def test_paginator_stops_on_empty_page_without_prefetch():
+    calls = []
+    assert list(Paginator(make_fetch(20, calls), page_size=10, prefetch=0)) == list(range(20))
+    assert calls == [0, 10, 20]
+
+
+def test_paginator_limit():
+    assert list(Paginator(make_fetch(100), page_size=10, limit=15)) == list(range(15))
+
+
+def test_paginator_requests_no_page_past_the_limit():
+    calls = []
+    items = list(Paginator(make_fetch(100, calls), page_size=20, prefetch=2, limit=5))
+    assert items == list(range(5)) and calls == [0]
+    calls.clear()
+    paginator = Paginator(make_fetch(100, calls), page_size=10, prefetch=3, limit=25)
+    assert paginator.fetch_all(key=None) == list(range(25))
+    assert sorted(calls) == [0, 10, 20]
+
+    async def fetch(start, count):
+        calls.append(start)
+        return {"items": list(range(start, min(start + count, 100)))}
+
+    async def run():
+        return [item async for item in AsyncPaginator(fetch, page_size=20, prefetch=2, limit=5)]
+
+    calls.clear()
+    assert asyncio.run(run()) == list(range(5)) and calls == [0]
+
+
+def test_paginator_prefetches_while_consumer_works():
+    release = threading.Event()
+    calls = []
+
+    def fetch(start, count):
+        calls.append(start)
+        if start == 0:
+            return {"items": [0]}
+        release.wait(1)
+        return {"items": []}
+
+    it = iter(Paginator(fetch, page_size=1, prefetch=3))
+    assert next(it) == 0
+    # Read-ahead requests are issued before the consumer asks for them.
+    deadline = time.monotonic() + 1
+    while not {1, 2, 3} <= set(calls) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert {1, 2, 3} <= set(calls)
+    release.set()
+    assert list(it) == []
+
+
+def test_async_paginator():
+    async def fetch(start, count):
+        return {"items": list(range(start, min(start + count, 25)))}
+
+    async def run():
+        return [item async for item in AsyncPaginator(fetch, page_size=10, prefetch=2)]
+
+    assert asyncio.run(run()) == list(range(25))
+
+
+@responses.activate
+def test_cafe_iter_members_sends_start_and_count(heycafe, base_url):
+    pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+    for page in pages:
+        responses.add(
+            responses.GET,
+            f"{base_url}/get_cafe_members",
+            json={"system_api_error": False, "response_data": {"members": page}},
+        )
+    members = list(heycafe.cafe.iter_members("python", page_size=2, prefetch=0))
+    assert [m["id"] for m in members] == ["a", "b", "c"]
+    assert "start=2" in responses.calls[1].request.url
+    assert "count=2" in responses.calls[1].request.url
+
+
+def test_async_feed_iter_conversations(base_url):
+    def handler(request):
+        start = int(request.url.params["start"])
+        convs = [{"id": i} for i in range(start, min(start + 2, 3))]
+        return httpx.Response(
+            200, json={"system_api_error": False, "response_data": {"conversations": convs}}
+        )
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as hc:
+            return [c["id"] async for c in hc.feed.iter_conversations(page_size=2)]
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+
+def test_fetch_all_parallel_windows_in_order():
+    calls = []
+    paginator = Paginator(make_fetch(95, calls), page_size=10)
+    items = paginator.fetch_all(total=95, max_workers=4, key=None)
+    assert items == list(range(95))
+    assert sorted(calls) == list(range(0, 100, 10))
+
+
+def test_fetch_all_continues_when_total_underestimated():
+    items = Paginator(make_fetch(35), page_size=10).fetch_all(total=20, key=None)
+    assert items == list(range(35))
+
+
+def test_fetch_all_dedupes_shifted_items_at_window_edges():
+    # An item was inserted at the head between the first and second window,
+    # shifting "b" from offset 1 into offset 2.
+    pages = {0: [{"id": "a"}, {"id": "b"}], 2: [{"id": "b"}, {"id": "c"}], 4: []}
+    items = Paginator(lambda s, c: pages[s], page_size=2).fetch_all(total=4)
+    assert [i["id"] for i in items] == ["a", "b", "c"]
+
+
+def test_fetch_all_sequential_when_total_unknown():
+    calls = []
+    items = Paginator(make_fetch(25, calls), page_size=10, prefetch=0).fetch_all(key=None)
+    assert items == list(range(25))
+    assert calls == [0, 10, 20]
+
+
+def test_async_fetch_all():
+    async def fetch(start, count):
+        return list(range(start, min(start + count, 42)))
+
+    items = asyncio.run(AsyncPaginator(fetch, page_size=10).fetch_all(total=42, key=None))
+    assert items == list(range(42))
@@ -0,0 +1,352 @@
+"""Tests for feed watching and the adaptive polling interval."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from heycafe import AsyncHeyCafe, HeyCafe, MockTransport
+from heycafe.models import Conversation
+from heycafe.polling import AdaptiveInterval, AsyncTailer, AsyncWatcher, Tailer, Watcher
+
+
+class Feed:
+    """A newest-first feed that grows by a scripted number of items before each poll."""
+
+    def __init__(self, initial, bursts):
+        self.items = [{"id": f"c{i}"} for i in reversed(range(initial))]
+        self.bursts = list(bursts)
+        self.next_id = initial
+
+    def grow(self):
+        for _ in range(self.bursts.pop(0) if self.bursts else 0):
+            self.items.insert(0, {"id": f"c{self.next_id}"})
+            self.next_id += 1
+
+    def page(self, start, count):
+        start, count = int(start), int(count)
+        if start == 0:
+            self.grow()
+        return {"conversations": self.items[start : start + count]}
+
+
+class Thread:
+    """An oldest-first thread (chat messages, comments) that grows before each poll."""
+
+    def __init__(self, initial, bursts):
+        self.items = [{"id": f"m{i}"} for i in range(initial)]
+        self.bursts = list(bursts)
+        self.next_start = None
+
+    def page(self, start, count):
+        start, count = int(start), int(count)
+        if start != self.next_start:
+            # Not the next page of the same poll, so a new poll has started.
+            for _ in range(self.bursts.pop(0) if self.bursts else 0):
+                self.items.append({"id": f"m{len(self.items)}"})
+        self.next_start = start + count
+        return self.items[start : start + count]
+
+
+def feed_transport(feed):
+    def handler(request):
+        page = feed.page(request.params["start"], request.params["count"])
+        return {"system_api_error": False, "response_data": page}
+
+    return MockTransport(handler)
+
+
+def test_interval_backs_off_when_idle_and_tightens_when_busy():
+    interval = AdaptiveInterval(minimum=1, maximum=10, initial=4, jitter=0)
+    assert [interval.update(0) for _ in range(5)] == [6, 9, 10, 10, 10]
+    assert interval.update(3) == 5
+    assert interval.update(3) == 2.5
+    assert interval.update(20, saturated=True) == 1
+    assert interval.update(1) == 1
+    jittered = AdaptiveInterval(minimum=10, maximum=10, jitter=0.2)
+    assert all(8 <= jittered.update(0) <= 12 for _ in range(50))
+    with pytest.raises(ValueError):
+        AdaptiveInterval(minimum=5, maximum=1)
+
+
+def test_watch_yields_only_new_items_oldest_first():
+    feed = Feed(initial=5, bursts=[0, 2, 0, 3])
+    mock = feed_transport(feed)
+    watcher = HeyCafe(api_key="k", transport=mock).feed.watch(
+        page_size=3, min_interval=0, max_interval=0, max_polls=4
+    )
+    assert [c["id"] for c in watcher] == ["c5", "c6", "c7", "c8", "c9"]
+    assert watcher.newest == "c9" and watcher.polls == 4
+    assert mock.requests[0].params["start"] == "0" and mock.requests[0].params["count"] == "3"
+    assert mock.requests[0].headers["Authorization"] == "Bearer k"
+
+
+def test_watch_reads_further_pages_in_a_burst_and_dedupes_shifted_items():
+    # Seven new items arrive while page size is 3: the poll reads pages until it
+    # reaches c4. A new item arrives between page requests, so c6 is served twice.
+    feed = Feed(initial=5, bursts=[0, 7])
+    pages = []
+
+    def fetch_page(start, count):
+        pages.append(start)
+        page = feed.page(start, count)
+        if start == 3:
+            feed.items.insert(0, {"id": "c12"})
+        return page
+
+    watcher = Watcher(fetch_page, page_size=3, interval=AdaptiveInterval(0, 0), max_polls=2)
+    ids = [c["id"] for c in watcher]
+    assert ids == ["c5", "c6", "c7", "c8", "c9", "c10", "c11"]
+    assert pages == [0, 0, 3, 6]
+    assert watcher.requests == 4
+
+
+def test_watch_stops_at_max_pages_and_polls_again_quickly():
+    feed = Feed(initial=2, bursts=[0, 10])
+    interval = AdaptiveInterval(minimum=1, maximum=60, initial=30, jitter=0)
+    watcher = Watcher(feed.page, page_size=2, max_pages=2, interval=interval)
+    assert watcher.poll() == ([], 45)
+    items, delay = watcher.poll()
+    assert [c["id"] for c in items] == ["c8", "c9", "c10", "c11"]
+    assert delay == 1
+
+
+def test_watch_include_existing_and_models():
+    mock = MockTransport()
+    page = {"conversations": [{"id": "c2"}, {"id": "c1"}]}
+    mock.add("get_feed_conversations", {"system_api_error": False, "response_data": page})
+    client = HeyCafe(api_key="k", transport=mock, return_models=True)
+    watcher = client.feed.watch(include_existing=True, min_interval=0, max_polls=3)
+    convs = list(watcher)
+    assert [c.id for c in convs] == ["c1", "c2"]
+    assert all(isinstance(c, Conversation) for c in convs)
+    assert len(mock.requests) == 3
+
+
+def test_async_watch(base_url):
+    feed = Feed(initial=3, bursts=[0, 1, 0, 2])
+
+    def handler(request):
+        page = feed.page(request.url.params["start"], request.url.params["count"])
+        return httpx.Response(200, json={"system_api_error": False, "response_data": page})
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            watcher = client.feed.watch(min_interval=0, max_interval=0, max_polls=4)
+            return [c["id"] async for c in watcher]
+
+    assert asyncio.run(run()) == ["c3", "c4", "c5"]
+
+
+def chats_transport(feeds, chat_list=None):
+    def handler(request):
+        if request.endpoint == "get_chat_list":
+            data = {"chats": [{"id": chat} for chat in chat_list]}
+        else:
+            page = feeds[request.params["query"]].page(
+                request.params["start"], request.params["count"]
+            )
+            data = {"messages": page}
+        return {"system_api_error": False, "response_data": data}
+
+    return MockTransport(handler)
+
+
+def test_chat_tail_merges_new_messages_from_discovered_chats():
+    feeds = {"a": Thread(2, [0, 1, 2]), "b": Thread(1, [0, 0, 1]), "c": Thread(0, [])}
+    mock = chats_transport(feeds, chat_list=["a", "b", "c"])
+    client = HeyCafe(api_key="k", transport=mock)
+    tailer = client.chat.tail(min_interval=0, max_interval=0, max_workers=2, max_rounds=3)
+    pairs = sorted((chat, m["id"]) for chat, m in tailer)
+    assert pairs == [("a", "m2"), ("a", "m3"), ("a", "m4"), ("b", "m1")]
+    assert mock.requests[0].endpoint == "get_chat_list"
+    assert tailer.requests == 9 and tailer.rounds == 3
+    assert tailer.cursors() == {"a": 5, "b": 2, "c": 0}
+
+
+def test_chat_tail_pages_forward_through_chats_longer_than_a_page():
+    # Priming pages to the end of the chat over two polls (max_pages=2); after
+    # that each poll starts at the number of messages read.
+    feeds = {"a": Thread(7, [0, 4])}
+    mock = chats_transport(feeds)
+    tailer = HeyCafe(api_key="k", transport=mock).chat.tail(
+        ["a"], page_size=3, max_pages=2, min_interval=0, max_interval=0, max_rounds=3
+    )
+    assert [m["id"] for _, m in tailer] == ["m7", "m8", "m9", "m10"]
+    assert [r.params["start"] for r in mock.requests] == ["0", "3", "6", "7", "10"]
+    assert tailer.cursors() == {"a": 11}
+    resumed = HeyCafe(api_key="k", transport=mock).chat.tail(["a"], page_size=3, max_rounds=1)
+    resumed.watchers["a"].resume(9)
+    assert [m["id"] for _, m in resumed] == ["m9", "m10"]
+
+
+def test_tailer_polls_idle_sources_less_often():
+    feeds = {"busy": Feed(1, [0, 1, 1, 1]), "idle": Feed(1, [])}
+
+    def watcher_for(chat):
+        slow = chat == "idle"
+        return Watcher(
+            lambda start, count: feeds[chat].page(start, count),
+            interval=AdaptiveInterval(100 if slow else 0, 100 if slow else 0, jitter=0),
+        )
+
+    tailer = Tailer(watcher_for, ["busy", "idle"], max_rounds=4)
+    assert list(tailer) == [("busy", {"id": "c1"}), ("busy", {"id": "c2"}), ("busy", {"id": "c3"})]
+    assert tailer.watchers["busy"].polls == 4 and tailer.watchers["idle"].polls == 1
+
+
+def test_tailer_errors_and_removal():
+    feeds = {"a": Thread(1, [0, 1])}
+    mock = chats_transport(feeds)
+    client = HeyCafe(api_key="k", transport=mock)
+    failures = []
+    tailer = client.chat.tail(
+        ["a", "gone"],
+        min_interval=0,
+        max_interval=0,
+        max_rounds=2,
+        on_error=lambda chat, exc: failures.append(chat),
+    )
+    assert list(tailer) == [("a", {"id": "m1"})]
+    assert failures == ["gone", "gone"]
+    tailer.remove("gone")
+    assert list(tailer.watchers) == ["a"]
+    with pytest.raises(KeyError):
+        list(client.chat.tail(["gone"], max_rounds=1))
+
+
+def test_async_chat_tail(base_url):
+    feeds = {"a": Thread(1, [0, 2]), "b": Thread(0, [0, 1])}
+
+    def handler(request):
+        params = request.url.params
+        if request.url.path.endswith("get_chat_list"):
+            data = {"chats": [{"id": "a"}, {"id": "b"}]}
+        else:
+            data = {"messages": feeds[params["query"]].page(params["start"], params["count"])}
+        return httpx.Response(200, json={"system_api_error": False, "response_data": data})
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            tailer = client.chat.tail(min_interval=0, max_interval=0, max_rounds=2)
+            return sorted([(chat, m["id"]) async for chat, m in tailer])
+
+    assert asyncio.run(run()) == [("a", "m1"), ("a", "m2"), ("b", "m0")]
+
+
+def test_async_tailer_early_exit_cancels_the_other_polls():
+    threads = {"fast": Thread(2, []), "slow": Thread(3, [])}
+
+    async def run():
+        slow_may_answer = asyncio.Event()
+
+        def watcher_for(source):
+            async def fetch_page(start, count):
+                if source == "slow":
+                    await slow_may_answer.wait()
+                return threads[source].page(start, count)
+
+            return AsyncWatcher(
+                fetch_page,
+                oldest_first=True,
+                include_existing=True,
+                interval=AdaptiveInterval(0, 0, jitter=0),
+            )
+
+        tailer = AsyncTailer(watcher_for, ["fast", "slow"], max_rounds=3)
+        stream = tailer.__aiter__()
+        assert await stream.__anext__() == ("fast", {"id": "m0"})
+        await stream.aclose()
+        # The slow poll was cancelled before it could move the watcher on.
+        assert tailer.watchers["slow"].offset == 0
+        slow_may_answer.set()
+        received = []
+        async for source, item in tailer:
+            received.append((source, item["id"]))
+            if len(received) == 3:
+                break
+        return received
+
+    assert asyncio.run(run()) == [("slow", "m0"), ("slow", "m1"), ("slow", "m2")]
+
+
+def comments_transport(feeds):
+    def handler(request):
+        page = feeds[request.params["query"]].page(request.params["start"], request.params["count"])
+        return {"system_api_error": False, "response_data": {"comments": page}}
+
+    return MockTransport(handler)
+
+
+def test_sync_comments_fetches_only_newer_comments_and_resumes_from_cursors():
+    feeds = {"a": Thread(3, [0, 2]), "b": Thread(2, [0, 0])}
+    mock = comments_transport(feeds)
+    client = HeyCafe(transport=mock)
+    sync = client.conversation.sync_comments(
+        ["a", "b"], requests_per_minute=6000, min_interval=0, max_workers=2, max_rounds=4
+    )
+    assert sorted((c, m["id"]) for c, m in sync) == [("a", "m3"), ("a", "m4")]
+    assert sync.cursors() == {"a": 5, "b": 2}
+    # Each poll reads one page, starting after the comments already read.
+    starts = [r.params["start"] for r in mock.requests if r.params["query"] == "a"]
+    assert starts[:3] == ["0", "3", "5"]
+
+    # A later run resumes from the saved cursors and yields what came after.
+    feeds["b"].bursts = [1]
+    resumed = client.conversation.sync_comments(
+        cursors=sync.cursors(), requests_per_minute=6000, min_interval=0, max_rounds=1
+    )
+    assert sorted((c, m["id"]) for c, m in resumed) == [("b", "m2")]
+
+
+def test_sync_comments_pages_forward_through_threads_longer_than_a_page():
+    feeds = {"x": Thread(45, [0, 30])}
+    mock = comments_transport(feeds)
+    sync = HeyCafe(transport=mock).conversation.sync_comments(
+        ["x"], requests_per_minute=6000, min_interval=0, max_rounds=2
+    )
+    ids = [m["id"] for _, m in sync]
+    assert ids == [f"m{i}" for i in range(45, 75)]
+    assert [r.params["start"] for r in mock.requests] == ["0", "20", "40", "45", "65"]
+    assert sync.cursors() == {"x": 75}
+
+
+def test_scheduler_delay_follows_comment_rate_and_recency():
+    sync = HeyCafe().conversation.sync_comments(["x"], min_interval=1, max_interval=1000)
+    sync.watchers["x"].polls = 2
+    state = sync.activity["x"]
+    now = time.monotonic()
+
+    # Ten comments in 100 seconds: checked again right away while active...
+    state.checked = now - 100
+    assert sync._next_delay("x", [{}] * 10, 0) == 1
+    assert state.rate == pytest.approx(0.05, rel=1e-2)
+    # ...and after ten quiet seconds, once it has been quiet that long again.
+    state.checked = state.active = time.monotonic() - 10
+    assert sync._next_delay("x", [], 0) == pytest.approx(10, rel=1e-2)
+    # A steady rate caps the delay at the expected gap between comments.
+    state.rate, state.active = 0.01, time.monotonic() - 500
+    state.checked = time.monotonic() - 500
+    assert sync._next_delay("x", [], 0) == pytest.approx(200, rel=1e-2)
+    # Never-active sources back off to max_interval.
+    state.rate, state.active = 0.0, time.monotonic() - 5000
+    assert sync._next_delay("x", [], 0) == 1000
+    # ...unless the last poll stopped at max_pages with more to read.
+    sync.watchers["x"].behind = True
+    assert sync._next_delay("x", [], 0) == 1
+
+
+def test_scheduler_spends_within_request_budget():
+    feeds = {str(i): Feed(1, []) for i in range(8)}
+    client = HeyCafe(transport=comments_transport(feeds))
+    sync = client.conversation.sync_comments(
+        list(feeds), requests_per_minute=300, min_interval=60, max_rounds=2
+    )
+    started = time.monotonic()
+    assert list(sync) == []
+    # 5 requests per second with a burst of 5: the last 3 of 8 wait 0.2 s each.
+    assert time.monotonic() - started >= 0.55
+    assert sync.requests == 8
@@ -0,0 +1,83 @@
+"""Tests for connection-pool configuration and stats."""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from heycafe import AsyncHeyCafeClient, HeyCafeClient, HttpxTransport
+from heycafe.pool import HostPoolStats, httpx_pool_stats
+
+
+def test_default_pool_is_sized_and_configurable():
+    client = HeyCafeClient(pool_maxsize=16, pool_block=True)
+    adapter = client.transport.session.get_adapter("https://endpoint.hey.cafe")
+    assert adapter._pool_maxsize == 16
+    assert adapter._pool_block is True
+    stats = client.pool_stats()
+    assert (stats.maxsize, stats.block, stats.http2, stats.hosts) == (16, True, False, {})
+
+
+def test_blocking_pool_reuses_connections(local_url):
+    client = HeyCafeClient(base_url=local_url, pool_maxsize=4, pool_block=True)
+    assert len(client.map("get_system_hello", [{}] * 20, max_workers=8)) == 20
+    [host] = client.pool_stats().hosts.values()
+    assert host.requests == 20
+    assert host.in_use == 0
+    assert 1 <= host.idle == host.open <= 4
+    client.close()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+def test_http2_without_h2_explains_extra():
+    with pytest.raises(ImportError, match=r"heycafe\[http2\]"):
+        HeyCafeClient(http2=True)
+
+
+def test_async_pool_stats(local_url):
+    async def run():
+        async with AsyncHeyCafeClient(base_url=local_url, max_connections=3) as client:
+            await client.map("get_system_hello", [{}] * 10)
+            return client.pool_stats()
+
+    stats = asyncio.run(run())
+    assert stats.maxsize == 3
+    [host] = stats.hosts.values()
+    assert 1 <= host.open <= 3
+    assert host.http2 == 0
+
+
+def test_httpx_pool_stats_read_the_installed_httpx(local_url):
+    # Fails loudly if an httpx upgrade moves the internals pool_stats() reads.
+    client = HeyCafeClient(base_url=local_url, transport=HttpxTransport())
+    client.get("get_system_hello")
+    hosts = client.pool_stats().hosts
+    client.close()
+    assert list(hosts) == [local_url.split("//", 1)[1]]
+    assert hosts[local_url.split("//", 1)[1]].idle == 1
+
+
+def test_httpx_pool_stats_fall_back_without_the_internals():
+    class Connection:
+        pass
+
+    class Pool:
+        connections = [Connection()]
+
+    class Transport:
+        _pool = Pool()
+
+    class Client:
+        _transport = Transport()
+
+    assert httpx_pool_stats(object(), 5, False).hosts == {}
+    stats = httpx_pool_stats(Client(), 5, False)
+    assert stats.hosts == {"?": HostPoolStats(open=1, in_use=1)}
+
+
+def test_http2_rejects_pool_block_and_keeps_alive_as_configured():
+    with pytest.raises(ValueError, match="pool_block"):
+        HeyCafeClient(http2=True, pool_block=True)
+    transport = HttpxTransport(keepalive_expiry=2.0)
+    assert transport.client._transport._pool._keepalive_expiry == 2.0
+    transport.close()
@@ -0,0 +1,88 @@
+"""Tests for client-side rate limiting and 429 handling."""
+
+import asyncio
+
+import httpx
+import pytest
+import responses
+
+from heycafe import AsyncHeyCafeClient, HeyCafeClient, RateLimiter
+from heycafe.exceptions import RateLimitError
+from heycafe.ratelimit import TokenBucket, endpoint_family, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    for bogus in ("inf", "-inf", "nan", "Infinity"):
+        assert parse_retry_after(bogus) is None
+    assert parse_retry_after("1e308") == 3600.0
+    assert parse_retry_after("90", maximum=60) == 60.0
+    assert parse_retry_after("Fri, 31 Dec 9999 23:59:59 GMT") == 3600.0
+
+
+def test_endpoint_family():
+    assert endpoint_family("get_account_info") == "get_account"
+    assert endpoint_family("get_stats_cafes_members") == "get_stats"
+    assert endpoint_family("post_conversation_create") == "post"
+
+
+def test_token_bucket_paces_after_burst_and_adapts():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    bucket.throttle()
+    assert bucket.rate == 5
+    bucket.recover()
+    assert bucket.rate == 5.5
+
+
+def test_limiter_family_buckets_and_retry_after_pause():
+    limiter = RateLimiter(families={"post": (1, 1)})
+    assert limiter.reserve("post_account_follow") == 0
+    assert limiter.reserve("post_account_follow") > 0
+    assert limiter.reserve("get_account_info") == 0  # no global limit
+    limiter.observe("get_account_info", 429, retry_after=30)
+    assert limiter.reserve("get_account_info") > 29
+    stats = limiter.stats
+    assert (stats.requests, stats.delayed, stats.throttled) == (4, 2, 1)
+
+
+@responses.activate
+def test_429_raises_rate_limit_error_with_retry_after(base_url):
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_system_hello",
+        body="Too Many Requests",
+        status=429,
+        headers={"Retry-After": "12"},
+    )
+    limiter = RateLimiter(rate=100)
+    client = HeyCafeClient(base_url=base_url, rate_limiter=limiter)
+    with pytest.raises(RateLimitError) as exc_info:
+        client.get("get_system_hello")
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 12.0
+    assert limiter.stats.throttled == 1
+    assert limiter.global_bucket.rate == 50
+
+
+def test_async_client_is_paced(base_url):
+    def handler(request):
+        return httpx.Response(200, json={"system_api_error": False, "response_data": "ok"})
+
+    limiter = RateLimiter(rate=1000, burst=1)
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(
+            base_url=base_url, http_client=http, rate_limiter=limiter
+        ) as c:
+            return await c.map("get_system_hello", [None] * 5)
+
+    assert asyncio.run(run()) == ["ok"] * 5
+    assert limiter.stats.requests == 5
+    assert limiter.stats.delayed == 4
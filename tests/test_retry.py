@@ -0,0 +1,163 @@
+"""Tests for the retry policy and circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+
+from heycafe import AsyncHeyCafeClient, CircuitBreaker, HeyCafeClient, RetryPolicy
+from heycafe.exceptions import APIError, CircuitOpenError, RateLimitError
+from heycafe.retry import RetryBudget
+
+OK = {"system_api_error": False, "response_data": {"ok": True}}
+
+
+def fast_policy(**kwargs):
+    kwargs.setdefault("backoff_base", 0.0)
+    return RetryPolicy(**kwargs)
+
+
+def test_backoff_is_bounded_and_429_waits_retry_after():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    for attempt in range(1, 8):
+        assert 0 <= policy.backoff(attempt) <= min(4.0, 2 ** (attempt - 1))
+    delay = policy.next_delay(RateLimitError("slow", status_code=429, retry_after=9), "GET", "x", 1)
+    assert delay == 9
+    capped = RetryPolicy(max_retry_after=5.0)
+    delay = capped.next_delay(
+        RateLimitError("slow", status_code=429, retry_after=1e9), "GET", "x", 1
+    )
+    assert delay == 5.0
+    assert policy.next_delay(APIError("bad", status_code=404), "GET", "x", 1) is None
+    assert policy.next_delay(APIError("bad", status_code=502), "POST", "x", 1) is None
+    assert policy.next_delay(APIError("bad", status_code=502), "GET", "x", 3) is None
+    assert policy.stats.exhausted == 1
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, min_tokens=1, max_tokens=2)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("heycafe.retry.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    for _ in range(2):
+        breaker.before_request("h")
+        breaker.record_failure("h")
+    with pytest.raises(CircuitOpenError) as exc:
+        breaker.before_request("h")
+    assert exc.value.retry_in == 10
+    now[0] += 10
+    breaker.before_request("h")  # probe
+    assert breaker.state("h").state == "half_open"
+    breaker.record_failure("h")
+    assert breaker.state("h").state == "open"
+    now[0] += 10
+    breaker.before_request("h")
+    breaker.record_success("h")
+    assert breaker.state("h").state == "closed"
+    assert breaker.snapshot()["h"].trips == 2
+
+
+@responses.activate
+def test_client_retries_transient_get(base_url):
+    url = f"{base_url}/get_account_info"
+    responses.add(responses.GET, url, status=502)
+    responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+    responses.add(responses.GET, url, json=OK)
+    client = HeyCafeClient(base_url=base_url, retry_policy=fast_policy(max_attempts=3))
+    assert client.get("get_account_info", params={"query": "hey"}) == {"ok": True}
+    assert len(responses.calls) == 3
+    assert client.retry_policy.stats.retries == 2
+
+
+@responses.activate
+def test_client_does_not_retry_post_unless_idempotent(client_with_key, base_url):
+    url = f"{base_url}/post_account_follow"
+    responses.add(responses.POST, url, status=503)
+    responses.add(responses.POST, url, json=OK)
+    client_with_key.retry_policy = fast_policy()
+    with pytest.raises(APIError):
+        client_with_key.post("post_account_follow", data={"query": "x"}, use_api_key=True)
+    assert len(responses.calls) == 1
+
+    responses.replace(responses.POST, url, status=503)
+    responses.add(responses.POST, url, json=OK)
+    client_with_key.retry_policy = fast_policy(idempotent_endpoints=["post_account_follow"])
+    client_with_key.post("post_account_follow", data={"query": "x"}, use_api_key=True)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_open_circuit_fails_fast(base_url):
+    responses.add(responses.GET, f"{base_url}/get_system_hello", status=500)
+    client = HeyCafeClient(
+        base_url=base_url,
+        retry_policy=fast_policy(max_attempts=2),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+    with pytest.raises(APIError):
+        client.get("get_system_hello")
+    with pytest.raises(CircuitOpenError):
+        client.get("get_system_hello")
+    assert len(responses.calls) == 2
+    assert client.circuit_breaker.state("endpoint.hey.cafe").rejected == 1
+
+
+def test_async_client_retries(base_url):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=OK)
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(
+            base_url=base_url, http_client=http, retry_policy=fast_policy()
+        ) as c:
+            return await c.get("get_system_hello")
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_cancelled_probe_reopens_circuit(base_url):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if len(calls) == 2:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=OK)
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(
+            base_url=base_url, http_client=http, circuit_breaker=breaker
+        ) as c:
+            with pytest.raises(httpx.ConnectError):
+                await c.get("get_system_hello")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(c.get("get_system_hello"), 0.05)
+            assert breaker.state(c._host).state == "open"
+            assert breaker.snapshot()[c._host].trips == 1
+            return await c.get("get_system_hello")
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 3
+    assert all(st.state == "closed" for st in breaker.snapshot().values())
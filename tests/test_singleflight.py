@@ -0,0 +1,95 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import responses
+
+from heycafe import AsyncHeyCafeClient, HeyCafeClient
+from heycafe.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_result_and_exception():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    runs = []
+
+    def slow():
+        runs.append(1)
+        started.set()
+        release.wait(2)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(group.do, "k", slow)
+        started.wait(2)
+        followers = [pool.submit(group.do, "k", slow) for _ in range(4)]
+        while group.stats.collapsed < 4:
+            time.sleep(0.005)
+        release.set()
+        assert leader.result() == "value"
+        assert [f.result() for f in followers] == ["value"] * 4
+    assert len(runs) == 1
+    stats = group.stats
+    assert (stats.calls, stats.executions, stats.collapsed, stats.in_flight) == (5, 1, 4, 0)
+
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        group.do("k", boom)
+    assert group.stats.in_flight == 0
+
+
+def test_async_single_flight():
+    group = AsyncSingleFlight()
+    runs = []
+
+    async def fetch():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "v"
+
+    async def run():
+        return await asyncio.gather(*(group.do("k", fetch) for _ in range(10)))
+
+    assert asyncio.run(run()) == ["v"] * 10
+    assert len(runs) == 1
+    assert group.stats.collapsed == 9
+
+
+@responses.activate
+def test_client_coalesces_identical_concurrent_gets(base_url):
+    def callback(request):
+        time.sleep(0.05)
+        return 200, {}, json.dumps({"system_api_error": False, "response_data": {"a": 1}})
+
+    responses.add_callback(responses.GET, f"{base_url}/get_account_info", callback=callback)
+    client = HeyCafeClient(base_url=base_url, coalesce=True)
+    results = client.map("get_account_info", [{"query": "hey"}] * 30, max_workers=30)
+    assert results == [{"a": 1}] * 30
+    assert len(responses.calls) < 30
+    assert client.singleflight.stats.collapsed == 30 - len(responses.calls)
+
+
+def test_async_client_coalesces(base_url):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"system_api_error": False, "response_data": "x"})
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=http, coalesce=True) as c:
+            return await c.map("get_cafe_info", [{"query": "python"}] * 20)
+
+    assert asyncio.run(run()) == ["x"] * 20
+    assert len(calls) == 1
@@ -0,0 +1,125 @@
+"""Tests for the SQLite-backed response cache."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import responses
+
+from heycafe import AsyncHeyCafeClient, HeyCafeClient
+from heycafe.cache import make_key
+from heycafe.sqlite_cache import SQLiteCache
+
+
+def test_entries_survive_new_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    key = make_key("get_cafe_info", {"query": "python"}, "anonymous")
+    SQLiteCache(path).set(key, {"alias": "python", "members": 3})
+    reopened = SQLiteCache(path)
+    assert reopened.get(key) == (True, {"alias": "python", "members": 3})
+    assert reopened.invalidate("get_cafe_info", {"query": "python"}) == 1
+    assert reopened.get(key) == (False, None)
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.db"), max_bytes=600, compress_level=0)
+    keys = [make_key("get_account_info", {"query": str(i)}, "a") for i in range(5)]
+    for key in keys:
+        cache.set(key, "x" * 200)
+    assert len(cache) < 5
+    assert cache.get(keys[-1])[0] is True
+    assert cache.get(keys[0])[0] is False
+    assert cache.stats.evictions >= 1
+
+
+@responses.activate
+def test_stale_entry_is_revalidated_with_etag(tmp_path, base_url, monkeypatch):
+    responses.add(
+        responses.GET,
+        f"{base_url}/get_cafe_info",
+        json={"system_api_error": False, "response_data": {"alias": "python"}},
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(responses.GET, f"{base_url}/get_cafe_info", status=304)
+    client = HeyCafeClient(base_url=base_url, cache=SQLiteCache(str(tmp_path / "c.db")))
+    assert client.get("get_cafe_info", params={"query": "python"}) == {"alias": "python"}
+
+    later = time.time() + 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert client.get("get_cafe_info", params={"query": "python"}) == {"alias": "python"}
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    # Refreshed by the 304: the next call is a plain hit.
+    client.get("get_cafe_info", params={"query": "python"})
+    assert len(responses.calls) == 2
+
+
+def test_usage_row_tracks_size_without_scanning(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.db"), max_bytes=10_000, compress_level=0)
+    keys = [make_key("get_account_info", {"query": str(i)}, "a") for i in range(4)]
+    for key in keys:
+        cache.set(key, "x" * 100)
+    cache.set(keys[0], "x" * 300)  # replacing an entry adjusts the total
+    cache.invalidate("get_account_info", {"query": "1"})
+    conn = cache._conn()
+
+    def actual():
+        return conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    assert cache._usage(conn) == actual() and len(cache) == 3
+    # A database from before the usage table is seeded from its rows when reopened.
+    conn.executescript("DROP TABLE usage;")
+    assert SQLiteCache(cache.path)._usage(conn) == actual()
+    cache.clear()
+    assert cache._usage(conn) == (0, 0)
+
+
+def test_hits_buffer_access_times_until_a_batch_or_eviction(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.db"), max_bytes=650, compress_level=0, touch_batch=3)
+    keys = [make_key("get_account_info", {"query": str(i)}, "a") for i in range(3)]
+    for key in keys:
+        cache.set(key, "x" * 200)
+    conn = cache._conn()
+
+    def accessed():
+        return [row[0] for row in conn.execute("SELECT accessed_at FROM responses ORDER BY key")]
+
+    before = accessed()
+    changes = conn.total_changes
+    assert cache.get(keys[0])[0] and cache.get(keys[0])[0]
+    assert conn.total_changes == changes and accessed() == before
+    # Evicting writes the buffered hit first, so keys[0] counts as recently used.
+    newest = make_key("get_account_info", {"query": "new"}, "a")
+    cache.set(newest, "x" * 200)
+    assert cache.get(keys[0])[0] is True
+    assert cache.get(keys[1])[0] is False
+    # The batch counts distinct entries.
+    cache.get(keys[2])
+    cache.get(keys[0])
+    assert cache._touched
+    cache.get(newest)
+    assert not cache._touched
+
+
+def test_async_client_calls_sqlite_cache_off_the_event_loop(tmp_path, base_url):
+    threads = []
+
+    class Recording(SQLiteCache):
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+    def handler(request):
+        return httpx.Response(200, json={"system_api_error": False, "response_data": {"a": 1}})
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache = Recording(str(tmp_path / "c.db"))
+        async with AsyncHeyCafeClient(base_url=base_url, http_client=http, cache=cache) as c:
+            first = await c.get("get_cafe_info", params={"query": "python"})
+            second = await c.get("get_cafe_info", params={"query": "python"})
+        return first, second, threading.get_ident()
+
+    first, second, loop_thread = asyncio.run(run())
+    assert first == second == {"a": 1}
+    assert threads and loop_thread not in threads
@@ -0,0 +1,87 @@
+"""Tests for the pluggable transports."""
+
+import pytest
+import urllib3
+
+from heycafe import (
+    HeyCafe,
+    HeyCafeClient,
+    HttpxTransport,
+    MockTransport,
+    RetryPolicy,
+    Urllib3Transport,
+)
+from heycafe.exceptions import APIError, RateLimitError
+from heycafe.transport import Transport
+
+
+def envelope(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+def test_mock_transport_serves_queued_responses():
+    mock = MockTransport()
+    mock.add("get_account_info", envelope({"alias": "first"}))
+    mock.add("get_account_info", envelope({"alias": "again"}))
+    hc = HeyCafe(transport=mock)
+    assert hc.account.info("hey") == {"alias": "first"}
+    assert hc.account.info("hey") == {"alias": "again"}
+    assert hc.account.info("hey") == {"alias": "again"}
+    assert [r.endpoint for r in mock.requests] == ["get_account_info"] * 3
+    assert mock.requests[0].params["query"] == "hey"
+    with pytest.raises(LookupError):
+        hc.system.hello()
+
+
+def test_mock_transport_handler_and_errors():
+    def handler(request):
+        if request.endpoint == "get_system_hello":
+            return 429, {"system_api_error": True}
+        return envelope(request.params)
+
+    client = HeyCafeClient(transport=MockTransport(handler))
+    assert client.get("get_cafe_info", params={"query": "python"})["query"] == "python"
+    with pytest.raises(RateLimitError):
+        client.get("get_system_hello")
+
+
+@pytest.mark.parametrize("make", [Urllib3Transport, HttpxTransport])
+def test_network_transports(local_url, make):
+    transport = make()
+    client = HeyCafeClient(base_url=local_url, api_key="k", transport=transport)
+    got = client.get("get_account_info", params={"query": "hey"})
+    assert (got["method"], got["endpoint"]) == ("GET", "get_account_info")
+    assert "query=hey" in got["query"]
+    posted = client.post("post_account_follow", data={"query": "x y"}, use_api_key=True)
+    assert (posted["method"], posted["body"]) == ("POST", "query=x+y")
+    [host] = client.pool_stats().hosts.values()
+    assert host.open == host.idle == 1
+    client.close()
+
+
+def test_urllib3_connection_errors_are_transient():
+    transport = Urllib3Transport()
+    client = HeyCafeClient(
+        base_url="http://127.0.0.1:9",
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.0),
+    )
+    with pytest.raises(urllib3.exceptions.HTTPError):
+        client.get("get_system_hello")
+    assert client.retry_policy.stats.retries == 1
+
+
+def test_transport_response_json_errors_map_to_api_error():
+    mock = MockTransport()
+    mock.add("get_system_hello", b"<html>")
+    with pytest.raises(APIError, match="Invalid JSON"):
+        HeyCafeClient(transport=mock).get("get_system_hello")
+
+
+def test_transport_subclass_must_implement_send_and_upload():
+    class SendOnly(Transport):
+        def send(self, method, url, params, data, headers, timeout):
+            raise AssertionError
+
+    with pytest.raises(TypeError, match="upload"):
+        SendOnly()
@@ -0,0 +1,226 @@
+"""Tests for streamed multipart uploads."""
+
+import asyncio
+import base64
+import io
+import mmap
+import threading
+import tracemalloc
+from email.parser import BytesParser
+
+import httpx
+import pytest
+
+from heycafe import (
+    AsyncHeyCafe,
+    HeyCafe,
+    HeyCafeClient,
+    HttpxTransport,
+    MockTransport,
+    RequestsTransport,
+    Urllib3Transport,
+    encode_content,
+)
+from heycafe.multipart import FieldPart, FilePart, MultipartBody
+
+
+def ok(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+def parse(body, content_type):
+    """Decode a multipart body into {field name: (filename, content type, bytes)}."""
+    message = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(bytes(range(256)) * 1000)
+    return path
+
+
+def test_body_streams_paths_file_objects_and_buffers(photo):
+    data = photo.read_bytes()
+    with open(photo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        handle = io.BytesIO(b"skip" + data)
+        handle.seek(4)
+        files = [
+            ("path", photo),
+            ("handle", FilePart(handle, filename='odd "name".bin')),
+            ("mapped", FilePart(mapped, content_type="image/png")),
+        ]
+        body = MultipartBody({"caption": "hi"}, files, chunk_size=4096)
+        chunks = list(body)
+        # Read twice, e.g. for a resend: the file object is rewound.
+        assert b"".join(body) == b"".join(chunks)
+
+    assert max(len(c) for c in chunks) <= 4096
+    assert len(body) == sum(map(len, chunks))
+    parts = parse(b"".join(chunks), body.content_type)
+    assert parts["caption"] == (None, "text/plain", b"hi")
+    assert parts["path"] == ("photo.png", "image/png", data)
+    assert parts["handle"] == ("odd %22name%22.bin", "application/octet-stream", data)
+    assert parts["mapped"] == ("upload", "image/png", data)
+    with pytest.raises(TypeError):
+        FilePart(42)
+
+
+def test_body_memory_does_not_grow_with_file_size(tmp_path):
+    path = tmp_path / "video.mp4"
+    with open(path, "wb") as f:
+        f.truncate(32 * 1024 * 1024)
+    body = MultipartBody(files={"file": path})
+    tracemalloc.start()
+    sent = sum(len(chunk) for chunk in body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sent == len(body) > 32 * 1024 * 1024
+    assert peak < 1024 * 1024
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 4, 100])
+def test_field_part_encodes_base64_in_chunks(length):
+    text = ("héllo wörld ☕ " * 10)[:length]
+    raw = text.encode()
+    expected = base64.b64encode(raw)
+    sources = [text, raw, mmap.mmap(-1, len(raw)) if raw else b"", io.BytesIO(raw)]
+    if raw:
+        sources[2].write(raw)
+    text_file = io.StringIO("ignored" + text)
+    text_file.seek(7)
+    for source in [*sources, text_file]:
+        part = FieldPart(source, base64=True)
+        chunks = list(part.chunks(chunk_size=8))
+        assert b"".join(chunks) == expected and part.size == len(expected)
+        # Chunk sizes are approximate: characters can take up to 4 bytes.
+        assert max(map(len, chunks), default=0) <= 16
+        assert b"".join(part.chunks()) == expected
+        if hasattr(source, "seek"):
+            source.seek(7 if source is text_file else 0)
+        plain = FieldPart(source)
+        assert b"".join(plain.chunks(chunk_size=5)) == raw and plain.size == len(raw)
+
+
+def test_field_part_memory_does_not_grow_with_text_size():
+    text = "x" * (16 * 1024 * 1024)
+    tracemalloc.start()
+    part = FieldPart(text, base64=True)
+    sent = sum(len(chunk) for chunk in part.chunks())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sent == part.size == len(base64.b64encode(b"x" * len(text)))
+    assert peak < 1024 * 1024
+
+
+def test_conversation_content_is_streamed_only_on_request():
+    mock = MockTransport()
+    mock.add("post_conversation_create", ok({"id": "c1"}))
+    client = HeyCafe(api_key="k", transport=mock)
+    client.conversation.create("python", content_raw="a long post ☕" * 100_000)
+    client.conversation.create("python", content_raw="a longer post ☕", draft=True, stream=True)
+    client.conversation.create(
+        "python", content_raw=io.BytesIO(b"from a file"), content="Zg==", stream=True
+    )
+    with pytest.raises(TypeError, match="stream=True"):
+        client.conversation.create("python", content_raw=b"bytes")
+
+    form, long, from_file = mock.requests
+    assert form.body == b"" and form.data["content"] == encode_content("a long post ☕" * 100_000)
+    parts = parse(long.body, long.headers["Content-Type"])
+    assert long.data == {"cafe": "python", "draft": "true"}
+    assert parts["content_raw"] == (None, "text/plain", "a longer post ☕".encode())
+    assert parts["content"][2] == encode_content("a longer post ☕").encode()
+    parts = parse(from_file.body, from_file.headers["Content-Type"])
+    assert parts["content"][2] == b"Zg==" and parts["content_raw"][2] == b"from a file"
+
+
+def test_temp_upload_sends_the_file_with_progress(photo):
+    mock = MockTransport()
+    mock.add("post_temp_file", ok({"file": "f1"}))
+    progress = []
+    client = HeyCafe(api_key="k", transport=mock)
+    result = client.temp.upload(photo, progress=lambda sent, total: progress.append((sent, total)))
+
+    assert result == {"file": "f1"}
+    [request] = mock.requests
+    assert request.method == "POST" and request.headers["Authorization"] == "Bearer k"
+    assert int(request.headers["Content-Length"]) == len(request.body)
+    parts = parse(request.body, request.headers["Content-Type"])
+    assert parts["file"] == ("photo.png", "image/png", photo.read_bytes())
+    assert progress[-1] == (len(request.body), len(request.body))
+    assert [s for s, _ in progress] == sorted(s for s, _ in progress)
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport, HttpxTransport])
+def test_transports_send_the_body_with_content_length(local_url, tmp_path, transport):
+    path = tmp_path / "notes.txt"
+    path.write_text("line\n" * 50_000)
+    client = HeyCafeClient(base_url=local_url, api_key="k", transport=transport())
+    echoed = client.upload("post_temp_file", {"file": path}, data={"kind": "text"})
+    client.close()
+
+    assert echoed["method"] == "POST" and echoed["endpoint"] == "post_temp_file"
+    boundary = echoed["body"].split("\r\n", 1)[0][2:]
+    parts = parse(echoed["body"].encode(), f"multipart/form-data; boundary={boundary}")
+    assert parts["kind"][2] == b"text"
+    assert parts["file"] == ("notes.txt", "text/plain", path.read_bytes())
+
+
+def test_upload_many_runs_in_parallel_and_keeps_order(tmp_path):
+    paths = []
+    for i in range(5):
+        paths.append(tmp_path / f"{i}.jpg")
+        paths[-1].write_bytes(b"x" * (i + 1) * 1000)
+    # The first three uploads only finish once all three are in flight.
+    together = threading.Barrier(3, timeout=5)
+
+    def handler(request):
+        filename = parse(request.body, request.headers["Content-Type"])["file"][0]
+        if filename in ("0.jpg", "1.jpg", "2.jpg"):
+            together.wait()
+        if filename == "3.jpg":
+            return 500, {"system_api_error": True, "system_api_error_message": "too big"}
+        return ok({"file": filename})
+
+    client = HeyCafe(api_key="k", transport=MockTransport(handler))
+    done = {}
+    results = client.temp.upload_many(
+        paths, max_workers=3, progress=lambda i, sent, total: done.update({i: sent == total})
+    )
+    assert isinstance(results.pop(3), Exception)
+    assert [r["file"] for r in results] == ["0.jpg", "1.jpg", "2.jpg", "4.jpg"]
+    assert done == {i: True for i in range(5)}
+    assert client.temp.upload_many([]) == []
+
+
+def test_async_upload(base_url, photo):
+    seen = []
+
+    def handler(request):
+        assert "Transfer-Encoding" not in request.headers
+        seen.append((request.headers["Content-Length"], request.content))
+        filename = parse(request.content, request.headers["Content-Type"])["file"][0]
+        return httpx.Response(200, json=ok({"file": filename}))
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            one = await client.temp.upload(io.BytesIO(b"abc"), filename="a.txt")
+            many = await client.temp.upload_many([photo, b"raw"], max_workers=2)
+            return one, many
+
+    one, many = asyncio.run(run())
+    assert one == {"file": "a.txt"}
+    assert many == [{"file": "photo.png"}, {"file": "upload"}]
+    assert all(int(length) == len(content) for length, content in seen)
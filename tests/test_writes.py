@@ -0,0 +1,143 @@
+"""Tests for the bulk write pipeline."""
+
+import asyncio
+import threading
+
+import httpx
+
+from heycafe import AsyncHeyCafe, HeyCafe, MockTransport, RetryPolicy
+from heycafe.exceptions import APIError
+from heycafe.writes import IDEMPOTENCY_HEADER, Write, WritePipeline, pipeline
+
+
+def ok(data):
+    return {"system_api_error": False, "response_data": data}
+
+
+class Server:
+    """Mock write endpoints that count posts per idempotency token."""
+
+    def __init__(self, fail=None):
+        self.fail = dict(fail or {})
+        self.posts = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.posts.append((request.endpoint, request.data, request.headers))
+            token = request.headers.get(IDEMPOTENCY_HEADER)
+            if self.fail.get(token):
+                return self.fail[token].pop(0)
+        if request.endpoint == "post_conversation_create":
+            return ok({"conversation": {"id": f"conv-{len(self.posts)}"}})
+        return ok({"done": request.data.get("query")})
+
+
+def test_published_conversations_take_one_request_each():
+    server = Server()
+    client = HeyCafe(api_key="k", transport=MockTransport(server))
+    writes = [Write.conversation("python", content_raw=f"post {i}") for i in range(20)]
+    writes.append(Write.chat_message("chat-1", content="hi"))
+    pipe = WritePipeline(client, max_workers=4)
+    results = list(pipe.run(iter(writes)))
+
+    assert sorted(r.index for r in results) == list(range(21))
+    assert all(r.ok and r.requests == 1 for r in results)
+    assert len(server.posts) == 21
+    assert all("draft" not in data for endpoint, data, _ in server.posts[:-1] if "conv" in endpoint)
+    tokens = {headers[IDEMPOTENCY_HEADER] for _, _, headers in server.posts}
+    assert tokens == {w.token for w in writes}
+    stats = pipe.stats()
+    assert (stats.submitted, stats.succeeded, stats.requests) == (21, 21, 21)
+    assert stats.per_second > 0
+
+
+def test_staged_conversation_is_drafted_then_published_and_resumes_from_the_ledger():
+    write = Write.conversation("python", content_raw="hello", stage=True)
+    server = Server(fail={f"{write.token}:publish": [(500, {"system_api_error": True})]})
+    pipe = WritePipeline(HeyCafe(api_key="k", transport=MockTransport(server)))
+
+    [failed] = pipe.run([write])
+    assert not failed.ok and isinstance(failed.error, APIError)
+    assert [(e, d.get("draft")) for e, d, _ in server.posts] == [
+        ("post_conversation_create", "true"),
+        ("post_conversation_publish", None),
+    ]
+    # The rerun publishes the recorded draft instead of creating another one.
+    [done] = pipe.run([write])
+    assert done.ok and done.response == {"done": "conv-1"}
+    assert [e for e, _, _ in server.posts][2:] == ["post_conversation_publish"]
+    [again] = pipe.run([write])
+    assert again.skipped and again.ok and len(server.posts) == 3
+
+
+def test_refused_writes_are_retried_and_ambiguous_failures_are_not():
+    retried, ambiguous = Write.chat_message("c", content="a"), Write.chat_message("c", content="b")
+    server = Server(
+        fail={
+            retried.token: [(429, {}), (503, {})],
+            ambiguous.token: [(502, {"system_api_error": True})],
+        }
+    )
+    pipe = WritePipeline(
+        HeyCafe(api_key="k", transport=MockTransport(server)),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.01),
+    )
+    results = {r.write.token: r for r in pipe.run([retried, ambiguous])}
+    assert results[retried.token].ok and results[retried.token].requests == 3
+    assert not results[ambiguous.token].ok and results[ambiguous.token].requests == 1
+    stats = pipe.stats()
+    assert (stats.succeeded, stats.failed, stats.requests) == (1, 1, 4)
+
+
+def test_duplicate_tokens_are_sent_once():
+    server = Server()
+    pipe = WritePipeline(HeyCafe(api_key="k", transport=MockTransport(server)), max_workers=1)
+    write = Write.chat_message("c", content="once", token="fixed")
+    results = list(pipe.run([write, Write.chat_message("c", content="once", token="fixed")]))
+    assert [r.skipped for r in sorted(results, key=lambda r: r.index)] == [False, True]
+    assert len(server.posts) == 1 and pipe.ledger["fixed"] == {"done": "c"}
+
+
+def test_async_pipeline(base_url):
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.headers[IDEMPOTENCY_HEADER])
+        if request.url.path.endswith("post_conversation_create"):
+            return httpx.Response(200, json=ok({"id": "d1"}))
+        return httpx.Response(200, json=ok({"published": True}))
+
+    async def writes():
+        yield Write.conversation("python", content_raw="staged", stage=True, token="t1")
+        yield Write.publish_draft("d0", token="t2")
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            pipe = pipeline(client, max_workers=2)
+            return [r async for r in pipe.run(writes())], pipe.stats()
+
+    results, stats = asyncio.run(run())
+    assert all(r.ok for r in results) and stats.requests == 3
+    assert sorted(tokens) == ["t1", "t1:publish", "t2"]
+
+
+def test_async_pipeline_finishes_started_writes_when_stopped_early(base_url):
+    async def handler(request):
+        await asyncio.sleep(0.01 * int(request.headers[IDEMPOTENCY_HEADER][1:]))
+        return httpx.Response(200, json=ok({"done": True}))
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeyCafe(base_url=base_url, api_key="k", http_client=http) as client:
+            pipe = pipeline(client, max_workers=3)
+            writes = [Write.chat_message("chat-1", content="hi", token=f"t{i}") for i in range(3)]
+            stream = pipe.run(writes)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first, dict(pipe.ledger), pipe.stats()
+
+    first, ledger, stats = asyncio.run(run())
+    assert first.write.token == "t0"
+    assert sorted(ledger) == ["t0", "t1", "t2"] and stats.succeeded == 3